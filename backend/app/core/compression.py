@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import zlib
+from typing import Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli가 없으면 gzip만 협상합니다.
+    brotli = None
+
+COMPRESSIBLE_MEDIA_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+
+class _Encoder(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class _GzipEncoder:
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliEncoder:
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def available_encodings() -> tuple[str, ...]:
+    """선호 순서대로 지원하는 Content-Encoding."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def select_content_encoding(accept_encoding: str) -> str | None:
+    """Accept-Encoding(q 값 포함)에서 쓸 인코딩을 고릅니다. q가 같으면 br을 우선합니다."""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        weights[token] = quality
+
+    best: str | None = None
+    best_quality = 0.0
+    for encoding in available_encodings():
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """압축 본문용 강한 ETag. 원본 ETag와 구분되도록 인코딩 이름을 덧붙입니다(`"abc"` → `"abc-gzip"`)."""
+    if etag.startswith('"') and etag.endswith('"'):
+        return f'{etag[:-1]}-{encoding}"'
+    return etag
+
+
+def strip_encoded_etag(etag: str) -> str:
+    """encoded_etag로 덧붙인 인코딩 이름을 떼어 원본 ETag로 되돌립니다."""
+    for encoding in ("br", "gzip"):
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return etag[: -len(suffix)] + '"'
+    return etag
+
+
+def _is_compressible_media_type(headers: MutableHeaders) -> bool:
+    """Content-Type이 없으면(304 등) 압축 가능한 것으로 봅니다."""
+    media_type = headers.get("content-type")
+    return media_type is None or media_type.startswith(COMPRESSIBLE_MEDIA_TYPES)
+
+
+class CompressionMiddleware:
+    """Accept-Encoding에 따라 JSON/NDJSON 응답을 brotli 또는 gzip으로 압축합니다.
+
+    - minimum_size보다 작은 단일 본문(ETag가 있는 응답은 제외), 이미 Content-Encoding이 있는 응답, 본문 없는 상태(204/304)는 그대로 보냅니다.
+    - 스트리밍 응답은 조각마다 flush해 클라이언트가 줄 단위로 바로 받을 수 있게 합니다.
+    - ETag는 인코딩별로 달라지도록 인코딩 이름을 덧붙입니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = 1000,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_content_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def build_encoder(self, encoding: str) -> _Encoder:
+        if encoding == "br":
+            return _BrotliEncoder(self.brotli_quality)
+        return _GzipEncoder(self.gzip_level)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self._middleware = middleware
+        self._encoding = encoding
+        self._send = send
+        self._initial_message: Message | None = None
+        self._encoder: _Encoder | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # 첫 본문을 보기 전까지는 압축 여부를 정할 수 없으므로 헤더 전송을 미룹니다.
+            self._initial_message = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._initial_message is not None:
+            initial_message, self._initial_message = self._initial_message, None
+            headers = MutableHeaders(raw=initial_message["headers"])
+            if initial_message["status"] == 304 and "etag" in headers and _is_compressible_media_type(headers):
+                # ETag가 있는 압축 가능 응답의 200은 크기와 무관하게 항상 압축되므로,
+                # 304에도 그 200이 가졌을 ETag(압축본 기준)를 돌려줍니다. 304는 보통 Content-Type이 없습니다.
+                headers["ETag"] = encoded_etag(headers["etag"], self._encoding)
+            if not self._should_compress(initial_message["status"], headers, body, more_body):
+                self._passthrough = True
+                await self._send(initial_message)
+                await self._send(message)
+                return
+
+            self._encoder = self._middleware.build_encoder(self._encoding)
+            headers["Content-Encoding"] = self._encoding
+            if "etag" in headers:
+                headers["ETag"] = encoded_etag(headers["etag"], self._encoding)
+            compressed = self._compress(self._encoder, body, more_body)
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(compressed))
+            await self._send(initial_message)
+            await self._send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+            return
+
+        if self._passthrough or self._encoder is None:
+            await self._send(message)
+            return
+        compressed = self._compress(self._encoder, body, more_body)
+        await self._send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+
+    def _should_compress(self, status: int, headers: MutableHeaders, body: bytes, more_body: bool) -> bool:
+        if status in (204, 304) or "content-encoding" in headers:
+            return False
+        if "content-type" not in headers or not _is_compressible_media_type(headers):
+            return False
+        # 작은 응답도 크기에 따라 압축 여부가 달라지므로 캐시가 구분할 수 있게 Vary는 항상 붙입니다.
+        headers.add_vary_header("Accept-Encoding")
+        # ETag가 있으면 304에서도 같은 판단을 할 수 있도록 크기를 보지 않고 압축합니다(본문 없는 304는 크기를 모름).
+        return more_body or "etag" in headers or len(body) >= self._middleware.minimum_size
+
+    @staticmethod
+    def _compress(encoder: _Encoder, body: bytes, more_body: bool) -> bytes:
+        compressed = encoder.compress(body)
+        return compressed + (encoder.flush() if more_body else encoder.finish())
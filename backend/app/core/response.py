@@ -1,8 +1,38 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from datetime import datetime, timezone
+from typing import Any
 from uuid import uuid4
 
+from fastapi.responses import JSONResponse, Response
+
+from .compression import strip_encoded_etag
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 인코더로 같은 본문을 만듭니다.
+    orjson = None
+
+
+def dumps_json(content: Any) -> bytes:
+    """응답 본문용 JSON 바이트. orjson이 있으면 orjson으로, 없으면 JSONResponse와 같은 설정의 json으로 인코딩합니다."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """이미 직렬화 가능한 dict/list를 그대로 인코딩하는 응답.
+
+    라우터가 이 응답을 직접 돌려주면 FastAPI의 response_model 재검증/jsonable_encoder 단계를 건너뜁니다.
+    (response_model은 OpenAPI 문서용으로 그대로 둡니다.)
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
 
 def build_meta(request_id: str | None = None) -> dict[str, str]:
     resolved_request_id = request_id or f"req_{uuid4().hex[:12]}"
@@ -30,3 +60,40 @@ def error_response(code: str, message: str, request_id: str | None = None) -> di
         },
         "meta": build_meta(request_id=request_id),
     }
+
+
+def compute_etag(data: Any) -> str:
+    """응답 data의 강한 ETag. meta(requestId/timestamp)는 빼고 계산하므로 같은 결과면 같은 값입니다."""
+    return _etag_from_bytes(dumps_json(data))
+
+
+def _etag_from_bytes(encoded_data: bytes) -> str:
+    return f'"{hashlib.blake2b(encoded_data, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match(약한 비교)에 etag가 있는지 확인합니다. 압축본용 ETag도 원본과 같은 것으로 봅니다."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if strip_encoded_etag(candidate.removeprefix("W/")) == etag:
+            return True
+    return False
+
+
+def conditional_success_response(data: dict, request_id: str | None, if_none_match: str | None) -> Response:
+    """ETag를 붙인 성공 응답. If-None-Match가 같으면 본문 없이 304를 돌려줍니다.
+
+    data는 한 번만 인코딩해 ETag 계산과 본문에 함께 씁니다. 본문은 success_response와 같은 모양입니다.
+    """
+    encoded_data = dumps_json(data)
+    etag = _etag_from_bytes(encoded_data)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    body = b'{"success":true,"data":' + encoded_data + b',"meta":' + dumps_json(build_meta(request_id=request_id)) + b"}"
+    return Response(status_code=200, content=body, media_type="application/json", headers=headers)
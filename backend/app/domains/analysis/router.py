@@ -3,9 +3,8 @@ from __future__ import annotations
 from uuid import uuid4
 
 from fastapi import APIRouter, Path
-from fastapi.responses import JSONResponse
 
-from ...core.response import error_response, success_response
+from ...core.response import FastJSONResponse, error_response, success_response
 from .client import ExternalAnalysisClient
 from .repository import (
     DEFAULT_ANALYSIS_VERSION,
@@ -46,7 +45,7 @@ def create_analysis_job(payload: AnalysisJobCreateRequest):
             video_id=video_id,
             error_code="COMMON_INVALID_REQUEST",
         )
-        return JSONResponse(status_code=400, content=body)
+        return FastJSONResponse(status_code=400, content=body)
 
     cache_key = repository.build_cache_key(video_id=video_id, analysis_version=DEFAULT_ANALYSIS_VERSION)
 
@@ -69,10 +68,11 @@ def create_analysis_job(payload: AnalysisJobCreateRequest):
                 analysis_version=DEFAULT_ANALYSIS_VERSION,
                 cache_hit=True,
             )
-            return success_response(
-                data=cached_status.model_dump(by_alias=True, exclude_none=True),
+            body = success_response(
+                data=cached_status.model_dump(mode="json", by_alias=True),
                 request_id=request_id,
             )
+            return FastJSONResponse(status_code=200, content=body)
 
         inflight_job_id = repository.get_inflight_job_id(cache_key=cache_key)
         if inflight_job_id is not None:
@@ -89,10 +89,11 @@ def create_analysis_job(payload: AnalysisJobCreateRequest):
                     analysis_version=DEFAULT_ANALYSIS_VERSION,
                     cache_hit=False,
                 )
-                return success_response(
-                    data=inflight_status.model_dump(by_alias=True, exclude_none=True),
+                body = success_response(
+                    data=inflight_status.model_dump(mode="json", by_alias=True),
                     request_id=request_id,
                 )
+                return FastJSONResponse(status_code=200, content=body)
 
     job_id = repository.create_job_id(video_id=video_id)
 
@@ -110,10 +111,11 @@ def create_analysis_job(payload: AnalysisJobCreateRequest):
                     analysis_version=DEFAULT_ANALYSIS_VERSION,
                     cache_hit=False,
                 )
-                return success_response(
-                    data=reused.model_dump(by_alias=True, exclude_none=True),
+                body = success_response(
+                    data=reused.model_dump(mode="json", by_alias=True),
                     request_id=request_id,
                 )
+                return FastJSONResponse(status_code=200, content=body)
 
     repository.upsert_job_status(queued_status)
 
@@ -176,7 +178,7 @@ def create_analysis_job(payload: AnalysisJobCreateRequest):
             retry_after=processing_error.retry_after_seconds,
         )
 
-        return JSONResponse(status_code=503, content=body, headers=headers)
+        return FastJSONResponse(status_code=503, content=body, headers=headers)
 
     repository.upsert_job_status(completed_or_failed_status)
 
@@ -197,10 +199,11 @@ def create_analysis_job(payload: AnalysisJobCreateRequest):
         cache_hit=False,
     )
 
-    return success_response(
-        data=completed_or_failed_status.model_dump(by_alias=True, exclude_none=True),
+    body = success_response(
+        data=completed_or_failed_status.model_dump(mode="json", by_alias=True),
         request_id=request_id,
     )
+    return FastJSONResponse(status_code=200, content=body)
 
 
 @router.get(
@@ -223,7 +226,7 @@ def get_analysis_job_status(job_id: str = Path(..., min_length=1)):
             job_id=job_id,
             error_code="ANALYSIS_JOB_NOT_FOUND",
         )
-        return JSONResponse(status_code=404, content=body)
+        return FastJSONResponse(status_code=404, content=body)
 
     log_analysis_event(
         event="analysis_status_fetched",
@@ -231,4 +234,5 @@ def get_analysis_job_status(job_id: str = Path(..., min_length=1)):
         job_id=job_id,
         cache_hit=current.result.meta.cache_hit if current.result is not None else None,
     )
-    return success_response(data=current.model_dump(by_alias=True, exclude_none=True), request_id=request_id)
+    body = success_response(data=current.model_dump(mode="json", by_alias=True), request_id=request_id)
+    return FastJSONResponse(status_code=200, content=body)
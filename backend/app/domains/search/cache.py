@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from threading import Lock
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def read_cache_settings(prefix: str, *, default_ttl_seconds: float, default_max_entries: int) -> tuple[float, int]:
+    """`{prefix}_TTL_SECONDS`, `{prefix}_MAX_ENTRIES` 환경변수를 읽습니다."""
+    try:
+        ttl_seconds = float(os.getenv(f"{prefix}_TTL_SECONDS", str(default_ttl_seconds)))
+    except ValueError:
+        ttl_seconds = default_ttl_seconds
+    try:
+        max_entries = int(os.getenv(f"{prefix}_MAX_ENTRIES", str(default_max_entries)))
+    except ValueError:
+        max_entries = default_max_entries
+    return ttl_seconds, max_entries
+
+
+class TtlLruCache(Generic[K, V]):
+    """프로세스 내 공유용 TTL + LRU 캐시.
+
+    - 만료된 항목은 조회 시점에 제거합니다.
+    - max_entries를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    - ttl_seconds <= 0 또는 max_entries <= 0이면 캐시를 사용하지 않습니다.
+    - stale_seconds > 0이면 만료 후 그 시간 동안 get_stale로만 꺼낼 수 있게 남겨 둡니다(장애 시 대체 응답용).
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_entries: int,
+        stale_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._stale_seconds = max(0.0, stale_seconds)
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl_seconds > 0 and self._max_entries > 0
+
+    def get(self, key: K) -> V | None:
+        if not self.enabled:
+            return None
+
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if now >= expires_at:
+                if now >= expires_at + self._stale_seconds:
+                    self._entries.pop(key, None)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def get_stale(self, key: K) -> V | None:
+        """만료됐더라도 stale_seconds 안이면 값을 돌려줍니다."""
+        if not self.enabled:
+            return None
+
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if now >= expires_at + self._stale_seconds:
+                self._entries.pop(key, None)
+                return None
+            return value
+
+    def get_many(self, keys: Iterable[K]) -> dict[K, V]:
+        found: dict[K, V] = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def set(self, key: K, value: V, ttl_seconds: float | None = None) -> None:
+        if not self.enabled:
+            return
+
+        expires_at = self._clock() + (self._ttl_seconds if ttl_seconds is None else ttl_seconds)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def set_many(self, values: dict[K, V]) -> None:
+        for key, value in values.items():
+            self.set(key, value)
+
+    def pop(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -1,21 +1,84 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import os
 import re
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
 
-from .schemas import SearchPeriodOption, SearchSortOption
+import httpx
+
+from .cache import TtlLruCache, read_cache_settings
+from .quota import ApiKeyScheduler, shared_key_scheduler
+from .resilience import CircuitBreaker, RetryPolicy, build_circuit_breaker_from_env
+from .schemas import SearchDurationBucket, SearchPeriodOption, SearchSortOption
+from .transport import (
+    get_shared_async_http_client,
+    get_shared_http_client,
+    get_transport_settings,
+    is_blocking_transport,
+    run_with_blocking_transport,
+)
 
 YOUTUBE_SEARCH_URL = "https://www.googleapis.com/youtube/v3/search"
 YOUTUBE_VIDEOS_URL = "https://www.googleapis.com/youtube/v3/videos"
 YOUTUBE_CHANNELS_URL = "https://www.googleapis.com/youtube/v3/channels"
 
+# YouTube Data API는 search 페이지 크기와 videos/channels id 개수를 모두 50개로 제한합니다.
+YOUTUBE_PAGE_SIZE_LIMIT = 50
+YOUTUBE_ID_BATCH_SIZE = 50
+DEFAULT_SEARCH_MAX_PAGES = 10
+
+# 엔드포인트별 할당량 단가 (https://developers.google.com/youtube/v3/determine_quota_cost)
+YOUTUBE_QUOTA_COST_BY_URL = {
+    YOUTUBE_SEARCH_URL: 100,
+    YOUTUBE_VIDEOS_URL: 1,
+    YOUTUBE_CHANNELS_URL: 1,
+}
+
+# 응답에서 실제로 읽는 필드만 요청합니다(fields 파라미터). _to_video_rows가 읽는 필드를 바꾸면 함께 고쳐야 합니다.
+YOUTUBE_SEARCH_FIELDS = "nextPageToken,items(id/videoId,snippet/channelId)"
+YOUTUBE_VIDEO_FIELDS = (
+    "items(id,"
+    "snippet(publishedAt,channelId,title,channelTitle,"
+    "thumbnails(maxres/url,standard/url,high/url,medium/url,default/url)),"
+    "contentDetails/duration,"
+    "statistics(viewCount,likeCount,commentCount))"
+)
+YOUTUBE_VIDEO_STATISTICS_FIELDS = "items(id,statistics(viewCount,likeCount,commentCount))"
+YOUTUBE_CHANNEL_FIELDS = (
+    "items(id,snippet(publishedAt,country),statistics(viewCount,subscriberCount,hiddenSubscriberCount,videoCount))"
+)
+
+# country 필터에 맞춰 검색 관련도 언어를 지정합니다. 목록에 없는 국가는 regionCode만 보냅니다.
+COUNTRY_RELEVANCE_LANGUAGES = {
+    "KR": "ko",
+    "JP": "ja",
+    "US": "en",
+    "GB": "en",
+    "CA": "en",
+    "AU": "en",
+    "TW": "zh-Hant",
+    "CN": "zh-Hans",
+    "VN": "vi",
+    "TH": "th",
+    "ID": "id",
+    "DE": "de",
+    "FR": "fr",
+    "ES": "es",
+    "BR": "pt",
+}
+
+DEFAULT_CHANNEL_CACHE_TTL_SECONDS = 3600
+DEFAULT_CHANNEL_CACHE_MAX_ENTRIES = 5000
+DEFAULT_VIDEO_STATIC_CACHE_TTL_SECONDS = 86400
+DEFAULT_VIDEO_STATISTICS_CACHE_TTL_SECONDS = 600
+DEFAULT_VIDEO_CACHE_MAX_ENTRIES = 20000
+
 
 @dataclass(frozen=True)
 class SearchQuotaExceededError(Exception):
@@ -30,6 +93,8 @@ class SearchRateLimitedError(Exception):
 @dataclass(frozen=True)
 class SearchUpstreamUnavailableError(Exception):
     message: str = "youtube upstream unavailable"
+    # 5xx/timeout/네트워크 오류처럼 잠시 후 같은 요청이 성공할 수 있는 경우에만 True
+    retryable: bool = False
 
 
 @dataclass(frozen=True)
@@ -57,11 +122,81 @@ class YoutubeVideoRaw:
     channel_view_count: int
 
 
+_channel_cache_ttl_seconds, _channel_cache_max_entries = read_cache_settings(
+    "YOUTUBE_CHANNEL_CACHE",
+    default_ttl_seconds=DEFAULT_CHANNEL_CACHE_TTL_SECONDS,
+    default_max_entries=DEFAULT_CHANNEL_CACHE_MAX_ENTRIES,
+)
+# 구독자 수/개설일/국가/영상 수는 한 시간 안에 거의 변하지 않으므로 채널 id 단위로 공유합니다.
+shared_channel_cache: TtlLruCache[str, dict[str, Any]] = TtlLruCache(
+    ttl_seconds=_channel_cache_ttl_seconds,
+    max_entries=_channel_cache_max_entries,
+)
+
+_video_static_ttl_seconds, _video_static_max_entries = read_cache_settings(
+    "YOUTUBE_VIDEO_STATIC_CACHE",
+    default_ttl_seconds=DEFAULT_VIDEO_STATIC_CACHE_TTL_SECONDS,
+    default_max_entries=DEFAULT_VIDEO_CACHE_MAX_ENTRIES,
+)
+# 제목/길이/게시일/썸네일(snippet, contentDetails)은 거의 바뀌지 않으므로 길게 보관합니다.
+shared_video_static_cache: TtlLruCache[str, dict[str, Any]] = TtlLruCache(
+    ttl_seconds=_video_static_ttl_seconds,
+    max_entries=_video_static_max_entries,
+)
+_video_statistics_ttl_seconds, _video_statistics_max_entries = read_cache_settings(
+    "YOUTUBE_VIDEO_STATISTICS_CACHE",
+    default_ttl_seconds=DEFAULT_VIDEO_STATISTICS_CACHE_TTL_SECONDS,
+    default_max_entries=DEFAULT_VIDEO_CACHE_MAX_ENTRIES,
+)
+# 조회수/좋아요/댓글 수(statistics)는 자주 바뀌므로 짧게 보관합니다.
+shared_video_statistics_cache: TtlLruCache[str, dict[str, Any]] = TtlLruCache(
+    ttl_seconds=_video_statistics_ttl_seconds,
+    max_entries=_video_statistics_max_entries,
+)
+
+
+# 엔드포인트 하나가 장애여도 다른 엔드포인트 호출은 막지 않도록 search/videos/channels별로 둡니다.
+shared_circuit_breakers: dict[str, CircuitBreaker] = {
+    url: build_circuit_breaker_from_env() for url in (YOUTUBE_SEARCH_URL, YOUTUBE_VIDEOS_URL, YOUTUBE_CHANNELS_URL)
+}
+
+
+@dataclass(frozen=True)
+class UpstreamQueryKey:
+    """YouTube 호출 결과를 바꾸는 입력만 담은 키. 나머지 필터/정렬은 서비스에서 적용합니다."""
+
+    query: str
+    channel: str
+    youtube_order: str
+    period: SearchPeriodOption
+    result_limit: int
+    video_duration: str | None = None
+    region_code: str = ""
+
+
 class YouTubeSearchClient:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        channel_cache: TtlLruCache[str, dict[str, Any]] | None = None,
+        video_static_cache: TtlLruCache[str, dict[str, Any]] | None = None,
+        video_statistics_cache: TtlLruCache[str, dict[str, Any]] | None = None,
+        key_scheduler: ApiKeyScheduler | None = None,
+        circuit_breakers: dict[str, CircuitBreaker] | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ) -> None:
+        self._circuit_breakers = circuit_breakers if circuit_breakers is not None else shared_circuit_breakers
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy.from_env()
+        self._key_scheduler = key_scheduler if key_scheduler is not None else shared_key_scheduler
+        self._channel_cache = channel_cache if channel_cache is not None else shared_channel_cache
+        self._video_static_cache = video_static_cache if video_static_cache is not None else shared_video_static_cache
+        self._video_statistics_cache = (
+            video_statistics_cache if video_statistics_cache is not None else shared_video_statistics_cache
+        )
         self._api_key = os.getenv("YOUTUBE_API_KEY", "").strip()
         self._timeout_seconds = float(os.getenv("YOUTUBE_API_TIMEOUT_SECONDS", "10"))
         self._max_results = int(os.getenv("YOUTUBE_SEARCH_MAX_RESULTS", "50"))
+        self._max_pages = int(os.getenv("YOUTUBE_SEARCH_MAX_PAGES", str(DEFAULT_SEARCH_MAX_PAGES)))
 
     @property
     def is_configured(self) -> bool:
@@ -83,6 +218,11 @@ class YouTubeSearchClient:
 
         return deduped
 
+    def build_api_key_fingerprint(self, user_api_keys: list[str] | None) -> str:
+        """호출에 쓰일 키 집합을 구분하는 짧은 지문. 키 원문 대신 해시를 single-flight 키 등에 씁니다."""
+        resolved_keys = sorted(self._resolve_api_keys(user_api_keys))
+        return hashlib.blake2b("\n".join(resolved_keys).encode("utf-8"), digest_size=8).hexdigest()
+
     def fetch_videos(
         self,
         *,
@@ -92,7 +232,66 @@ class YouTubeSearchClient:
         period: SearchPeriodOption,
         result_limit: int,
         api_keys: list[str] | None = None,
+        duration_bucket: SearchDurationBucket = SearchDurationBucket.ALL,
+        country: str = "",
     ) -> list[YoutubeVideoRaw]:
+        """동기 호출용 얇은 래퍼입니다. 실제 조회 흐름은 fetch_videos_async에 있습니다."""
+        return run_with_blocking_transport(
+            self.fetch_videos_async(
+                keyword=keyword,
+                channel=channel,
+                sort=sort,
+                period=period,
+                result_limit=result_limit,
+                api_keys=api_keys,
+                duration_bucket=duration_bucket,
+                country=country,
+            )
+        )
+
+    async def fetch_videos_async(
+        self,
+        *,
+        keyword: str,
+        channel: str,
+        sort: SearchSortOption,
+        period: SearchPeriodOption,
+        result_limit: int,
+        api_keys: list[str] | None = None,
+        duration_bucket: SearchDurationBucket = SearchDurationBucket.ALL,
+        country: str = "",
+    ) -> list[YoutubeVideoRaw]:
+        rows: list[YoutubeVideoRaw] = []
+        async for page_rows in self.iter_video_pages_async(
+            keyword=keyword,
+            channel=channel,
+            sort=sort,
+            period=period,
+            result_limit=result_limit,
+            api_keys=api_keys,
+            duration_bucket=duration_bucket,
+            country=country,
+        ):
+            rows.extend(page_rows)
+        return rows
+
+    async def iter_video_pages_async(
+        self,
+        *,
+        keyword: str,
+        channel: str,
+        sort: SearchSortOption,
+        period: SearchPeriodOption,
+        result_limit: int,
+        api_keys: list[str] | None = None,
+        duration_bucket: SearchDurationBucket = SearchDurationBucket.ALL,
+        country: str = "",
+    ) -> AsyncIterator[list[YoutubeVideoRaw]]:
+        """search 페이지마다 videos/channels 조회까지 마친 원본 행을 페이지 순서대로 돌려줍니다.
+
+        search 응답 snippet에 channelId가 있으므로 페이지가 도착하는 즉시 videos/channels 조회를 시작하고,
+        그동안 다음 search 페이지를 받아 옵니다. search 호출 오류는 이미 받은 페이지를 모두 돌려준 뒤에 올라갑니다.
+        """
         resolved_api_keys = self._resolve_api_keys(api_keys)
 
         if len(resolved_api_keys) == 0:
@@ -102,60 +301,350 @@ class YouTubeSearchClient:
         normalized_channel = channel.strip()
         effective_query = normalized_keyword if normalized_keyword != "" else normalized_channel
 
-        search_response = self._call_youtube_api_with_fallback(
-            YOUTUBE_SEARCH_URL,
-            self._build_search_params(
+        pending_pages: asyncio.Queue[
+            tuple[list[str], asyncio.Task[tuple[list[dict[str, Any]], dict[str, dict[str, Any]]]]] | None
+        ] = asyncio.Queue()
+        detail_tasks: list[asyncio.Task[tuple[list[dict[str, Any]], dict[str, dict[str, Any]]]]] = []
+        requested_channel_ids: set[str] = set()
+
+        async def _request_page_details() -> None:
+            try:
+                async for page_hits in self._iter_search_pages(
+                    keyword=effective_query,
+                    sort=sort,
+                    period=period,
+                    result_limit=result_limit,
+                    api_keys=resolved_api_keys,
+                    duration_bucket=duration_bucket,
+                    country=country,
+                ):
+                    page_video_ids = [video_id for video_id, _ in page_hits]
+                    page_channel_ids: list[str] = []
+                    for _, channel_id in page_hits:
+                        if channel_id == "" or channel_id in requested_channel_ids:
+                            continue
+                        requested_channel_ids.add(channel_id)
+                        page_channel_ids.append(channel_id)
+
+                    detail_task = asyncio.create_task(
+                        self._fetch_page_details(page_video_ids, page_channel_ids, resolved_api_keys)
+                    )
+                    detail_tasks.append(detail_task)
+                    pending_pages.put_nowait((page_channel_ids, detail_task))
+            finally:
+                pending_pages.put_nowait(None)
+
+        search_task = asyncio.create_task(_request_page_details())
+        channel_map: dict[str, dict[str, Any]] = {}
+        looked_up_channel_ids: set[str] = set()
+
+        try:
+            while (pending_page := await pending_pages.get()) is not None:
+                page_channel_ids, detail_task = pending_page
+                video_items, page_channel_map = await detail_task
+                channel_map.update(page_channel_map)
+                looked_up_channel_ids.update(page_channel_ids)
+                if len(video_items) == 0:
+                    continue
+
+                videos_response = {"items": video_items}
+
+                # search snippet에 channelId가 빠진 경우에만 videos 응답 기준으로 한 번 더 조회합니다.
+                missing_channel_ids = [
+                    channel_id
+                    for channel_id in self._extract_channel_ids(videos_response)
+                    if channel_id not in channel_map and channel_id not in looked_up_channel_ids
+                ]
+                if len(missing_channel_ids) > 0:
+                    looked_up_channel_ids.update(missing_channel_ids)
+                    channel_map.update(await self._fetch_channel_map(missing_channel_ids, resolved_api_keys))
+
+                yield self._to_video_rows(videos_response, channel=channel, channel_map=channel_map)
+
+            await search_task
+        finally:
+            for task in (search_task, *detail_tasks):
+                task.cancel()
+            await asyncio.gather(search_task, *detail_tasks, return_exceptions=True)
+
+    async def fetch_videos_batch_async(
+        self,
+        *,
+        queries: list[tuple[str, str]],
+        sort: SearchSortOption,
+        period: SearchPeriodOption,
+        result_limit: int,
+        api_keys: list[str] | None = None,
+        duration_bucket: SearchDurationBucket = SearchDurationBucket.ALL,
+        country: str = "",
+    ) -> list[list[YoutubeVideoRaw]]:
+        """(keyword, channel) 검색 여러 개를 한 번에 처리하고, 검색별 원본 행 목록을 입력 순서대로 돌려줍니다.
+
+        search 호출은 검색마다 동시에 진행하고, videos/channels 조회는 전체 id 합집합으로 한 번만 합니다.
+        """
+        resolved_api_keys = self._resolve_api_keys(api_keys)
+
+        if len(resolved_api_keys) == 0:
+            raise SearchUpstreamUnavailableError(message="YOUTUBE_API_KEY is not configured")
+
+        async def _collect_hits(keyword: str, channel: str) -> list[tuple[str, str]]:
+            normalized_keyword = keyword.strip()
+            effective_query = normalized_keyword if normalized_keyword != "" else channel.strip()
+            hits: list[tuple[str, str]] = []
+            async for page_hits in self._iter_search_pages(
                 keyword=effective_query,
                 sort=sort,
                 period=period,
                 result_limit=result_limit,
-            ),
-            resolved_api_keys,
+                api_keys=resolved_api_keys,
+                duration_bucket=duration_bucket,
+                country=country,
+            ):
+                hits.extend(page_hits)
+            return hits
+
+        search_tasks = [asyncio.create_task(_collect_hits(keyword, channel)) for keyword, channel in queries]
+        try:
+            hits_per_query = await asyncio.gather(*search_tasks)
+        except BaseException:
+            for task in search_tasks:
+                task.cancel()
+            await asyncio.gather(*search_tasks, return_exceptions=True)
+            raise
+
+        union_video_ids: list[str] = []
+        union_channel_ids: list[str] = []
+        seen_video_ids: set[str] = set()
+        seen_channel_ids: set[str] = set()
+        for hits in hits_per_query:
+            for video_id, channel_id in hits:
+                if video_id not in seen_video_ids:
+                    seen_video_ids.add(video_id)
+                    union_video_ids.append(video_id)
+                if channel_id != "" and channel_id not in seen_channel_ids:
+                    seen_channel_ids.add(channel_id)
+                    union_channel_ids.append(channel_id)
+
+        if len(union_video_ids) == 0:
+            return [[] for _ in queries]
+
+        video_items, channel_map = await self._fetch_page_details(union_video_ids, union_channel_ids, resolved_api_keys)
+
+        missing_channel_ids = [
+            channel_id
+            for channel_id in self._extract_channel_ids({"items": video_items})
+            if channel_id not in channel_map and channel_id not in seen_channel_ids
+        ]
+        if len(missing_channel_ids) > 0:
+            channel_map.update(await self._fetch_channel_map(missing_channel_ids, resolved_api_keys))
+
+        items_by_id = {item["id"]: item for item in video_items}
+        return [
+            self._to_video_rows(
+                {"items": [items_by_id[video_id] for video_id, _ in hits if video_id in items_by_id]},
+                channel=channel,
+                channel_map=channel_map,
+            )
+            for hits, (_, channel) in zip(hits_per_query, queries)
+        ]
+
+    async def _fetch_page_details(
+        self,
+        video_ids: list[str],
+        channel_ids: list[str],
+        api_keys: list[str],
+    ) -> tuple[list[dict[str, Any]], dict[str, dict[str, Any]]]:
+        video_items, channel_map = await asyncio.gather(
+            self._fetch_video_items(video_ids, api_keys),
+            self._fetch_channel_map(channel_ids, api_keys),
+        )
+        return video_items, channel_map
+
+    def build_query_key(
+        self,
+        *,
+        keyword: str,
+        channel: str,
+        sort: SearchSortOption,
+        period: SearchPeriodOption,
+        result_limit: int,
+        duration_bucket: SearchDurationBucket = SearchDurationBucket.ALL,
+        country: str = "",
+    ) -> UpstreamQueryKey:
+        normalized_keyword = keyword.strip()
+        normalized_channel = channel.strip()
+        effective_query = normalized_keyword if normalized_keyword != "" else normalized_channel
+        return UpstreamQueryKey(
+            query=effective_query,
+            channel=normalized_channel.lower(),
+            youtube_order=self._to_youtube_sort(sort),
+            period=period,
+            result_limit=result_limit,
+            video_duration=self._to_youtube_video_duration(duration_bucket),
+            region_code=self._to_region_code(country),
+        )
+
+    async def _iter_search_pages(
+        self,
+        *,
+        keyword: str,
+        sort: SearchSortOption,
+        period: SearchPeriodOption,
+        result_limit: int,
+        api_keys: list[str],
+        duration_bucket: SearchDurationBucket = SearchDurationBucket.ALL,
+        country: str = "",
+    ) -> AsyncIterator[list[tuple[str, str]]]:
+        """nextPageToken을 따라가며 페이지마다 새로 나온 (videoId, channelId)를 돌려줍니다.
+
+        search 페이지는 토큰 체인으로 이어져 있어 순차 호출만 가능하며, 전체가 result_limit개(중복 제거)가 되면 멈춥니다.
+        """
+        target_count = max(1, result_limit)
+        collected_count = 0
+        seen: set[str] = set()
+        page_token: str | None = None
+
+        # pageToken은 같은 검색 조건에서만 유효하므로 기본 파라미터(publishedAfter 포함)는 한 번만 만듭니다.
+        base_params = self._build_search_params(
+            keyword=keyword,
+            sort=sort,
+            period=period,
+            result_limit=target_count,
+            duration_bucket=duration_bucket,
+            country=country,
         )
-        video_ids = self._extract_video_ids(search_response)
 
-        if len(video_ids) == 0:
+        for _ in range(max(1, self._max_pages)):
+            params = dict(base_params)
+            if page_token is not None:
+                params["pageToken"] = page_token
+
+            search_response = await self._call_youtube_api_with_fallback(YOUTUBE_SEARCH_URL, params, api_keys)
+
+            page_hits: list[tuple[str, str]] = []
+            for video_id, channel_id in self._extract_search_hits(search_response):
+                if video_id in seen:
+                    continue
+                seen.add(video_id)
+                page_hits.append((video_id, channel_id))
+                if collected_count + len(page_hits) >= target_count:
+                    break
+
+            if len(page_hits) > 0:
+                collected_count += len(page_hits)
+                yield page_hits
+
+            if collected_count >= target_count:
+                return
+
+            page_token = self._extract_next_page_token(search_response)
+            if page_token is None or len(page_hits) == 0:
+                return
+
+    async def _fetch_items_in_batches(
+        self,
+        url: str,
+        base_params: dict[str, str],
+        ids: list[str],
+        api_keys: list[str],
+    ) -> list[dict[str, Any]]:
+        """id 목록을 50개 단위로 나눠 조회하고, 청크 순서대로 items를 이어 붙입니다."""
+        chunks = [ids[index : index + YOUTUBE_ID_BATCH_SIZE] for index in range(0, len(ids), YOUTUBE_ID_BATCH_SIZE)]
+        if len(chunks) == 0:
             return []
 
-        videos_response = self._call_youtube_api_with_fallback(
-            YOUTUBE_VIDEOS_URL,
-            {
-                "part": "snippet,statistics,contentDetails",
-                "id": ",".join(video_ids),
-            },
-            resolved_api_keys,
+        async def _fetch_chunk(chunk: list[str]) -> list[dict[str, Any]]:
+            response = await self._call_youtube_api_with_fallback(url, {**base_params, "id": ",".join(chunk)}, api_keys)
+            items = response.get("items")
+            if not isinstance(items, list):
+                return []
+            return [item for item in items if isinstance(item, dict)]
+
+        chunk_results = await asyncio.gather(*(_fetch_chunk(chunk) for chunk in chunks))
+        return [item for chunk_items in chunk_results for item in chunk_items]
+
+    async def _fetch_video_items(self, video_ids: list[str], api_keys: list[str]) -> list[dict[str, Any]]:
+        """캐시를 반영해 videos 응답 형태의 item 목록을 video_ids 순서로 돌려줍니다.
+
+        - 정적 정보가 없는 id: snippet/statistics/contentDetails 전체 조회
+        - 정적 정보만 남아 있는 id: statistics만 조회
+        """
+        static_parts = self._video_static_cache.get_many(video_ids)
+        statistics_by_id = self._video_statistics_cache.get_many(video_ids)
+
+        full_ids = [video_id for video_id in video_ids if video_id not in static_parts]
+        statistics_only_ids = [
+            video_id for video_id in video_ids if video_id in static_parts and video_id not in statistics_by_id
+        ]
+
+        full_items, statistics_items = await asyncio.gather(
+            self._fetch_items_in_batches(
+                YOUTUBE_VIDEOS_URL,
+                {"part": "snippet,statistics,contentDetails", "fields": YOUTUBE_VIDEO_FIELDS},
+                full_ids,
+                api_keys,
+            ),
+            self._fetch_items_in_batches(
+                YOUTUBE_VIDEOS_URL,
+                {"part": "statistics", "fields": YOUTUBE_VIDEO_STATISTICS_FIELDS},
+                statistics_only_ids,
+                api_keys,
+            ),
         )
 
-        channel_ids = self._extract_channel_ids(videos_response)
-        channel_map = self._fetch_channel_map(channel_ids, resolved_api_keys)
-        return self._to_video_rows(videos_response, channel=channel, channel_map=channel_map)
+        fetched_static: dict[str, dict[str, Any]] = {}
+        fetched_statistics: dict[str, dict[str, Any]] = {}
+        for item in [*full_items, *statistics_items]:
+            video_id = item.get("id")
+            if not isinstance(video_id, str) or video_id == "":
+                continue
+            statistics = item.get("statistics")
+            if isinstance(statistics, dict):
+                fetched_statistics[video_id] = statistics
+            snippet = item.get("snippet")
+            content_details = item.get("contentDetails")
+            if isinstance(snippet, dict) and isinstance(content_details, dict):
+                fetched_static[video_id] = {"snippet": snippet, "contentDetails": content_details}
+
+        self._video_static_cache.set_many(fetched_static)
+        self._video_statistics_cache.set_many(fetched_statistics)
+        static_parts.update(fetched_static)
+        statistics_by_id.update(fetched_statistics)
+
+        items: list[dict[str, Any]] = []
+        for video_id in video_ids:
+            static_part = static_parts.get(video_id)
+            statistics = statistics_by_id.get(video_id)
+            if static_part is None or statistics is None:
+                continue
+            items.append({"id": video_id, **static_part, "statistics": statistics})
+        return items
 
-    def _fetch_channel_map(self, channel_ids: list[str], api_keys: list[str]) -> dict[str, dict[str, Any]]:
+    async def _fetch_channel_map(self, channel_ids: list[str], api_keys: list[str]) -> dict[str, dict[str, Any]]:
         if len(channel_ids) == 0:
             return {}
 
-        channels_response = self._call_youtube_api_with_fallback(
+        mapped = self._channel_cache.get_many(channel_ids)
+        missing_channel_ids = [channel_id for channel_id in channel_ids if channel_id not in mapped]
+        if len(missing_channel_ids) == 0:
+            return mapped
+
+        items = await self._fetch_items_in_batches(
             YOUTUBE_CHANNELS_URL,
-            {
-                "part": "snippet,statistics",
-                "id": ",".join(channel_ids),
-            },
+            {"part": "snippet,statistics", "fields": YOUTUBE_CHANNEL_FIELDS},
+            missing_channel_ids,
             api_keys,
         )
 
-        items = channels_response.get("items")
-        if not isinstance(items, list):
-            return {}
-
-        mapped: dict[str, dict[str, Any]] = {}
+        fetched: dict[str, dict[str, Any]] = {}
         for item in items:
-            if not isinstance(item, dict):
-                continue
             channel_id = item.get("id")
             if not isinstance(channel_id, str) or channel_id == "":
                 continue
-            mapped[channel_id] = item
-        return mapped
+            fetched[channel_id] = item
+
+        self._channel_cache.set_many(fetched)
+        return {**mapped, **fetched}
 
     def _build_search_params(
         self,
@@ -164,21 +653,53 @@ class YouTubeSearchClient:
         sort: SearchSortOption,
         period: SearchPeriodOption,
         result_limit: int,
+        duration_bucket: SearchDurationBucket = SearchDurationBucket.ALL,
+        country: str = "",
     ) -> dict[str, str]:
         params: dict[str, str] = {
             "part": "snippet",
             "type": "video",
             "q": keyword,
-            "maxResults": str(max(1, min(self._max_results, result_limit, 50))),
+            "maxResults": str(max(1, min(self._max_results, result_limit, YOUTUBE_PAGE_SIZE_LIMIT))),
             "order": self._to_youtube_sort(sort),
+            "fields": YOUTUBE_SEARCH_FIELDS,
         }
 
         published_after = self._to_published_after(period)
         if published_after is not None:
             params["publishedAfter"] = published_after
 
+        video_duration = self._to_youtube_video_duration(duration_bucket)
+        if video_duration is not None:
+            params["videoDuration"] = video_duration
+
+        region_code = self._to_region_code(country)
+        if region_code != "":
+            params["regionCode"] = region_code
+            relevance_language = COUNTRY_RELEVANCE_LANGUAGES.get(region_code)
+            if relevance_language is not None:
+                params["relevanceLanguage"] = relevance_language
+
         return params
 
+    @staticmethod
+    def _to_youtube_video_duration(duration_bucket: SearchDurationBucket) -> str | None:
+        # YouTube 기준: short < 4분, medium 4~20분, long > 20분. 경계값은 서비스 필터에서 한 번 더 거릅니다.
+        if duration_bucket == SearchDurationBucket.UNDER_4M:
+            return "short"
+        if duration_bucket == SearchDurationBucket.BETWEEN_4M_AND_20M:
+            return "medium"
+        if duration_bucket == SearchDurationBucket.OVER_20M:
+            return "long"
+        return None
+
+    @staticmethod
+    def _to_region_code(country: str) -> str:
+        normalized_country = country.strip().upper()
+        if len(normalized_country) != 2 or not normalized_country.isalpha():
+            return ""
+        return normalized_country
+
     @staticmethod
     def _to_youtube_sort(sort: SearchSortOption) -> str:
         if sort == SearchSortOption.VIEWS:
@@ -215,59 +736,144 @@ class YouTubeSearchClient:
         return None
 
 
-    def _call_youtube_api_with_fallback(
+    async def _call_youtube_api_with_fallback(
         self,
         url: str,
         base_params: dict[str, str],
         api_keys: list[str],
     ) -> dict[str, Any]:
-        last_error: Exception | None = None
+        if len(api_keys) == 0:
+            raise SearchUpstreamUnavailableError(message="YOUTUBE_API_KEY is not configured")
 
-        for index, api_key in enumerate(api_keys):
+        cost = YOUTUBE_QUOTA_COST_BY_URL.get(url, 1)
+        # 사용자 키를 먼저 모두 쓰고 서버 키는 마지막에만 씁니다. 사용량 분산은 같은 계층 안에서만 합니다.
+        scheduled_keys = [
+            api_key for tier in self._split_key_tiers(api_keys) for api_key in self._key_scheduler.order_keys(tier, cost)
+        ]
+        if len(scheduled_keys) == 0:
+            # 모든 키가 오늘 할당량을 소진했으면 실패할 왕복 호출 없이 바로 알립니다.
+            raise SearchQuotaExceededError()
+
+        last_error: SearchQuotaExceededError | None = None
+        for api_key in scheduled_keys:
             params = {**base_params, "key": api_key}
             try:
-                return self._call_youtube_api(url, params)
+                return await self._send_with_retries(url, params, api_key=api_key, cost=cost)
             except SearchQuotaExceededError as error:
+                self._key_scheduler.mark_exhausted(api_key)
                 last_error = error
-                is_last_key = index == len(api_keys) - 1
-                if is_last_key:
+
+        raise last_error if last_error is not None else SearchQuotaExceededError()
+
+    def _split_key_tiers(self, api_keys: list[str]) -> list[list[str]]:
+        user_keys = [api_key for api_key in api_keys if api_key != self._api_key]
+        server_keys = [api_key for api_key in api_keys if api_key == self._api_key]
+        return [tier for tier in (user_keys, server_keys) if tier]
+
+    async def _send_with_retries(
+        self,
+        url: str,
+        params: dict[str, str],
+        *,
+        api_key: str,
+        cost: int,
+    ) -> dict[str, Any]:
+        """엔드포인트별 circuit breaker를 거쳐 호출하고, 일시 장애는 jitter 백오프로 재시도합니다.
+
+        할당량은 breaker를 통과해 실제로 보내는 요청마다(재시도 포함) api_key에 cost만큼 기록합니다.
+        """
+        breaker = self._circuit_breakers.get(url)
+
+        for attempt in range(self._retry_policy.max_attempts + 1):
+            permit = breaker.allow_request() if breaker is not None else None
+            if breaker is not None and permit is None:
+                raise SearchUpstreamUnavailableError(message="youtube circuit open")
+            self._key_scheduler.record_usage(api_key, cost)
+
+            try:
+                response = await self._send(url, params)
+            except SearchUpstreamUnavailableError as error:
+                if not error.retryable:
+                    # 잘못된 키처럼 upstream 상태를 알려 주지 않는 실패는 breaker 상태를 바꾸지 않습니다.
+                    # 전송 오류(timeout/연결 실패)는 retryable이라 아래에서 실패로 기록됩니다.
+                    if permit is not None:
+                        breaker.release_probe(permit)
                     raise
+                if permit is not None:
+                    breaker.record_failure(permit)
+                if attempt >= self._retry_policy.max_attempts:
+                    raise
+                await asyncio.sleep(self._retry_policy.compute_delay(attempt))
                 continue
+            except (SearchQuotaExceededError, SearchRateLimitedError, SearchUpstreamError):
+                # 응답이 왔다는 것은 upstream이 살아 있다는 뜻이므로 breaker에는 성공으로 기록합니다.
+                if permit is not None:
+                    breaker.record_success(permit)
+                raise
+            except BaseException:
+                # 취소 등으로 결과를 모르면 half-open 시험 호출 자리가 묶이지 않도록 돌려줍니다.
+                if permit is not None:
+                    breaker.release_probe(permit)
+                raise
+
+            if permit is not None:
+                breaker.record_success(permit)
+            return response
+
+        raise SearchUpstreamUnavailableError()
+
+    async def _send(self, url: str, params: dict[str, str]) -> dict[str, Any]:
+        if is_blocking_transport():
+            # 동기 풀 호출은 스레드에서 실행해야 gather로 묶은 청크/상세 조회가 동시에 나갑니다.
+            return await asyncio.to_thread(self._call_youtube_api, url, params)
+        return await self._call_youtube_api_async(url, params)
+
+    async def _call_youtube_api_async(self, url: str, params: dict[str, str]) -> dict[str, Any]:
+        http_client = get_shared_async_http_client()
+        timeout = get_transport_settings().build_timeout(self._timeout_seconds)
 
-        if last_error is not None:
-            raise last_error
+        try:
+            response = await http_client.get(url, params=params, timeout=timeout)
+        except httpx.TimeoutException as timeout_error:
+            raise SearchUpstreamUnavailableError(message="youtube timeout", retryable=True) from timeout_error
+        except httpx.TransportError as transport_error:
+            raise SearchUpstreamUnavailableError(message=str(transport_error), retryable=True) from transport_error
 
-        raise SearchUpstreamUnavailableError(message="YOUTUBE_API_KEY is not configured")
+        return self._parse_api_response(response.status_code, response.content)
 
     def _call_youtube_api(self, url: str, params: dict[str, str]) -> dict[str, Any]:
-        query_string = urlencode(params)
-        request = Request(f"{url}?{query_string}", method="GET")
+        http_client = get_shared_http_client()
+        timeout = get_transport_settings().build_timeout(self._timeout_seconds)
 
         try:
-            with urlopen(request, timeout=self._timeout_seconds) as response:
-                payload = response.read().decode("utf-8")
-                parsed = json.loads(payload)
-                if not isinstance(parsed, dict):
-                    raise SearchUpstreamError(message="youtube response is not an object")
-                return parsed
-        except HTTPError as http_error:
-            raise self._map_http_error(http_error) from http_error
-        except URLError as url_error:
-            raise SearchUpstreamUnavailableError(message=str(url_error.reason)) from url_error
-        except TimeoutError as timeout_error:
-            raise SearchUpstreamUnavailableError(message="youtube timeout") from timeout_error
-        except json.JSONDecodeError as decode_error:
+            response = http_client.get(url, params=params, timeout=timeout)
+        except httpx.TimeoutException as timeout_error:
+            raise SearchUpstreamUnavailableError(message="youtube timeout", retryable=True) from timeout_error
+        except httpx.TransportError as transport_error:
+            raise SearchUpstreamUnavailableError(message=str(transport_error), retryable=True) from transport_error
+
+        return self._parse_api_response(response.status_code, response.content)
+
+    def _parse_api_response(self, status: int, content: bytes) -> dict[str, Any]:
+        if status >= 400:
+            raise self._map_http_status(status, content)
+
+        try:
+            parsed = json.loads(content.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as decode_error:
             raise SearchUpstreamError(message="youtube invalid json") from decode_error
 
-    def _map_http_error(self, http_error: HTTPError) -> Exception:
-        status = http_error.code
+        if not isinstance(parsed, dict):
+            raise SearchUpstreamError(message="youtube response is not an object")
+        return parsed
+
+    def _map_http_status(self, status: int, content: bytes) -> Exception:
         try:
-            payload = http_error.read().decode("utf-8")
-            parsed = json.loads(payload)
+            parsed = json.loads(content.decode("utf-8"))
         except Exception:
             parsed = {}
 
-        message = json.dumps(parsed, ensure_ascii=False) if parsed else str(http_error)
+        message = json.dumps(parsed, ensure_ascii=False) if parsed else f"HTTP {status}"
         lowered_message = message.lower()
 
         if status == 400 and "api key not valid" in lowered_message:
@@ -277,16 +883,16 @@ class YouTubeSearchClient:
         if status == 429:
             return SearchRateLimitedError()
         if status in {500, 502, 503, 504}:
-            return SearchUpstreamUnavailableError()
+            return SearchUpstreamUnavailableError(retryable=True)
         return SearchUpstreamError(message=f"status={status}")
 
     @staticmethod
-    def _extract_video_ids(search_response: dict[str, Any]) -> list[str]:
+    def _extract_search_hits(search_response: dict[str, Any]) -> list[tuple[str, str]]:
         items = search_response.get("items")
         if not isinstance(items, list):
             return []
 
-        video_ids: list[str] = []
+        hits: list[tuple[str, str]] = []
         for item in items:
             if not isinstance(item, dict):
                 continue
@@ -294,10 +900,20 @@ class YouTubeSearchClient:
             if not isinstance(identifier, dict):
                 continue
             video_id = identifier.get("videoId")
-            if isinstance(video_id, str) and video_id != "":
-                video_ids.append(video_id)
+            if not isinstance(video_id, str) or video_id == "":
+                continue
+            snippet = item.get("snippet")
+            channel_id = snippet.get("channelId") if isinstance(snippet, dict) else None
+            hits.append((video_id, channel_id.strip() if isinstance(channel_id, str) else ""))
+
+        return hits
 
-        return video_ids
+    @staticmethod
+    def _extract_next_page_token(search_response: dict[str, Any]) -> str | None:
+        page_token = search_response.get("nextPageToken")
+        if isinstance(page_token, str) and page_token != "":
+            return page_token
+        return None
 
     @staticmethod
     def _extract_channel_ids(videos_response: dict[str, Any]) -> list[str]:
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from threading import Lock
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[K, T]):
+    """같은 키로 동시에 들어온 호출을 하나의 실행으로 묶습니다.
+
+    - 첫 호출(leader)만 factory를 실행하고, 나머지는 그 결과/예외를 함께 받습니다.
+    - 결과는 실행이 끝나면 바로 버립니다. 재사용은 별도 캐시의 역할입니다.
+    - 대기는 concurrent.futures.Future로 하므로 서로 다른 이벤트 루프(동기 래퍼)에서도 동작합니다.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[K, Future[T]] = {}
+        self._lock = Lock()
+
+    def inflight_count(self) -> int:
+        with self._lock:
+            return len(self._inflight)
+
+    async def run(self, key: K, factory: Callable[[], Awaitable[T]]) -> T:
+        while True:
+            with self._lock:
+                future = self._inflight.get(key)
+                is_leader = future is None
+                if future is None:
+                    future = Future()
+                    self._inflight[key] = future
+
+            if is_leader:
+                return await self._run_as_leader(key, future, factory)
+
+            try:
+                return await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                # leader가 취소된 경우에만 다시 시도하고, 내 요청이 취소된 경우는 그대로 전파합니다.
+                current_task = asyncio.current_task()
+                if future.cancelled() and (current_task is None or current_task.cancelling() == 0):
+                    continue
+                raise
+
+    async def _run_as_leader(self, key: K, future: Future[T], factory: Callable[[], Awaitable[T]]) -> T:
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is future:
+                    self._inflight.pop(key, None)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from .cache import TtlLruCache, read_cache_settings
+from .schemas import SearchResultFormat, SearchVideoRecord
+
+DEFAULT_RESULT_CURSOR_TTL_SECONDS = 600
+DEFAULT_RESULT_CURSOR_MAX_ENTRIES = 200
+
+
+@dataclass(frozen=True)
+class SearchCursorInvalidError(Exception):
+    message: str = "invalid search cursor"
+
+
+@dataclass(frozen=True)
+class SearchCursorExpiredError(Exception):
+    message: str = "search cursor expired"
+
+
+@dataclass(frozen=True)
+class StoredSearchResult:
+    """첫 요청에서 정렬까지 끝낸 결과 집합. 이후 페이지는 이 집합을 잘라서만 만듭니다."""
+
+    records: tuple[SearchVideoRecord, ...]
+    result_format: SearchResultFormat
+    item_fields: tuple[tuple[str, str], ...]
+    page_size: int
+
+
+@dataclass(frozen=True)
+class SearchResultPage:
+    records: tuple[SearchVideoRecord, ...]
+    result_format: SearchResultFormat
+    item_fields: tuple[tuple[str, str], ...]
+    next_cursor: str | None
+    total_count: int
+
+
+_result_cursor_ttl_seconds, _result_cursor_max_entries = read_cache_settings(
+    "SEARCH_RESULT_CURSOR",
+    default_ttl_seconds=DEFAULT_RESULT_CURSOR_TTL_SECONDS,
+    default_max_entries=DEFAULT_RESULT_CURSOR_MAX_ENTRIES,
+)
+# 스크롤 중 다음 페이지를 YouTube 호출/재정렬 없이 같은 순서로 돌려주기 위해 정렬된 결과 집합을 잠시 보관합니다.
+shared_result_sets: TtlLruCache[str, StoredSearchResult] = TtlLruCache(
+    ttl_seconds=_result_cursor_ttl_seconds,
+    max_entries=_result_cursor_max_entries,
+)
+
+
+def _encode_cursor(result_id: str, offset: int) -> str:
+    return base64.urlsafe_b64encode(f"{result_id}:{offset}".encode("ascii")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[str, int]:
+    padded = cursor.strip() + "=" * (-len(cursor.strip()) % 4)
+    try:
+        result_id, _, raw_offset = base64.urlsafe_b64decode(padded).decode("ascii").partition(":")
+        offset = int(raw_offset)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as error:
+        raise SearchCursorInvalidError() from error
+    if not result_id or offset < 0:
+        raise SearchCursorInvalidError()
+    return result_id, offset
+
+
+def _build_result_id(stored: StoredSearchResult) -> str:
+    """결과 집합 내용으로 만든 id. 같은 검색이 같은 결과를 내면 커서도 같아 첫 페이지 ETag/304가 유지됩니다.
+
+    같은 id로 다시 보관하면 만료 시간도 새로 늘어나므로, 304를 받은 클라이언트의 이전 커서도 계속 쓸 수 있습니다.
+    """
+    fingerprint = repr((stored.result_format.value, stored.item_fields, stored.page_size, stored.records))
+    digest = hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=12).digest()
+    return base64.urlsafe_b64encode(digest).decode("ascii")
+
+
+def _slice_page(stored: StoredSearchResult, result_id: str, offset: int, page_size: int) -> SearchResultPage:
+    end = offset + page_size
+    return SearchResultPage(
+        records=stored.records[offset:end],
+        result_format=stored.result_format,
+        item_fields=stored.item_fields,
+        next_cursor=_encode_cursor(result_id, end) if end < len(stored.records) else None,
+        total_count=len(stored.records),
+    )
+
+
+def start_search_result_pages(
+    records: Sequence[SearchVideoRecord],
+    *,
+    result_format: SearchResultFormat,
+    item_fields: tuple[tuple[str, str], ...],
+    page_size: int,
+) -> SearchResultPage:
+    """정렬된 결과 집합을 보관하고 첫 페이지를 돌려줍니다.
+
+    한 페이지에 다 들어가거나 커서 캐시를 끈 경우에는 보관하지 않고 전체를 한 페이지로 돌려줍니다.
+    """
+    stored = StoredSearchResult(
+        records=tuple(records),
+        result_format=result_format,
+        item_fields=item_fields,
+        page_size=page_size,
+    )
+    if len(stored.records) <= page_size or not shared_result_sets.enabled:
+        return _slice_page(stored, "", 0, len(stored.records))
+
+    result_id = _build_result_id(stored)
+    shared_result_sets.set(result_id, stored)
+    return _slice_page(stored, result_id, 0, page_size)
+
+
+def read_search_result_page(cursor: str, page_size: int = 0) -> SearchResultPage:
+    """커서가 가리키는 다음 페이지를 보관된 결과 집합에서 잘라 돌려줍니다.
+
+    page_size가 0이면 첫 요청의 페이지 크기를 그대로 씁니다.
+    형식이 잘못된 커서는 SearchCursorInvalidError, 만료/축출된 커서는 SearchCursorExpiredError를 냅니다.
+    """
+    result_id, offset = _decode_cursor(cursor)
+    stored = shared_result_sets.get(result_id)
+    if stored is None:
+        raise SearchCursorExpiredError()
+    return _slice_page(stored, result_id, offset, page_size or stored.page_size)
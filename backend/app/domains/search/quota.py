@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from threading import Lock
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+DEFAULT_DAILY_QUOTA_UNITS = 10000
+
+
+def _resolve_pacific_timezone() -> tzinfo:
+    # YouTube Data API 할당량은 태평양 시간 자정에 초기화됩니다.
+    # tzdata가 없는 환경(Windows 등)에서는 PST 고정 오프셋으로 대신합니다.
+    try:
+        return ZoneInfo("America/Los_Angeles")
+    except ZoneInfoNotFoundError:
+        return timezone(timedelta(hours=-8), "PST")
+
+
+PACIFIC_TIMEZONE = _resolve_pacific_timezone()
+
+
+@dataclass
+class _KeyUsage:
+    quota_day: date
+    used_units: int = 0
+    exhausted: bool = False
+
+
+class ApiKeyScheduler:
+    """API 키별 예상 할당량 사용량을 추적해 호출할 키 순서를 정합니다.
+
+    - 사용량은 실제로 보내는 요청마다 보내기 직전에 예약(record_usage)해서 동시 요청도 여러 키로 분산됩니다.
+    - 지난 할당량 날짜의 기록은 날짜가 바뀐 뒤 처음 조회할 때 한꺼번에 지웁니다.
+    - quota 초과 응답을 받은 키는 태평양 시간 자정까지 후보에서 제외합니다.
+    - 예상 사용량이 일일 한도를 넘은 키는 제외하지 않고 뒤로 미룹니다(다른 곳에서 쓴 양은 알 수 없음).
+    """
+
+    def __init__(
+        self,
+        *,
+        daily_quota_units: int = DEFAULT_DAILY_QUOTA_UNITS,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self._daily_quota_units = daily_quota_units
+        self._clock = clock
+        self._usage_by_key: dict[str, _KeyUsage] = {}
+        self._usage_day: date | None = None
+        self._lock = Lock()
+
+    def _current_quota_day(self) -> date:
+        return self._clock().astimezone(PACIFIC_TIMEZONE).date()
+
+    def _get_usage(self, api_key: str, quota_day: date) -> _KeyUsage:
+        if quota_day != self._usage_day:
+            # 사용자 키는 요청마다 새로 들어올 수 있으므로 지난 날짜 기록을 남겨 두지 않습니다.
+            self._usage_by_key = {
+                key: usage for key, usage in self._usage_by_key.items() if usage.quota_day == quota_day
+            }
+            self._usage_day = quota_day
+        usage = self._usage_by_key.get(api_key)
+        if usage is None or usage.quota_day != quota_day:
+            usage = _KeyUsage(quota_day=quota_day)
+            self._usage_by_key[api_key] = usage
+        return usage
+
+    def order_keys(self, api_keys: list[str], cost: int) -> list[str]:
+        """소진되지 않은 키를 예상 사용량이 적은 순서로 돌려줍니다. 동률이면 입력 순서를 유지합니다."""
+        quota_day = self._current_quota_day()
+        with self._lock:
+            usages = [(api_key, self._get_usage(api_key, quota_day)) for api_key in api_keys]
+
+        healthy = [(api_key, usage.used_units) for api_key, usage in usages if not usage.exhausted]
+        healthy.sort(key=lambda pair: (pair[1] + cost > self._daily_quota_units, pair[1]))
+        return [api_key for api_key, _ in healthy]
+
+    def record_usage(self, api_key: str, units: int) -> None:
+        quota_day = self._current_quota_day()
+        with self._lock:
+            self._get_usage(api_key, quota_day).used_units += units
+
+    def mark_exhausted(self, api_key: str) -> None:
+        quota_day = self._current_quota_day()
+        with self._lock:
+            self._get_usage(api_key, quota_day).exhausted = True
+
+    def used_units(self, api_key: str) -> int:
+        quota_day = self._current_quota_day()
+        with self._lock:
+            return self._get_usage(api_key, quota_day).used_units
+
+    def tracked_key_count(self) -> int:
+        with self._lock:
+            return len(self._usage_by_key)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._usage_by_key.clear()
+            self._usage_day = None
+
+
+def _read_daily_quota_units() -> int:
+    try:
+        return int(os.getenv("YOUTUBE_DAILY_QUOTA_UNITS", str(DEFAULT_DAILY_QUOTA_UNITS)))
+    except ValueError:
+        return DEFAULT_DAILY_QUOTA_UNITS
+
+
+shared_key_scheduler = ApiKeyScheduler(daily_quota_units=_read_daily_quota_units())
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import os
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from threading import Lock
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_COOLDOWN_SECONDS = 30.0
+DEFAULT_MAX_COOLDOWN_SECONDS = 300.0
+DEFAULT_RETRY_ATTEMPTS = 2
+DEFAULT_RETRY_BASE_DELAY_SECONDS = 0.2
+DEFAULT_RETRY_MAX_DELAY_SECONDS = 2.0
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "halfOpen"
+
+
+@dataclass(frozen=True)
+class CircuitPermit:
+    """allow_request가 허락한 호출 한 건. 결과는 이 permit과 함께 보고합니다.
+
+    epoch는 허락받을 당시의 회로 세대입니다. 회로가 열리거나 닫히면 세대가 바뀌므로,
+    이전 세대에 허락받은 늦은 응답(straggler)은 상태를 바꾸지 못합니다.
+    """
+
+    epoch: int
+    is_probe: bool
+
+
+class CircuitBreaker:
+    """연속 실패가 쌓이면 일정 시간 호출을 막고, 이후 한 건씩 시험 호출(half-open)합니다.
+
+    - closed: 모든 호출 허용, 연속 실패가 failure_threshold에 도달하면 open
+    - open: cooldown 동안 즉시 거절, cooldown이 지나면 half-open
+    - half-open: 시험 호출 한 건만 허용. 성공하면 closed, 실패하면 cooldown을 두 배로 늘려 다시 open
+    - 결과 보고는 allow_request가 돌려준 permit으로 합니다. 현재 세대의 permit만 반영하므로
+      open 중의 늦은 보고는 무시되고, half-open에서는 시험 호출만 회로를 움직입니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown_seconds: float = DEFAULT_COOLDOWN_SECONDS,
+        max_cooldown_seconds: float = DEFAULT_MAX_COOLDOWN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = max(1, failure_threshold)
+        self._base_cooldown_seconds = cooldown_seconds
+        self._max_cooldown_seconds = max(cooldown_seconds, max_cooldown_seconds)
+        self._clock = clock
+        self._lock = Lock()
+        self._state = CircuitState.CLOSED
+        self._epoch = 0
+        self._consecutive_failures = 0
+        self._cooldown_seconds = cooldown_seconds
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._state
+
+    def allow_request(self) -> CircuitPermit | None:
+        """호출을 허락하면 permit을, 거절하면 None을 돌려줍니다."""
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return CircuitPermit(epoch=self._epoch, is_probe=False)
+
+            if self._state == CircuitState.OPEN:
+                if self._clock() - self._opened_at < self._cooldown_seconds:
+                    return None
+                self._state = CircuitState.HALF_OPEN
+                self._probe_in_flight = False
+
+            if self._probe_in_flight:
+                return None
+            self._probe_in_flight = True
+            return CircuitPermit(epoch=self._epoch, is_probe=True)
+
+    def record_success(self, permit: CircuitPermit) -> None:
+        with self._lock:
+            if permit.epoch != self._epoch:
+                return
+            if self._state == CircuitState.HALF_OPEN:
+                if not permit.is_probe:
+                    return
+                self._close()
+                return
+            self._consecutive_failures = 0
+
+    def record_failure(self, permit: CircuitPermit) -> None:
+        with self._lock:
+            if permit.epoch != self._epoch:
+                return
+            if self._state == CircuitState.HALF_OPEN:
+                if not permit.is_probe:
+                    return
+                self._cooldown_seconds = min(self._cooldown_seconds * 2, self._max_cooldown_seconds)
+                self._open()
+                return
+
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self._failure_threshold:
+                self._open()
+
+    def release_probe(self, permit: CircuitPermit) -> None:
+        """상태는 그대로 두고 half-open 시험 호출 자리만 돌려줍니다. 결과로 upstream 상태를 판단할 수 없는 호출에 씁니다."""
+        with self._lock:
+            if permit.is_probe and permit.epoch == self._epoch and self._state == CircuitState.HALF_OPEN:
+                self._probe_in_flight = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._epoch += 1
+        self._consecutive_failures = 0
+        self._cooldown_seconds = self._base_cooldown_seconds
+        self._probe_in_flight = False
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._epoch += 1
+        self._opened_at = self._clock()
+        self._probe_in_flight = False
+        self._consecutive_failures = 0
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """멱등 GET 호출의 일시 장애(5xx/timeout) 재시도 정책. 지연은 full jitter 지수 백오프입니다."""
+
+    max_attempts: int = DEFAULT_RETRY_ATTEMPTS
+    base_delay_seconds: float = DEFAULT_RETRY_BASE_DELAY_SECONDS
+    max_delay_seconds: float = DEFAULT_RETRY_MAX_DELAY_SECONDS
+
+    def compute_delay(self, retry_index: int) -> float:
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * (2**retry_index))
+        return random.uniform(0.0, ceiling)
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        try:
+            return cls(
+                max_attempts=max(0, int(os.getenv("YOUTUBE_RETRY_MAX_ATTEMPTS", str(DEFAULT_RETRY_ATTEMPTS)))),
+                base_delay_seconds=float(
+                    os.getenv("YOUTUBE_RETRY_BASE_DELAY_SECONDS", str(DEFAULT_RETRY_BASE_DELAY_SECONDS))
+                ),
+                max_delay_seconds=float(
+                    os.getenv("YOUTUBE_RETRY_MAX_DELAY_SECONDS", str(DEFAULT_RETRY_MAX_DELAY_SECONDS))
+                ),
+            )
+        except ValueError:
+            return cls()
+
+
+def build_circuit_breaker_from_env() -> CircuitBreaker:
+    try:
+        failure_threshold = int(os.getenv("YOUTUBE_CIRCUIT_FAILURE_THRESHOLD", str(DEFAULT_FAILURE_THRESHOLD)))
+        cooldown_seconds = float(os.getenv("YOUTUBE_CIRCUIT_COOLDOWN_SECONDS", str(DEFAULT_COOLDOWN_SECONDS)))
+        max_cooldown_seconds = float(
+            os.getenv("YOUTUBE_CIRCUIT_MAX_COOLDOWN_SECONDS", str(DEFAULT_MAX_COOLDOWN_SECONDS))
+        )
+    except ValueError:
+        return CircuitBreaker()
+    return CircuitBreaker(
+        failure_threshold=failure_threshold,
+        cooldown_seconds=cooldown_seconds,
+        max_cooldown_seconds=max_cooldown_seconds,
+    )
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator, Callable
 
 from uuid import uuid4
 
 from fastapi import APIRouter, Body, Header, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response, StreamingResponse
 
-from ...core.response import build_meta, error_response, success_response
+from ...core.response import (
+    FastJSONResponse,
+    build_meta,
+    conditional_success_response,
+    dumps_json,
+    error_response,
+    success_response,
+)
 from .client import (
     SearchQuotaExceededError,
     SearchRateLimitedError,
@@ -17,27 +25,44 @@ from .client import (
 from .schemas import (
     TranscriptErrorResponse,
     TranscriptRequest,
-    TranscriptResultData,
     TranscriptSuccessResponse,
+    SEARCH_BATCH_RESULT_ITEM_FIELDS,
+    SearchBatchRequest,
+    SearchBatchSuccessResponse,
     SearchCorePreset,
     SearchDurationBucket,
     SearchErrorResponse,
     SearchHoverMetric,
     SearchPeriodOption,
-    SearchResultData,
-    SearchResultItem,
+    SearchResultFormat,
     SearchScriptType,
     SearchShortFormType,
     SearchSortOption,
     SearchSuccessResponse,
     SearchTopicOption,
+    serialize_raw_search_record,
+    select_search_item_fields,
+    serialize_search_record,
+)
+from .pagination import (
+    SearchCursorExpiredError,
+    SearchCursorInvalidError,
+    SearchResultPage,
+    read_search_result_page,
+    start_search_result_pages,
+)
+from .service import (
+    SearchStreamEvent,
+    search_videos_async,
+    search_videos_batch_async,
+    stream_search_videos_async,
 )
-from .service import search_videos
 from .transcript import (
     CouldNotRetrieveTranscript,
     NoTranscriptFound,
     RequestBlocked,
     TranscriptDependencyError,
+    TranscriptUnavailableError,
     TranscriptsDisabled,
     YTDLP_IMPORT_ERROR,
     build_transcript_health,
@@ -57,6 +82,7 @@ def _build_transcript_response(
     languages: str,
     cookie_file_path: str,
     cookie_content: str,
+    if_none_match: str | None = None,
 ):
     request_id = f"req_{uuid4().hex[:12]}"
 
@@ -70,7 +96,7 @@ def _build_transcript_response(
             message="videoId 또는 videoUrl 중 하나를 입력해 주세요.",
             request_id=request_id,
         )
-        return JSONResponse(status_code=400, content=body)
+        return FastJSONResponse(status_code=400, content=body)
 
     _cookie_file_path = cookie_file_path.strip()
     _cookie_content = cookie_content.strip()
@@ -89,34 +115,34 @@ def _build_transcript_response(
             video_target=resolved_video_url,
             languages=language_priority,
         )
-    except (NoTranscriptFound, TranscriptsDisabled):
+    except (NoTranscriptFound, TranscriptsDisabled, TranscriptUnavailableError):
         body = error_response(
             code="TRANSCRIPT_NOT_FOUND",
             message="자막이 없습니다. (자동 자막 포함)",
             request_id=request_id,
         )
-        return JSONResponse(status_code=404, content=body)
+        return FastJSONResponse(status_code=404, content=body)
     except RequestBlocked:
         body = error_response(
             code="TRANSCRIPT_REQUEST_BLOCKED",
             message="YouTube 차단이 발생했습니다. WEBSHARE_USERNAME/WEBSHARE_PASSWORD 설정을 확인해 주세요.",
             request_id=request_id,
         )
-        return JSONResponse(status_code=429, content=body)
+        return FastJSONResponse(status_code=429, content=body)
     except CouldNotRetrieveTranscript as error:
         body = error_response(
             code="TRANSCRIPT_FETCH_FAILED",
             message=str(error),
             request_id=request_id,
         )
-        return JSONResponse(status_code=400, content=body)
+        return FastJSONResponse(status_code=400, content=body)
     except TranscriptDependencyError:
         body = error_response(
             code="TRANSCRIPT_DEPENDENCY_MISSING",
             message=f"youtube-transcript-api 설정 오류: {YTDLP_IMPORT_ERROR}",
             request_id=request_id,
         )
-        return JSONResponse(status_code=500, content=body)
+        return FastJSONResponse(status_code=500, content=body)
     except Exception:
         logger.exception("Unexpected transcript failure: video_id=%s video_url=%s", video_id.strip(), resolved_video_url)
         body = error_response(
@@ -124,7 +150,7 @@ def _build_transcript_response(
             message="대본을 가져오는 중 오류가 발생했습니다.",
             request_id=request_id,
         )
-        return JSONResponse(status_code=503, content=body)
+        return FastJSONResponse(status_code=503, content=body)
 
     if result is None:
         body = error_response(
@@ -132,21 +158,24 @@ def _build_transcript_response(
             message="해당 영상에서 사용 가능한 자막/자동자막을 찾지 못했습니다.",
             request_id=request_id,
         )
-        return JSONResponse(status_code=404, content=body)
+        return FastJSONResponse(status_code=404, content=body)
 
     resolved_video_id = video_id.strip() or resolved_video_url.split("v=")[-1]
 
-    data = TranscriptResultData(
-        videoId=resolved_video_id,
-        videoUrl=resolved_video_url,
-        title=result.title,
-        language=result.language,
-        source=result.source,
-        transcriptText=result.transcript_text,
-        segments=[segment.__dict__ for segment in result.segments],
-    )
-    body = success_response(data=data.model_dump(by_alias=True), request_id=request_id)
-    return JSONResponse(status_code=200, content=body)
+    # TranscriptResultData 모델을 거치지 않고 응답 키 그대로 만듭니다. (스키마는 OpenAPI 문서용)
+    data = {
+        "videoId": resolved_video_id,
+        "videoUrl": resolved_video_url,
+        "title": result.title,
+        "language": result.language,
+        "source": result.source,
+        "transcriptText": result.transcript_text,
+        "segments": [
+            {"text": segment.text, "start": float(segment.start), "duration": float(segment.duration)}
+            for segment in result.segments
+        ],
+    }
+    return conditional_success_response(data, request_id, if_none_match)
 
 @router.get(
     "/transcript",
@@ -159,6 +188,7 @@ def get_video_transcript(
     languages: str = Query(default="ko,en", alias="languages"),
     cookie_file_path: str = Query(default="", alias="cookieFilePath"),
     cookie_content: str = Query(default="", alias="cookieContent"),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
 ):
     return _build_transcript_response(
         video_id=video_id,
@@ -166,6 +196,7 @@ def get_video_transcript(
         languages=languages,
         cookie_file_path=cookie_file_path,
         cookie_content=cookie_content,
+        if_none_match=if_none_match,
     )
 
 
@@ -184,12 +215,116 @@ def post_video_transcript(payload: TranscriptRequest = Body(default_factory=Tran
     )
 
 
+SEARCH_UPSTREAM_ERRORS = (
+    SearchQuotaExceededError,
+    SearchRateLimitedError,
+    SearchUpstreamUnavailableError,
+    SearchUpstreamError,
+)
+
+
+SEARCH_STREAM_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _build_search_error_body(error: Exception, request_id: str) -> tuple[int, dict]:
+    if isinstance(error, SearchQuotaExceededError):
+        return 503, error_response(
+            code="SEARCH_QUOTA_EXCEEDED",
+            message="검색 한도에 도달했습니다. 잠시 후 다시 시도해 주세요.",
+            request_id=request_id,
+        )
+    if isinstance(error, SearchRateLimitedError):
+        return 503, error_response(
+            code="SEARCH_RATE_LIMITED",
+            message="검색 요청이 많아 잠시 지연되고 있습니다. 잠시 후 다시 시도해 주세요.",
+            request_id=request_id,
+        )
+    if isinstance(error, SearchUpstreamUnavailableError):
+        return 503, error_response(
+            code="SEARCH_UPSTREAM_UNAVAILABLE",
+            message="검색 서비스 연결이 원활하지 않습니다. 잠시 후 다시 시도해 주세요.",
+            request_id=request_id,
+        )
+    return 502, error_response(
+        code="SEARCH_UPSTREAM_ERROR",
+        message="검색 중 일시적인 오류가 발생했습니다. 잠시 후 다시 시도해 주세요.",
+        request_id=request_id,
+    )
+
+
+def _build_search_error_response(error: Exception, request_id: str) -> FastJSONResponse:
+    status_code, body = _build_search_error_body(error, request_id)
+    return FastJSONResponse(status_code=status_code, content=body)
+
+
+def _encode_stream_line(payload: dict) -> bytes:
+    return dumps_json(payload) + b"\n"
+
+
+async def _iter_search_stream_lines(
+    first_event: SearchStreamEvent,
+    events: AsyncIterator[SearchStreamEvent],
+    serialize: Callable[..., dict[str, object]],
+    item_fields: tuple[tuple[str, str], ...],
+    request_id: str,
+) -> AsyncIterator[bytes]:
+    """검색 이벤트를 NDJSON 줄로 바꿉니다.
+
+    - `{"type": "rows", "items": [...]}`: 페이지마다 점수화된 항목(최종 결과에 들지 못할 수도 있음)
+    - `{"type": "done", "order": [videoId, ...], "meta": {...}}`: 최종 정렬 순서(상위 resultLimit개)
+    - `{"type": "error", "error": {...}, "meta": {...}}`: 스트림 도중 upstream 오류
+    """
+    event = first_event
+    try:
+        while True:
+            if event.kind == "done":
+                yield _encode_stream_line(
+                    {
+                        "type": "done",
+                        "order": [record.video_id for record in event.records],
+                        "meta": build_meta(request_id=request_id),
+                    }
+                )
+                return
+            yield _encode_stream_line(
+                {"type": "rows", "items": [serialize(record, item_fields) for record in event.records]}
+            )
+            event = await anext(events)
+    except SEARCH_UPSTREAM_ERRORS as error:
+        _, body = _build_search_error_body(error, request_id)
+        yield _encode_stream_line({"type": "error", **body})
+    finally:
+        await events.aclose()
+
+
+def _build_search_page_response(
+    page: SearchResultPage,
+    request_id: str,
+    if_none_match: str | None,
+) -> Response:
+    serialize = serialize_raw_search_record if page.result_format == SearchResultFormat.RAW else serialize_search_record
+    data = {
+        "items": [serialize(record, page.item_fields) for record in page.records],
+        "nextCursor": page.next_cursor,
+        "totalCount": page.total_count,
+    }
+    return conditional_success_response(data, request_id, if_none_match)
+
+
+def _parse_user_api_keys(x_youtube_api_keys: str | None) -> list[str]:
+    return [key.strip() for key in (x_youtube_api_keys or "").split(",") if key.strip()]
+
+
 @router.get(
     "/videos",
     response_model=SearchSuccessResponse,
-    responses={400: {"model": SearchErrorResponse}},
+    responses={
+        200: {"content": {SEARCH_STREAM_MEDIA_TYPE: {}}},
+        400: {"model": SearchErrorResponse},
+        410: {"model": SearchErrorResponse},
+    },
 )
-def get_search_videos(
+async def get_search_videos(
     q: str = Query(default=""),
     channel: str = Query(default=""),
     sort: SearchSortOption = Query(default=SearchSortOption.SUBSCRIBER_ASC),
@@ -206,22 +341,65 @@ def get_search_videos(
     hover_metric: SearchHoverMetric = Query(default=SearchHoverMetric.VIDIQ_TREND, alias="hoverMetric"),
     min_performance: int = Query(default=0, alias="minPerformance", ge=0),
     core_preset: SearchCorePreset = Query(default=SearchCorePreset.NONE, alias="corePreset"),
+    result_format: SearchResultFormat = Query(default=SearchResultFormat.DISPLAY, alias="format"),
+    fields: str = Query(default="", description="응답에 담을 항목 필드(camelCase, 쉼표 구분). 비우면 전체 필드"),
+    page_size: int = Query(
+        default=0,
+        alias="pageSize",
+        ge=0,
+        le=250,
+        description="0보다 크면 정렬된 결과를 서버에 잠시 보관하고 이 크기만큼 나눠 nextCursor와 함께 돌려줍니다.",
+    ),
+    cursor: str = Query(default="", description="이전 응답의 nextCursor. 주면 다른 검색 조건은 무시하고 보관된 결과의 다음 페이지를 돌려줍니다."),
     x_youtube_api_keys: str | None = Header(default=None, alias="X-YouTube-Api-Keys"),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    accept: str = Header(default="", description=f"`{SEARCH_STREAM_MEDIA_TYPE}`이면 페이지별 결과를 NDJSON으로 스트리밍합니다."),
 ):
     request_id = f"req_{uuid4().hex[:12]}"
 
+    if cursor.strip():
+        try:
+            page = read_search_result_page(cursor, page_size)
+        except SearchCursorInvalidError:
+            body = error_response(
+                code="SEARCH_INVALID_CURSOR",
+                message="cursor 값이 올바르지 않습니다.",
+                request_id=request_id,
+            )
+            return FastJSONResponse(status_code=400, content=body)
+        except SearchCursorExpiredError:
+            body = error_response(
+                code="SEARCH_CURSOR_EXPIRED",
+                message="검색 결과가 만료되었습니다. 처음부터 다시 검색해 주세요.",
+                request_id=request_id,
+            )
+            return FastJSONResponse(status_code=410, content=body)
+        return _build_search_page_response(page, request_id, if_none_match)
+
     if q.strip() == "" and channel.strip() == "":
         body = error_response(
             code="SEARCH_QUERY_REQUIRED",
             message="키워드 또는 채널명을 하나 이상 입력해 주세요.",
             request_id=request_id,
         )
-        return JSONResponse(status_code=400, content=body)
-
-    user_api_keys = [key.strip() for key in (x_youtube_api_keys or "").split(",") if key.strip()]
+        return FastJSONResponse(status_code=400, content=body)
 
     try:
-        records = search_videos(
+        item_fields = select_search_item_fields(result_format, fields)
+    except ValueError as error:
+        body = error_response(
+            code="SEARCH_INVALID_FIELDS",
+            message=f"지원하지 않는 fields 값입니다: {error}",
+            request_id=request_id,
+        )
+        return FastJSONResponse(status_code=400, content=body)
+    requested_fields = frozenset(name for name, _ in item_fields) if fields.strip() else None
+
+    user_api_keys = _parse_user_api_keys(x_youtube_api_keys)
+    serialize = serialize_raw_search_record if result_format == SearchResultFormat.RAW else serialize_search_record
+
+    if SEARCH_STREAM_MEDIA_TYPE in accept:
+        events = stream_search_videos_async(
             keyword=q,
             channel=channel,
             sort=sort,
@@ -238,81 +416,107 @@ def get_search_videos(
             min_performance=min_performance,
             core_preset=core_preset,
             user_api_keys=user_api_keys,
+            result_format=result_format,
+            fields=requested_fields,
         )
-    except SearchQuotaExceededError:
-        body = error_response(
-            code="SEARCH_QUOTA_EXCEEDED",
-            message="검색 한도에 도달했습니다. 잠시 후 다시 시도해 주세요.",
-            request_id=request_id,
+        # 첫 이벤트 전에 난 오류는 스트림을 열기 전이므로 일반 에러 응답(상태 코드 포함)으로 돌려줍니다.
+        try:
+            first_event = await anext(events)
+        except SEARCH_UPSTREAM_ERRORS as error:
+            return _build_search_error_response(error, request_id)
+        return StreamingResponse(
+            _iter_search_stream_lines(first_event, events, serialize, item_fields, request_id),
+            media_type=SEARCH_STREAM_MEDIA_TYPE,
         )
-        return JSONResponse(status_code=503, content=body)
-    except SearchRateLimitedError:
-        body = error_response(
-            code="SEARCH_RATE_LIMITED",
-            message="검색 요청이 많아 잠시 지연되고 있습니다. 잠시 후 다시 시도해 주세요.",
-            request_id=request_id,
+
+    try:
+        records = await search_videos_async(
+            keyword=q,
+            channel=channel,
+            sort=sort,
+            period=period,
+            topic=topic,
+            result_limit=result_limit,
+            min_views=min_views,
+            country=country,
+            max_subscribers=max_subscribers,
+            subscriber_public_only=subscriber_public_only,
+            duration_bucket=duration_bucket,
+            short_form_type=short_form_type,
+            script_type=script_type,
+            min_performance=min_performance,
+            core_preset=core_preset,
+            user_api_keys=user_api_keys,
+            result_format=result_format,
+            fields=requested_fields,
         )
-        return JSONResponse(status_code=503, content=body)
-    except SearchUpstreamUnavailableError:
-        body = error_response(
-            code="SEARCH_UPSTREAM_UNAVAILABLE",
-            message="검색 서비스 연결이 원활하지 않습니다. 잠시 후 다시 시도해 주세요.",
-            request_id=request_id,
+    except SEARCH_UPSTREAM_ERRORS as error:
+        return _build_search_error_response(error, request_id)
+
+    if page_size:
+        page = start_search_result_pages(
+            records,
+            result_format=result_format,
+            item_fields=item_fields,
+            page_size=page_size,
         )
-        return JSONResponse(status_code=503, content=body)
-    except SearchUpstreamError:
+        return _build_search_page_response(page, request_id, if_none_match)
+
+    # response_model 재검증을 거치지 않도록 직렬화한 본문을 바로 돌려줍니다. 결과가 같으면 ETag도 같습니다.
+    items = [serialize(record, item_fields) for record in records]
+    return conditional_success_response({"items": items}, request_id, if_none_match)
+
+
+@router.post(
+    "/videos/batch",
+    response_model=SearchBatchSuccessResponse,
+    responses={400: {"model": SearchErrorResponse}, 502: {"model": SearchErrorResponse}, 503: {"model": SearchErrorResponse}},
+)
+async def post_search_videos_batch(
+    payload: SearchBatchRequest = Body(...),
+    x_youtube_api_keys: str | None = Header(default=None, alias="X-YouTube-Api-Keys"),
+):
+    request_id = f"req_{uuid4().hex[:12]}"
+
+    if not any(keyword.strip() for keyword in payload.keywords) and not any(
+        channel.strip() for channel in payload.channels
+    ):
         body = error_response(
-            code="SEARCH_UPSTREAM_ERROR",
-            message="검색 중 일시적인 오류가 발생했습니다. 잠시 후 다시 시도해 주세요.",
+            code="SEARCH_QUERY_REQUIRED",
+            message="키워드 또는 채널명을 하나 이상 입력해 주세요.",
             request_id=request_id,
         )
-        return JSONResponse(status_code=502, content=body)
-
-    items = [
-        SearchResultItem(
-            videoId=record.video_id,
-            title=record.title,
-            channelName=record.channel_name,
-            thumbnailUrl=record.thumbnail_url,
-            durationText=record.duration_text,
-            publishedDateText=record.published_date_text,
-            viewCount=record.view_count,
-            viewCountText=record.view_count_text,
-            subscriberCount=record.subscriber_count,
-            subscriberCountText=record.subscriber_count_text,
-            likeCount=record.like_count,
-            commentCount=record.comment_count,
-            channelPublishedDateText=record.channel_published_date_text,
-            countryCode=record.country_code,
-            totalVideoCountText=record.total_video_count_text,
-            subscriptionRateText=record.subscription_rate_text,
-            annualSubscriberGrowthText=record.annual_subscriber_growth_text,
-            uploadsPerWeekText=record.uploads_per_week_text,
-            channelGrade=record.channel_grade,
-            isShortForm=record.is_short_form,
-            hasScript=record.has_script,
-            isSubscriberPublic=record.is_subscriber_public,
-            keywordMatchedTerms=record.keyword_matched_terms,
-            contribution=record.contribution,
-            contributionGrade=record.contribution_grade,
-            engagementRate=record.engagement_rate,
-            performanceScore=record.performance_score,
-            exposureScore=record.exposure_score,
-            isHotVideo=record.is_hot_video,
-            recommendationReason=record.recommendation_reason,
-            estimatedRevenueTotalText=record.estimated_revenue_total_text,
-            vphText=record.vph_text,
-            badgeLabel=record.badge_label,
+        return FastJSONResponse(status_code=400, content=body)
+
+    try:
+        records = await search_videos_batch_async(
+            keywords=payload.keywords,
+            channels=payload.channels,
+            sort=payload.sort,
+            period=payload.period,
+            topic=payload.topic,
+            result_limit=payload.result_limit,
+            min_views=payload.min_views,
+            country=payload.country,
+            max_subscribers=payload.max_subscribers,
+            subscriber_public_only=payload.subscriber_public_only,
+            duration_bucket=payload.duration_bucket,
+            short_form_type=payload.short_form_type,
+            script_type=payload.script_type,
+            min_performance=payload.min_performance,
+            core_preset=payload.core_preset,
+            user_api_keys=_parse_user_api_keys(x_youtube_api_keys),
         )
-        for record in records
-    ]
+    except SEARCH_UPSTREAM_ERRORS as error:
+        return _build_search_error_response(error, request_id)
 
-    data = SearchResultData(items=items)
-    return success_response(data=data.model_dump(by_alias=True), request_id=request_id)
+    items = [serialize_search_record(record, SEARCH_BATCH_RESULT_ITEM_FIELDS) for record in records]
+    body = success_response(data={"items": items}, request_id=request_id)
+    return FastJSONResponse(status_code=200, content=body)
 
 
 @router.get("/transcript/health")
 def get_transcript_health():
     payload = build_transcript_health()
     payload["meta"] = build_meta()
-    return JSONResponse(status_code=200, content=payload)
+    return FastJSONResponse(status_code=200, content=payload)
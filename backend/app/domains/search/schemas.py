@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Literal
@@ -60,6 +61,11 @@ class SearchHoverMetric(str, Enum):
     ESTIMATED_REVENUE = "estimatedRevenue"
 
 
+class SearchResultFormat(str, Enum):
+    DISPLAY = "display"
+    RAW = "raw"
+
+
 class SearchTopicOption(str, Enum):
     ALL = "all"
     SHOPPING = "shopping"
@@ -129,8 +135,44 @@ class SearchResultItem(BaseModel):
     badge_label: str | None = Field(default=None, alias="badgeLabel")
 
 
+class SearchRawResultItem(BaseModel):
+    """`format=raw` 응답 항목. 표시용 문자열 없이 원본 수치만 담습니다(포맷은 클라이언트에서)."""
+
+    video_id: str = Field(..., alias="videoId")
+    title: str
+    channel_name: str = Field(..., alias="channelName")
+    thumbnail_url: str = Field(..., alias="thumbnailUrl")
+    duration_seconds: int = Field(..., alias="durationSeconds")
+    published_at: datetime = Field(..., alias="publishedAt")
+    view_count: int = Field(..., alias="viewCount")
+    subscriber_count: int = Field(..., alias="subscriberCount")
+    like_count: int = Field(..., alias="likeCount")
+    comment_count: int = Field(..., alias="commentCount")
+    channel_published_at: datetime = Field(..., alias="channelPublishedAt")
+    country_code: str = Field(..., alias="countryCode")
+    total_video_count: int = Field(..., alias="totalVideoCount")
+    subscription_rate: float = Field(..., alias="subscriptionRate")
+    annual_subscriber_growth: int = Field(..., alias="annualSubscriberGrowth")
+    uploads_per_week: float = Field(..., alias="uploadsPerWeek")
+    channel_grade: str = Field(..., alias="channelGrade")
+    is_short_form: bool = Field(..., alias="isShortForm")
+    has_script: bool = Field(..., alias="hasScript")
+    is_subscriber_public: bool = Field(..., alias="isSubscriberPublic")
+    keyword_matched_terms: list[str] = Field(..., alias="keywordMatchedTerms")
+    contribution: float | None = None
+    contribution_grade: str = Field(..., alias="contributionGrade")
+    engagement_rate: float | None = Field(default=None, alias="engagementRate")
+    performance_score: float = Field(..., alias="performanceScore")
+    exposure_score: float = Field(..., alias="exposureScore")
+    is_hot_video: bool = Field(..., alias="isHotVideo")
+    badge_label: str | None = Field(default=None, alias="badgeLabel")
+
+
 class SearchResultData(BaseModel):
-    items: list[SearchResultItem]
+    items: list[SearchResultItem] | list[SearchRawResultItem]
+    # pageSize/cursor로 요청했을 때만 채워집니다. nextCursor가 없으면 마지막 페이지입니다.
+    next_cursor: str | None = Field(default=None, alias="nextCursor")
+    total_count: int | None = Field(default=None, alias="totalCount")
 
 
 class SearchSuccessResponse(BaseModel):
@@ -139,6 +181,41 @@ class SearchSuccessResponse(BaseModel):
     meta: SearchResponseMeta
 
 
+SEARCH_BATCH_MAX_QUERIES = 20
+
+
+class SearchBatchRequest(BaseModel):
+    keywords: list[str] = Field(default_factory=list, max_length=SEARCH_BATCH_MAX_QUERIES)
+    channels: list[str] = Field(default_factory=list, max_length=SEARCH_BATCH_MAX_QUERIES)
+    sort: SearchSortOption = SearchSortOption.SUBSCRIBER_ASC
+    topic: SearchTopicOption = SearchTopicOption.ALL
+    result_limit: int = Field(default=250, alias="resultLimit", ge=1, le=250)
+    period: SearchPeriodOption = SearchPeriodOption.LAST_7_DAYS
+    min_views: int = Field(default=0, alias="minViews", ge=0)
+    country: str = Field(default="", max_length=2)
+    max_subscribers: int = Field(default=0, alias="maxSubscribers", ge=0)
+    subscriber_public_only: bool = Field(default=False, alias="subscriberPublicOnly")
+    duration_bucket: SearchDurationBucket = Field(default=SearchDurationBucket.ALL, alias="durationBucket")
+    short_form_type: SearchShortFormType = Field(default=SearchShortFormType.ALL, alias="shortFormType")
+    script_type: SearchScriptType = Field(default=SearchScriptType.ALL, alias="scriptType")
+    min_performance: int = Field(default=0, alias="minPerformance", ge=0)
+    core_preset: SearchCorePreset = Field(default=SearchCorePreset.NONE, alias="corePreset")
+
+
+class SearchBatchResultItem(SearchResultItem):
+    matched_queries: list[str] = Field(..., alias="matchedQueries")
+
+
+class SearchBatchResultData(BaseModel):
+    items: list[SearchBatchResultItem]
+
+
+class SearchBatchSuccessResponse(BaseModel):
+    success: Literal[True]
+    data: SearchBatchResultData
+    meta: SearchResponseMeta
+
+
 class SearchErrorResponse(BaseModel):
     success: Literal[False]
     error: SearchResponseError
@@ -189,44 +266,107 @@ class TranscriptErrorResponse(BaseModel):
     meta: SearchResponseMeta
 
 
-class SearchVideoRecord(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class SearchVideoRecord:
+    """검색 서비스 내부 결과 행. 검증 없이 만들고, 응답 직렬화는 serialize_search_record가 한 번에 합니다.
+
+    `*_text`, recommendation_reason 등 표시용 필드는 응답할 행에만 마지막 단계에서 채웁니다(raw 형식이면 비워 둠).
+    """
+
     video_id: str
     title: str
     channel_name: str
     thumbnail_url: str
     duration_seconds: int
-    duration_text: str
     published_at: datetime
-    published_date_text: str
     view_count: int
-    view_count_text: str
     subscriber_count: int
-    subscriber_count_text: str
     like_count: int
     comment_count: int
     channel_published_at: datetime
-    channel_published_date_text: str
     country_code: str
     total_video_count: int
-    total_video_count_text: str
     subscription_rate: float
-    subscription_rate_text: str
     annual_subscriber_growth: int
-    annual_subscriber_growth_text: str
     uploads_per_week: float
-    uploads_per_week_text: str
     channel_grade: str
     is_short_form: bool
     has_script: bool
     is_subscriber_public: bool
-    keyword_matched_terms: list[str]
     contribution: float | None = None
     contribution_grade: str
     engagement_rate: float | None = None
     performance_score: float
     exposure_score: float
     is_hot_video: bool
-    recommendation_reason: str
+    badge_label: str | None = None
+    keyword_matched_terms: list[str] = field(default_factory=list)
+    matched_queries: list[str] = field(default_factory=list)
+    duration_text: str = ""
+    published_date_text: str = ""
+    view_count_text: str = ""
+    subscriber_count_text: str = ""
+    channel_published_date_text: str = ""
+    total_video_count_text: str = ""
+    subscription_rate_text: str = ""
+    annual_subscriber_growth_text: str = ""
+    uploads_per_week_text: str = ""
+    recommendation_reason: str = ""
     estimated_revenue_total_text: str | None = None
     vph_text: str | None = None
-    badge_label: str | None = None
+
+
+# SearchResultItem은 OpenAPI 문서용이고, 실제 응답은 이 매핑으로 한 번에 직렬화합니다.
+SEARCH_RESULT_ITEM_FIELDS: tuple[tuple[str, str], ...] = tuple(
+    (name, model_field.alias or name) for name, model_field in SearchResultItem.model_fields.items()
+)
+
+SEARCH_RAW_RESULT_ITEM_FIELDS: tuple[tuple[str, str], ...] = tuple(
+    (name, model_field.alias or name) for name, model_field in SearchRawResultItem.model_fields.items()
+)
+
+SEARCH_BATCH_RESULT_ITEM_FIELDS: tuple[tuple[str, str], ...] = tuple(
+    (name, model_field.alias or name) for name, model_field in SearchBatchResultItem.model_fields.items()
+)
+
+
+def _format_utc_timestamp(value: datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+
+def select_search_item_fields(result_format: SearchResultFormat, requested: str) -> tuple[tuple[str, str], ...]:
+    """`fields=` 쿼리(camelCase, 쉼표 구분)를 (레코드 속성명, 응답 키) 목록으로 바꿉니다.
+
+    비어 있으면 형식의 전체 필드를, 아니면 요청한 필드 + videoId를 응답 순서대로 돌려줍니다.
+    모르는 필드가 있으면 ValueError를 냅니다.
+    """
+    available = SEARCH_RAW_RESULT_ITEM_FIELDS if result_format == SearchResultFormat.RAW else SEARCH_RESULT_ITEM_FIELDS
+    requested_aliases = {alias.strip() for alias in requested.split(",") if alias.strip()}
+    if not requested_aliases:
+        return available
+
+    unknown_aliases = requested_aliases - {alias for _, alias in available}
+    if unknown_aliases:
+        raise ValueError(", ".join(sorted(unknown_aliases)))
+
+    requested_aliases.add("videoId")
+    return tuple((name, alias) for name, alias in available if alias in requested_aliases)
+
+
+def serialize_search_record(
+    record: SearchVideoRecord,
+    fields: tuple[tuple[str, str], ...] = SEARCH_RESULT_ITEM_FIELDS,
+) -> dict[str, object]:
+    return {alias: getattr(record, name) for name, alias in fields}
+
+
+def serialize_raw_search_record(
+    record: SearchVideoRecord,
+    fields: tuple[tuple[str, str], ...] = SEARCH_RAW_RESULT_ITEM_FIELDS,
+) -> dict[str, object]:
+    item: dict[str, object] = {alias: getattr(record, name) for name, alias in fields}
+    if "publishedAt" in item:
+        item["publishedAt"] = _format_utc_timestamp(record.published_at)
+    if "channelPublishedAt" in item:
+        item["channelPublishedAt"] = _format_utc_timestamp(record.channel_published_at)
+    return item
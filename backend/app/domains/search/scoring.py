@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 import math
 import re
 
+import numpy as np
+
 CONTRIBUTION_WEIGHT = 0.4
 ENGAGEMENT_WEIGHT = 0.35
 VIEW_WEIGHT = 0.25
@@ -157,3 +161,184 @@ def is_hot_video(contribution: float | None, exposure_score: float) -> bool:
     if contribution is None:
         return False
     return contribution >= HOT_VIDEO_CONTRIBUTION_THRESHOLD and exposure_score >= HOT_VIDEO_EXPOSURE_THRESHOLD
+
+
+# ---------------------------------------------------------------------------
+# 배치(컬럼) 점수 계산
+#
+# 위 스칼라 함수들과 같은 연산 순서로 계산해 결과가 비트 단위까지 같도록 맞춥니다.
+# 값이 없는 contribution/engagement_rate는 NaN으로 표현합니다.
+# ---------------------------------------------------------------------------
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECONDS_PER_DAY = 86_400 * 1_000_000
+
+
+def to_epoch_microseconds(values: Sequence[datetime]) -> np.ndarray:
+    """datetime 목록을 UTC epoch 마이크로초(int64) 배열로 바꿉니다. naive 값은 UTC로 간주합니다."""
+    return np.array(
+        [(_safe_utc_now(value) - _EPOCH) // timedelta(microseconds=1) for value in values],
+        dtype=np.int64,
+    )
+
+
+def _clamp_array(values: np.ndarray, minimum: float = 0.0, maximum: float = 100.0) -> np.ndarray:
+    return np.maximum(minimum, np.minimum(maximum, values))
+
+
+def _normalize_zero_to_one_array(values: np.ndarray, scale: float) -> np.ndarray:
+    if scale <= 0:
+        return np.zeros_like(values, dtype=np.float64)
+    return _clamp_array((values / scale) * 100.0) / 100.0
+
+
+def _log10_exact(values: np.ndarray) -> np.ndarray:
+    # np.log10은 빌드(SIMD)에 따라 math.log10과 마지막 비트가 다를 수 있어 고유값마다 math.log10을 씁니다.
+    unique_values, inverse = np.unique(values, return_inverse=True)
+    logs = np.array([math.log10(value) for value in unique_values.tolist()], dtype=np.float64)
+    return logs[inverse]
+
+
+@dataclass(frozen=True)
+class PerformanceColumns:
+    contribution: np.ndarray
+    engagement_rate: np.ndarray
+    performance_score: np.ndarray
+
+
+def compute_performance_columns(
+    *,
+    view_counts: np.ndarray,
+    subscriber_counts: np.ndarray,
+    is_subscriber_public: np.ndarray,
+    like_counts: np.ndarray,
+    comment_counts: np.ndarray,
+) -> PerformanceColumns:
+    """compute_contribution / compute_engagement_rate / compute_performance_score의 배치 버전."""
+    views = np.asarray(view_counts, dtype=np.float64)
+    subscribers = np.asarray(subscriber_counts, dtype=np.float64)
+    likes = np.asarray(like_counts, dtype=np.float64)
+    comments = np.asarray(comment_counts, dtype=np.float64)
+    is_public = np.asarray(is_subscriber_public, dtype=bool)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        has_contribution = is_public & (subscribers > 0)
+        contribution = np.where(has_contribution, (np.maximum(views, 0.0) / subscribers) * 100.0, np.nan)
+
+        has_engagement = (views > 0) & ~((likes <= 0) & (comments <= 0))
+        total_reaction = np.maximum(likes, 0.0) + np.maximum(comments, 0.0)
+        engagement_rate = np.where(has_engagement, (total_reaction / views) * 100.0, np.nan)
+
+        total_weight = np.where(has_contribution, CONTRIBUTION_WEIGHT, 0.0)
+        total_weight = total_weight + np.where(has_engagement, ENGAGEMENT_WEIGHT, 0.0)
+        total_weight = total_weight + VIEW_WEIGHT
+
+        view_component = _clamp_array(25.0 * _log10_exact(np.maximum(views, 0.0) + 1))
+
+        score = np.where(has_contribution, (CONTRIBUTION_WEIGHT / total_weight) * _clamp_array(contribution), 0.0)
+        score = score + np.where(
+            has_engagement,
+            (ENGAGEMENT_WEIGHT / total_weight) * _clamp_array(engagement_rate * 10.0),
+            0.0,
+        )
+        score = score + (VIEW_WEIGHT / total_weight) * view_component
+
+    return PerformanceColumns(
+        contribution=contribution,
+        engagement_rate=engagement_rate,
+        performance_score=_clamp_array(score),
+    )
+
+
+def compute_exposure_columns(
+    *,
+    keyword: str | Sequence[str],
+    titles: Sequence[str],
+    subscriber_counts: np.ndarray,
+    engagement_rates: np.ndarray,
+    total_video_counts: np.ndarray,
+    published_at_us: np.ndarray,
+    now: datetime | None = None,
+) -> np.ndarray:
+    """compute_exposure_score의 배치 버전. 키워드 토큰화와 기준 시각 계산은 한 번만 합니다.
+
+    keyword에 행마다 다른 키워드 목록을 주면(다중 키워드 검색) 행별 키워드로 일치율을 계산합니다.
+    """
+    row_keywords = [keyword] * len(titles) if isinstance(keyword, str) else list(keyword)
+    tokens_by_keyword: dict[str, list[str]] = {}
+    match_ratios: list[float] = []
+    for row_keyword, title in zip(row_keywords, titles):
+        keyword_tokens = tokens_by_keyword.get(row_keyword)
+        if keyword_tokens is None:
+            keyword_tokens = tokens_by_keyword.setdefault(row_keyword, _tokenize_text(row_keyword))
+        if len(keyword_tokens) == 0:
+            match_ratios.append(0.0)
+            continue
+        title_text = " ".join(_tokenize_text(title))
+        matched_count = sum(1 for token in keyword_tokens if token in title_text)
+        match_ratios.append(matched_count / len(keyword_tokens))
+    keyword_match_ratio = np.array(match_ratios, dtype=np.float64)
+
+    keyword_score = _clamp_array(keyword_match_ratio * 100.0) * (EXPOSURE_KEYWORD_WEIGHT / 100.0)
+
+    subscribers = np.maximum(np.asarray(subscriber_counts, dtype=np.float64), 0.0)
+    channel_weakness_score = (
+        (1.0 - _normalize_zero_to_one_array(subscribers, CHANNEL_WEAKNESS_SUBSCRIBER_SCALE))
+        * 100.0
+        * (EXPOSURE_CHANNEL_WEAKNESS_WEIGHT / 100.0)
+    )
+
+    rates = np.asarray(engagement_rates, dtype=np.float64)
+    engagement_base = np.where(np.isnan(rates), 0.0, np.maximum(rates, 0.0))
+    engagement_weakness_score = (
+        (1.0 - _normalize_zero_to_one_array(engagement_base, ENGAGEMENT_WEAKNESS_RATE_SCALE))
+        * 100.0
+        * (EXPOSURE_ENGAGEMENT_WEAKNESS_WEIGHT / 100.0)
+    )
+
+    video_counts = np.maximum(np.asarray(total_video_counts, dtype=np.float64), 0.0)
+    channel_experience_score = (
+        (1.0 - _normalize_zero_to_one_array(video_counts, CHANNEL_EXPERIENCE_VIDEO_SCALE))
+        * 100.0
+        * (EXPOSURE_CHANNEL_EXPERIENCE_WEIGHT / 100.0)
+    )
+
+    now_us = (_safe_utc_now(now) - _EPOCH) // timedelta(microseconds=1)
+    age_days = np.maximum((now_us - np.asarray(published_at_us, dtype=np.int64)) // _MICROSECONDS_PER_DAY, 0)
+    age_score = (
+        _normalize_zero_to_one_array(age_days.astype(np.float64), VIDEO_AGE_DAY_SCALE)
+        * 100.0
+        * (EXPOSURE_VIDEO_AGE_WEIGHT / 100.0)
+    )
+
+    return _clamp_array(
+        keyword_score + channel_weakness_score + engagement_weakness_score + channel_experience_score + age_score
+    )
+
+
+def classify_contribution_grades(contributions: np.ndarray) -> list[str]:
+    values = np.asarray(contributions, dtype=np.float64)
+    grades = np.select(
+        [
+            np.isnan(values),
+            values >= VERY_GOOD_CONTRIBUTION_THRESHOLD,
+            values >= GOOD_CONTRIBUTION_THRESHOLD,
+            values >= NORMAL_CONTRIBUTION_THRESHOLD,
+        ],
+        ["N/A", "Very Good", "Good", "Normal"],
+        default="Bad",
+    )
+    return grades.tolist()
+
+
+def is_hot_video_columns(contributions: np.ndarray, exposure_scores: np.ndarray) -> np.ndarray:
+    values = np.asarray(contributions, dtype=np.float64)
+    return (
+        ~np.isnan(values)
+        & (np.nan_to_num(values, nan=0.0) >= HOT_VIDEO_CONTRIBUTION_THRESHOLD)
+        & (np.asarray(exposure_scores) >= HOT_VIDEO_EXPOSURE_THRESHOLD)
+    )
+
+
+def nan_to_none(values: np.ndarray) -> list[float | None]:
+    return [None if math.isnan(value) else value for value in values.tolist()]
@@ -1,26 +1,61 @@
 from __future__ import annotations
 
+import heapq
+import logging
+import os
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Literal
 
-from .client import YouTubeSearchClient
+import numpy as np
+
+from .cache import TtlLruCache, read_cache_settings
+from .client import SearchUpstreamUnavailableError, UpstreamQueryKey, YouTubeSearchClient, YoutubeVideoRaw
+from .coalescing import SingleFlight
 from .scoring import (
-    classify_contribution_grade,
-    compute_contribution,
-    compute_engagement_rate,
-    compute_exposure_score,
-    compute_performance_score,
-    is_hot_video,
+    classify_contribution_grades,
+    compute_exposure_columns,
+    compute_performance_columns,
+    is_hot_video_columns,
+    nan_to_none,
+    to_epoch_microseconds,
 )
 from .schemas import (
     SearchCorePreset,
     SearchDurationBucket,
     SearchPeriodOption,
+    SearchResultFormat,
     SearchScriptType,
     SearchShortFormType,
     SearchSortOption,
     SearchTopicOption,
     SearchVideoRecord,
 )
+from .taxonomy import classify_title
+from .transport import run_with_blocking_transport
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUERY_CACHE_TTL_SECONDS = 300
+DEFAULT_QUERY_CACHE_MAX_ENTRIES = 500
+DEFAULT_QUERY_CACHE_STALE_SECONDS = 1800
+
+_query_cache_ttl_seconds, _query_cache_max_entries = read_cache_settings(
+    "YOUTUBE_QUERY_CACHE",
+    default_ttl_seconds=DEFAULT_QUERY_CACHE_TTL_SECONDS,
+    default_max_entries=DEFAULT_QUERY_CACHE_MAX_ENTRIES,
+)
+# 필터/정렬 변경은 YouTube 호출 없이 같은 원본 행에 다시 적용할 수 있도록 원본 행을 보관합니다.
+# YouTube 장애(circuit open 포함) 때는 만료 후 stale_seconds 이내의 행으로 대신 응답합니다.
+shared_query_cache: TtlLruCache[UpstreamQueryKey, tuple[YoutubeVideoRaw, ...]] = TtlLruCache(
+    ttl_seconds=_query_cache_ttl_seconds,
+    max_entries=_query_cache_max_entries,
+    stale_seconds=float(os.getenv("YOUTUBE_QUERY_CACHE_STALE_SECONDS", str(DEFAULT_QUERY_CACHE_STALE_SECONDS))),
+)
+# 공유 대시보드처럼 같은 검색이 동시에 몰려도 YouTube 호출은 한 번만 나가도록 묶습니다.
+# 키 집합이 다르면 할당량 초과/잘못된 키 같은 실패도 달라지므로 키 지문이 같은 호출끼리만 묶습니다.
+shared_search_flights: SingleFlight[tuple[UpstreamQueryKey, str], tuple[YoutubeVideoRaw, ...]] = SingleFlight()
 
 
 def _format_view_count_text(view_count: int) -> str:
@@ -76,46 +111,58 @@ def _collect_keyword_matches(keyword: str, title: str) -> list[str]:
     return matched
 
 
-def _normalize_scores(records: list[SearchVideoRecord], accessor: str) -> dict[str, float]:
-    values = [getattr(record, accessor) for record in records]
-    minimum = min(values)
-    maximum = max(values)
+def _collect_multi_keyword_matches(keywords: list[str], title: str) -> list[str]:
+    matched: list[str] = []
+    for keyword in keywords:
+        for term in _collect_keyword_matches(keyword, title):
+            if term not in matched:
+                matched.append(term)
+    return matched
 
-    if minimum == maximum:
-        return {record.video_id: 100.0 for record in records}
 
-    result: dict[str, float] = {}
-    for record in records:
-        value = getattr(record, accessor)
-        normalized = ((value - minimum) / (maximum - minimum)) * 100.0
-        result[record.video_id] = normalized
-    return result
+def _normalize_score_column(values: np.ndarray) -> np.ndarray:
+    minimum = values.min()
+    maximum = values.max()
+    if minimum == maximum:
+        return np.full(len(values), 100.0)
+    return ((values - minimum) / (maximum - minimum)) * 100.0
 
 
-def _sort_records(records: list[SearchVideoRecord], sort: SearchSortOption) -> list[SearchVideoRecord]:
-    if len(records) == 0:
-        return records
+def _select_top_records(
+    records: list[SearchVideoRecord],
+    sort: SearchSortOption,
+    limit: int,
+) -> list[SearchVideoRecord]:
+    """정렬 기준 상위 limit개만 고릅니다. `sorted(...)[:limit]`과 같은 결과(동률 순서 포함)를 돌려줍니다."""
+    if len(records) == 0 or limit <= 0:
+        return []
 
     if sort == SearchSortOption.SUBSCRIBER_ASC:
-        return sorted(records, key=lambda record: (record.subscriber_count, -record.view_count, -record.published_at.timestamp()))
+        return heapq.nsmallest(
+            limit,
+            records,
+            key=lambda record: (record.subscriber_count, -record.view_count, -record.published_at.timestamp()),
+        )
     if sort == SearchSortOption.VIEWS:
-        return sorted(records, key=lambda record: (record.view_count, record.published_at), reverse=True)
+        return heapq.nlargest(limit, records, key=lambda record: (record.view_count, record.published_at))
     if sort == SearchSortOption.LATEST:
-        return sorted(records, key=lambda record: record.published_at, reverse=True)
+        return heapq.nlargest(limit, records, key=lambda record: record.published_at)
     if sort == SearchSortOption.PERFORMANCE_ONLY:
-        return sorted(records, key=lambda record: (record.performance_score, record.published_at), reverse=True)
+        return heapq.nlargest(limit, records, key=lambda record: (record.performance_score, record.published_at))
     if sort == SearchSortOption.OPPORTUNITY_ONLY:
-        return sorted(records, key=lambda record: (record.exposure_score, record.published_at), reverse=True)
+        return heapq.nlargest(limit, records, key=lambda record: (record.exposure_score, record.published_at))
     if sort == SearchSortOption.RECOMMENDED:
-        normalized_performance = _normalize_scores(records, "performance_score")
-        normalized_exposure = _normalize_scores(records, "exposure_score")
-
-        def _hot_score(record: SearchVideoRecord) -> float:
-            return (0.45 * normalized_performance[record.video_id]) + (0.55 * normalized_exposure[record.video_id])
-
-        return sorted(records, key=lambda record: (_hot_score(record), record.published_at), reverse=True)
+        normalized_performance = _normalize_score_column(np.array([record.performance_score for record in records]))
+        normalized_exposure = _normalize_score_column(np.array([record.exposure_score for record in records]))
+        hot_scores = ((0.45 * normalized_performance) + (0.55 * normalized_exposure)).tolist()
+        top_indexes = heapq.nlargest(
+            limit,
+            range(len(records)),
+            key=lambda index: (hot_scores[index], records[index].published_at),
+        )
+        return [records[index] for index in top_indexes]
 
-    return records
+    return records[:limit]
 
 
 def _match_duration(duration_seconds: int, duration_bucket: SearchDurationBucket) -> bool:
@@ -128,30 +175,12 @@ def _match_duration(duration_seconds: int, duration_bucket: SearchDurationBucket
     return True
 
 
-def _match_short_form(title: str, short_form_type: SearchShortFormType) -> bool:
+def _match_short_form(title_labels: frozenset[str], short_form_type: SearchShortFormType) -> bool:
     if short_form_type == SearchShortFormType.ALL:
         return True
-
-    lowered = title.lower()
-    keyword_map: dict[SearchShortFormType, tuple[str, ...]] = {
-        SearchShortFormType.SHOPPING: ("공구", "꿀템", "추천템", "리뷰"),
-        SearchShortFormType.CLIP: ("짤", "명장면", "하이라이트"),
-        SearchShortFormType.GAME: ("게임", "플레이", "공략"),
-        SearchShortFormType.FOOD: ("요리", "먹방", "asmr", "레시피"),
-        SearchShortFormType.ANIMAL: ("동물", "강아지", "고양이", "귀요미"),
-        SearchShortFormType.KNOWLEDGE: ("지식", "상식", "1분", "공부"),
-        SearchShortFormType.BEAUTY: ("뷰티", "패션", "ootd", "메이크업"),
-        SearchShortFormType.SPORTS: ("스포츠", "운동", "헬스", "축구"),
-        SearchShortFormType.ENTERTAINMENT: ("연예", "아이돌", "k-pop", "예능"),
-        SearchShortFormType.OTHER: (),
-        SearchShortFormType.ALL: (),
-    }
-
     if short_form_type == SearchShortFormType.OTHER:
-        known = [word for option, words in keyword_map.items() if option not in {SearchShortFormType.ALL, SearchShortFormType.OTHER} for word in words]
-        return not any(word in lowered for word in known)
-
-    return any(word in lowered for word in keyword_map.get(short_form_type, ()))
+        return not title_labels
+    return short_form_type.value in title_labels
 
 
 def _match_script(has_script: bool, script_type: SearchScriptType) -> bool:
@@ -205,31 +234,12 @@ def _match_core_preset(
     return True
 
 
-def _match_topic(topic: SearchTopicOption, title: str) -> bool:
+def _match_topic(topic: SearchTopicOption, title_labels: frozenset[str]) -> bool:
     if topic == SearchTopicOption.ALL:
         return True
-
-    lowered = title.lower()
-    topic_keywords: dict[SearchTopicOption, tuple[str, ...]] = {
-        SearchTopicOption.SHOPPING: ("공구", "꿀템", "추천템", "리뷰"),
-        SearchTopicOption.CLIP: ("짤", "명장면", "하이라이트"),
-        SearchTopicOption.GAME: ("게임", "플레이", "공략"),
-        SearchTopicOption.FOOD: ("먹방", "요리", "asmr", "레시피"),
-        SearchTopicOption.ANIMAL: ("동물", "강아지", "고양이", "귀요미"),
-        SearchTopicOption.KNOWLEDGE: ("지식", "상식", "1분", "공부"),
-        SearchTopicOption.BEAUTY: ("뷰티", "패션", "ootd", "메이크업"),
-        SearchTopicOption.SPORTS: ("스포츠", "운동", "헬스", "축구"),
-        SearchTopicOption.ENTERTAINMENT: ("아이돌", "k-pop", "연예", "예능"),
-        SearchTopicOption.OTHER: (),
-        SearchTopicOption.ALL: (),
-    }
-
-    keywords = topic_keywords.get(topic, ())
     if topic == SearchTopicOption.OTHER:
-        every_known = [word for words in topic_keywords.values() for word in words]
-        return not any(word in lowered for word in every_known)
-
-    return any(word in lowered for word in keywords)
+        return not title_labels
+    return topic.value in title_labels
 
 
 def _build_recommendation_reason(record: SearchVideoRecord) -> str:
@@ -238,6 +248,37 @@ def _build_recommendation_reason(record: SearchVideoRecord) -> str:
     return f"구독자 대비 조회수 {contribution_text} + {engagement_text} + 채널 경쟁도 낮음"
 
 
+def _format_estimated_revenue_text(view_count: int) -> str:
+    cpm = 1 + (view_count % 3)
+    return f"CPM {cpm:,}원 기준 약 {int(view_count * (cpm / 1000)):,}원"
+
+
+# 표시용 필드별 생성 함수. 요청된 필드만 만들 수 있도록 필드 단위로 나눠 둡니다.
+_DISPLAY_TEXT_BUILDERS: dict[str, Callable[[SearchVideoRecord], str]] = {
+    "duration_text": lambda record: _format_duration_text(record.duration_seconds),
+    "published_date_text": lambda record: _format_published_date_text(record.published_at),
+    "view_count_text": lambda record: _format_view_count_text(record.view_count),
+    "subscriber_count_text": lambda record: _format_subscriber_count_text(
+        record.subscriber_count,
+        record.is_subscriber_public,
+    ),
+    "channel_published_date_text": lambda record: _format_published_date_text(record.channel_published_at),
+    "total_video_count_text": lambda record: f"{record.total_video_count:,}",
+    "subscription_rate_text": lambda record: _format_percent_text(record.subscription_rate),
+    "annual_subscriber_growth_text": lambda record: f"연 {record.annual_subscriber_growth:,}명",
+    "uploads_per_week_text": lambda record: _format_uploads_per_week_text(record.uploads_per_week),
+    "recommendation_reason": lambda record: _build_recommendation_reason(record),
+    "estimated_revenue_total_text": lambda record: _format_estimated_revenue_text(record.view_count),
+    "vph_text": lambda record: f"{record.performance_score:.1f}",
+}
+
+
+def _apply_display_texts(record: SearchVideoRecord, fields: frozenset[str] | None = None) -> None:
+    for name, build_text in _DISPLAY_TEXT_BUILDERS.items():
+        if fields is None or name in fields:
+            setattr(record, name, build_text(record))
+
+
 def search_videos(
     *,
     keyword: str,
@@ -256,88 +297,541 @@ def search_videos(
     min_performance: int,
     core_preset: SearchCorePreset,
     user_api_keys: list[str] | None = None,
+    result_format: SearchResultFormat = SearchResultFormat.DISPLAY,
+    fields: frozenset[str] | None = None,
+) -> list[SearchVideoRecord]:
+    """동기 호출용 얇은 래퍼입니다. 실제 조회 흐름은 search_videos_async에 있습니다."""
+    return run_with_blocking_transport(
+        search_videos_async(
+            keyword=keyword,
+            channel=channel,
+            sort=sort,
+            period=period,
+            topic=topic,
+            result_limit=result_limit,
+            min_views=min_views,
+            country=country,
+            max_subscribers=max_subscribers,
+            subscriber_public_only=subscriber_public_only,
+            duration_bucket=duration_bucket,
+            short_form_type=short_form_type,
+            script_type=script_type,
+            min_performance=min_performance,
+            core_preset=core_preset,
+            user_api_keys=user_api_keys,
+            result_format=result_format,
+            fields=fields,
+        )
+    )
+
+
+async def search_videos_async(
+    *,
+    keyword: str,
+    channel: str,
+    sort: SearchSortOption,
+    period: SearchPeriodOption,
+    topic: SearchTopicOption,
+    result_limit: int,
+    min_views: int,
+    country: str,
+    max_subscribers: int,
+    subscriber_public_only: bool,
+    duration_bucket: SearchDurationBucket,
+    short_form_type: SearchShortFormType,
+    script_type: SearchScriptType,
+    min_performance: int,
+    core_preset: SearchCorePreset,
+    user_api_keys: list[str] | None = None,
+    result_format: SearchResultFormat = SearchResultFormat.DISPLAY,
+    fields: frozenset[str] | None = None,
+) -> list[SearchVideoRecord]:
+    youtube_rows = await _fetch_youtube_rows(
+        keyword=keyword,
+        channel=channel,
+        sort=sort,
+        period=period,
+        result_limit=result_limit,
+        duration_bucket=duration_bucket,
+        country=country,
+        user_api_keys=user_api_keys or [],
+    )
+
+    return _build_search_records(
+        youtube_rows,
+        keyword=keyword,
+        sort=sort,
+        topic=topic,
+        result_limit=result_limit,
+        min_views=min_views,
+        country=country,
+        max_subscribers=max_subscribers,
+        subscriber_public_only=subscriber_public_only,
+        duration_bucket=duration_bucket,
+        short_form_type=short_form_type,
+        script_type=script_type,
+        min_performance=min_performance,
+        core_preset=core_preset,
+        result_format=result_format,
+        fields=fields,
+    )
+
+
+@dataclass(frozen=True)
+class SearchStreamEvent:
+    """스트리밍 검색 이벤트.
+
+    rows는 이번 search 페이지에서 필터/점수를 통과한 레코드, done은 전체를 정렬한 상위 result_limit개 레코드입니다.
+    """
+
+    kind: Literal["rows", "done"]
+    records: list[SearchVideoRecord]
+
+
+async def stream_search_videos_async(
+    *,
+    keyword: str,
+    channel: str,
+    sort: SearchSortOption,
+    period: SearchPeriodOption,
+    topic: SearchTopicOption,
+    result_limit: int,
+    min_views: int,
+    country: str,
+    max_subscribers: int,
+    subscriber_public_only: bool,
+    duration_bucket: SearchDurationBucket,
+    short_form_type: SearchShortFormType,
+    script_type: SearchScriptType,
+    min_performance: int,
+    core_preset: SearchCorePreset,
+    user_api_keys: list[str] | None = None,
+    result_format: SearchResultFormat = SearchResultFormat.DISPLAY,
+    fields: frozenset[str] | None = None,
+) -> AsyncIterator[SearchStreamEvent]:
+    """search_videos_async와 같은 검색을 YouTube search 페이지 단위로 나눠 돌려줍니다.
+
+    페이지마다 점수화한 레코드를 rows 이벤트로 바로 내보내고, 마지막에 done 이벤트를 한 번 내보냅니다.
+    query cache에 있는 검색은 rows 이벤트 한 번으로 끝납니다. 스트리밍 조회는 single-flight로 묶지 않지만,
+    끝까지 받은 원본 행은 같은 query cache에 저장합니다.
+    """
+    client = YouTubeSearchClient()
+    query_key = client.build_query_key(
+        keyword=keyword,
+        channel=channel,
+        sort=sort,
+        period=period,
+        result_limit=result_limit,
+        duration_bucket=duration_bucket,
+        country=country,
+    )
+    now = datetime.now(timezone.utc)
+
+    def _score_rows(rows: list[YoutubeVideoRaw]) -> list[SearchVideoRecord]:
+        return _build_search_records(
+            rows,
+            keyword=keyword,
+            sort=sort,
+            topic=topic,
+            result_limit=len(rows),
+            min_views=min_views,
+            country=country,
+            max_subscribers=max_subscribers,
+            subscriber_public_only=subscriber_public_only,
+            duration_bucket=duration_bucket,
+            short_form_type=short_form_type,
+            script_type=script_type,
+            min_performance=min_performance,
+            core_preset=core_preset,
+            result_format=result_format,
+            fields=fields,
+            now=now,
+        )
+
+    scored_records: list[SearchVideoRecord] = []
+    cached_rows = shared_query_cache.get(query_key)
+    if cached_rows is not None:
+        scored_records = _score_rows(list(cached_rows))
+        if scored_records:
+            yield SearchStreamEvent(kind="rows", records=scored_records)
+    else:
+        fetched_rows: list[YoutubeVideoRaw] = []
+        try:
+            async for page_rows in client.iter_video_pages_async(
+                keyword=keyword,
+                channel=channel,
+                sort=sort,
+                period=period,
+                result_limit=result_limit,
+                api_keys=user_api_keys or [],
+                duration_bucket=duration_bucket,
+                country=country,
+            ):
+                fetched_rows.extend(page_rows)
+                page_records = _score_rows(page_rows)
+                if page_records:
+                    scored_records.extend(page_records)
+                    yield SearchStreamEvent(kind="rows", records=page_records)
+        except SearchUpstreamUnavailableError:
+            stale_rows = shared_query_cache.get_stale(query_key) if not fetched_rows else None
+            if stale_rows is None:
+                raise
+            logger.warning("Serving stale search rows while YouTube is unavailable: query=%s", query_key.query)
+            scored_records = _score_rows(list(stale_rows))
+            if scored_records:
+                yield SearchStreamEvent(kind="rows", records=scored_records)
+        else:
+            shared_query_cache.set(query_key, tuple(fetched_rows))
+
+    yield SearchStreamEvent(kind="done", records=_select_top_records(scored_records, sort, result_limit))
+
+
+async def search_videos_batch_async(
+    *,
+    keywords: list[str],
+    channels: list[str],
+    sort: SearchSortOption,
+    period: SearchPeriodOption,
+    topic: SearchTopicOption,
+    result_limit: int,
+    min_views: int,
+    country: str,
+    max_subscribers: int,
+    subscriber_public_only: bool,
+    duration_bucket: SearchDurationBucket,
+    short_form_type: SearchShortFormType,
+    script_type: SearchScriptType,
+    min_performance: int,
+    core_preset: SearchCorePreset,
+    user_api_keys: list[str] | None = None,
 ) -> list[SearchVideoRecord]:
+    """여러 키워드/채널 검색 결과를 합쳐 중복 없이 한 번에 점수화/정렬합니다.
+
+    검색별 원본 행은 단건 검색과 같은 query cache를 함께 쓰고, 캐시에 없는 검색만 한 번의 배치 조회로 가져옵니다.
+    각 레코드의 matched_queries에는 그 영상을 찾은 키워드/채널이 요청 순서대로 담깁니다.
+    """
+    queries: list[tuple[str, str]] = []
+    for raw_keyword in keywords:
+        query = (raw_keyword.strip(), "")
+        if query[0] and query not in queries:
+            queries.append(query)
+    for raw_channel in channels:
+        query = ("", raw_channel.strip())
+        if query[1] and query not in queries:
+            queries.append(query)
+    if not queries:
+        return []
+
     client = YouTubeSearchClient()
-    youtube_rows = client.fetch_videos(
+    query_keys = [
+        client.build_query_key(
+            keyword=keyword,
+            channel=channel,
+            sort=sort,
+            period=period,
+            result_limit=result_limit,
+            duration_bucket=duration_bucket,
+            country=country,
+        )
+        for keyword, channel in queries
+    ]
+
+    rows_per_query: list[tuple[YoutubeVideoRaw, ...] | None] = [shared_query_cache.get(key) for key in query_keys]
+    missing_indexes = [index for index, rows in enumerate(rows_per_query) if rows is None]
+    if missing_indexes:
+        fetched_per_query = await client.fetch_videos_batch_async(
+            queries=[queries[index] for index in missing_indexes],
+            sort=sort,
+            period=period,
+            result_limit=result_limit,
+            api_keys=user_api_keys or [],
+            duration_bucket=duration_bucket,
+            country=country,
+        )
+        for index, fetched_rows in zip(missing_indexes, fetched_per_query):
+            rows_per_query[index] = tuple(fetched_rows)
+            shared_query_cache.set(query_keys[index], rows_per_query[index])
+
+    merged_rows: list[YoutubeVideoRaw] = []
+    row_keywords: dict[str, list[str]] = {}
+    matched_queries: dict[str, list[str]] = {}
+    for (keyword, channel), rows in zip(queries, rows_per_query):
+        for row in rows or ():
+            if row.video_id not in row_keywords:
+                merged_rows.append(row)
+                row_keywords[row.video_id] = []
+                matched_queries[row.video_id] = []
+            if keyword not in row_keywords[row.video_id]:
+                row_keywords[row.video_id].append(keyword)
+            matched_queries[row.video_id].append(keyword or channel)
+
+    records = _build_search_records(
+        merged_rows,
+        keyword=" ".join(keyword for keyword, _ in queries if keyword),
+        sort=sort,
+        topic=topic,
+        result_limit=result_limit,
+        min_views=min_views,
+        country=country,
+        max_subscribers=max_subscribers,
+        subscriber_public_only=subscriber_public_only,
+        duration_bucket=duration_bucket,
+        short_form_type=short_form_type,
+        script_type=script_type,
+        min_performance=min_performance,
+        core_preset=core_preset,
+        row_keywords=row_keywords,
+    )
+    for record in records:
+        record.matched_queries = matched_queries[record.video_id]
+    return records
+
+
+async def _fetch_youtube_rows(
+    *,
+    keyword: str,
+    channel: str,
+    sort: SearchSortOption,
+    period: SearchPeriodOption,
+    result_limit: int,
+    duration_bucket: SearchDurationBucket,
+    country: str,
+    user_api_keys: list[str],
+) -> list[YoutubeVideoRaw]:
+    client = YouTubeSearchClient()
+    query_key = client.build_query_key(
         keyword=keyword,
         channel=channel,
         sort=sort,
         period=period,
         result_limit=result_limit,
-        api_keys=user_api_keys or [],
+        duration_bucket=duration_bucket,
+        country=country,
+    )
+
+    cached_rows = shared_query_cache.get(query_key)
+    if cached_rows is not None:
+        return list(cached_rows)
+
+    async def _fetch_and_cache() -> tuple[YoutubeVideoRaw, ...]:
+        # 앞선 leader가 방금 캐시를 채웠을 수 있으므로 한 번 더 확인합니다.
+        refreshed_rows = shared_query_cache.get(query_key)
+        if refreshed_rows is not None:
+            return refreshed_rows
+
+        fetched_rows = tuple(
+            await client.fetch_videos_async(
+                keyword=keyword,
+                channel=channel,
+                sort=sort,
+                period=period,
+                result_limit=result_limit,
+                api_keys=user_api_keys,
+                duration_bucket=duration_bucket,
+                country=country,
+            )
+        )
+        shared_query_cache.set(query_key, fetched_rows)
+        return fetched_rows
+
+    try:
+        flight_key = (query_key, client.build_api_key_fingerprint(user_api_keys))
+        return list(await shared_search_flights.run(flight_key, _fetch_and_cache))
+    except SearchUpstreamUnavailableError:
+        stale_rows = shared_query_cache.get_stale(query_key)
+        if stale_rows is None:
+            raise
+        logger.warning("Serving stale search rows while YouTube is unavailable: query=%s", query_key.query)
+        return list(stale_rows)
+
+
+RowPredicate = Callable[[YoutubeVideoRaw], bool]
+
+# 노출 점수를 읽는 응답 필드와 정렬. 어느 쪽도 필요 없으면 노출 점수 계산을 건너뜁니다.
+_EXPOSURE_DEPENDENT_FIELDS = frozenset({"exposure_score", "is_hot_video", "badge_label"})
+_EXPOSURE_DEPENDENT_SORTS = frozenset({SearchSortOption.OPPORTUNITY_ONLY, SearchSortOption.RECOMMENDED})
+
+
+def _needs_exposure_score(sort: SearchSortOption, fields: frozenset[str] | None) -> bool:
+    if fields is None or sort in _EXPOSURE_DEPENDENT_SORTS:
+        return True
+    return not fields.isdisjoint(_EXPOSURE_DEPENDENT_FIELDS)
+
+
+@dataclass(frozen=True, slots=True)
+class _ChannelMetrics:
+    channel_age_days: int
+    subscription_rate: float
+    annual_subscriber_growth: int
+    uploads_per_week: float
+
+
+def _compute_channel_metrics(row: YoutubeVideoRaw, now: datetime) -> _ChannelMetrics:
+    channel_age_days = max((now - row.channel_published_at).days, 1)
+    channel_age_years = max(channel_age_days / 365.0, 0.01)
+    subscription_rate = (row.subscriber_count / row.channel_view_count * 100) if row.channel_view_count > 0 else 0.0
+    return _ChannelMetrics(
+        channel_age_days=channel_age_days,
+        subscription_rate=subscription_rate,
+        annual_subscriber_growth=int(row.subscriber_count / channel_age_years),
+        uploads_per_week=row.total_video_count / (channel_age_days / 7),
     )
 
+
+def _compile_row_filters(
+    *,
+    min_views: int,
+    country: str,
+    max_subscribers: int,
+    subscriber_public_only: bool,
+    duration_bucket: SearchDurationBucket,
+    topic: SearchTopicOption,
+    short_form_type: SearchShortFormType,
+    core_preset: SearchCorePreset,
+    now: datetime,
+) -> list[RowPredicate]:
+    """요청 조건 중 실제로 걸러내는 것만 골라, 싼 비교부터 비싼 계산 순서로 predicate 목록을 만듭니다."""
+    predicates: list[RowPredicate] = []
+
     normalized_country = country.strip().upper()
+    if normalized_country:
+        predicates.append(lambda row: row.country_code.upper() == normalized_country)
 
-    records: list[SearchVideoRecord] = []
-    now = datetime.now(timezone.utc)
+    if min_views > 0:
+        predicates.append(lambda row: row.view_count >= min_views)
 
-    for row in youtube_rows:
-        if row.view_count < min_views:
-            continue
+    if max_subscribers > 0:
+        predicates.append(lambda row: row.is_subscriber_public and row.subscriber_count <= max_subscribers)
+    elif subscriber_public_only:
+        predicates.append(lambda row: row.is_subscriber_public)
 
-        if not _match_topic(topic, row.title):
-            continue
+    if duration_bucket != SearchDurationBucket.ALL:
+        predicates.append(lambda row: _match_duration(row.duration_seconds, duration_bucket))
 
-        if normalized_country and row.country_code.upper() != normalized_country:
-            continue
+    if topic != SearchTopicOption.ALL or short_form_type != SearchShortFormType.ALL:
 
-        if max_subscribers > 0:
-            if not row.is_subscriber_public:
-                continue
-            if row.subscriber_count > max_subscribers:
-                continue
+        def _match_title_categories(row: YoutubeVideoRaw) -> bool:
+            title_labels = classify_title(row.title)
+            return _match_topic(topic, title_labels) and _match_short_form(title_labels, short_form_type)
 
-        if subscriber_public_only and not row.is_subscriber_public:
-            continue
+        predicates.append(_match_title_categories)
 
-        is_short_form = row.duration_seconds <= 60
-        has_script = False
+    if core_preset != SearchCorePreset.NONE:
 
-        if not _match_duration(row.duration_seconds, duration_bucket):
-            continue
+        def _match_channel_preset(row: YoutubeVideoRaw) -> bool:
+            metrics = _compute_channel_metrics(row, now)
+            return _match_core_preset(
+                core_preset,
+                channel_age_days=metrics.channel_age_days,
+                subscriber_count=row.subscriber_count,
+                total_video_count=row.total_video_count,
+                subscription_rate=metrics.subscription_rate,
+                annual_subscriber_growth=metrics.annual_subscriber_growth,
+                country_code=row.country_code,
+            )
 
-        if not _match_short_form(row.title, short_form_type):
-            continue
+        predicates.append(_match_channel_preset)
 
-        if not _match_script(has_script, script_type):
-            continue
+    return predicates
 
-        channel_age_days = max((now - row.channel_published_at).days, 1)
-        channel_age_years = max(channel_age_days / 365.0, 0.01)
-        subscription_rate = (row.subscriber_count / row.channel_view_count * 100) if row.channel_view_count > 0 else 0.0
-        annual_subscriber_growth = int(row.subscriber_count / channel_age_years)
-        uploads_per_week = row.total_video_count / (channel_age_days / 7)
-        grade = _compute_channel_grade(row.subscriber_count)
 
-        contribution = compute_contribution(row.view_count, row.subscriber_count, row.is_subscriber_public)
-        contribution_grade = classify_contribution_grade(contribution)
-        engagement_rate = compute_engagement_rate(row.view_count, row.like_count, row.comment_count)
-        performance_score = compute_performance_score(contribution, engagement_rate, row.view_count)
-        exposure_score = compute_exposure_score(
-            keyword=keyword,
-            title=row.title,
-            subscriber_count=row.subscriber_count,
-            engagement_rate=engagement_rate,
-            total_video_count=row.total_video_count,
-            published_at=row.published_at,
+def _build_search_records(
+    youtube_rows: list[YoutubeVideoRaw],
+    *,
+    keyword: str,
+    sort: SearchSortOption,
+    topic: SearchTopicOption,
+    result_limit: int,
+    min_views: int,
+    country: str,
+    max_subscribers: int,
+    subscriber_public_only: bool,
+    duration_bucket: SearchDurationBucket,
+    short_form_type: SearchShortFormType,
+    script_type: SearchScriptType,
+    min_performance: int,
+    core_preset: SearchCorePreset,
+    result_format: SearchResultFormat = SearchResultFormat.DISPLAY,
+    fields: frozenset[str] | None = None,
+    row_keywords: dict[str, list[str]] | None = None,
+    now: datetime | None = None,
+) -> list[SearchVideoRecord]:
+    """필터/점수/정렬을 적용한 상위 result_limit개 레코드를 만듭니다.
+
+    fields(레코드 속성명 집합)가 주어지면 그 필드와 정렬에 필요한 값만 계산하고,
+    나머지 점수/문자열 필드는 기본값으로 남겨 둡니다.
+    row_keywords(video_id → 그 영상을 찾은 키워드 목록)가 주어지면 노출 점수는 첫 키워드로,
+    keyword_matched_terms는 모든 키워드 기준으로 계산합니다.
+    now를 주면 여러 번 나눠 호출해도 같은 기준 시각으로 기간/노출 점수를 계산합니다.
+    """
+    # 대본 여부는 아직 수집하지 않으므로 모든 행이 has_script=False입니다.
+    has_script = False
+    if not _match_script(has_script, script_type):
+        return []
+
+    now = now or datetime.now(timezone.utc)
+    predicates = _compile_row_filters(
+        min_views=min_views,
+        country=country,
+        max_subscribers=max_subscribers,
+        subscriber_public_only=subscriber_public_only,
+        duration_bucket=duration_bucket,
+        topic=topic,
+        short_form_type=short_form_type,
+        core_preset=core_preset,
+        now=now,
+    )
+    candidates = [row for row in youtube_rows if all(predicate(row) for predicate in predicates)]
+    if not candidates:
+        return []
+
+    # 점수 조건은 행 조건을 통과한 후보에만, 노출 점수는 성과 점수 조건까지 통과한 후보에만 계산합니다.
+    performance_columns = compute_performance_columns(
+        view_counts=np.array([row.view_count for row in candidates], dtype=np.int64),
+        subscriber_counts=np.array([row.subscriber_count for row in candidates], dtype=np.int64),
+        is_subscriber_public=np.array([row.is_subscriber_public for row in candidates], dtype=bool),
+        like_counts=np.array([row.like_count for row in candidates], dtype=np.int64),
+        comment_counts=np.array([row.comment_count for row in candidates], dtype=np.int64),
+    )
+    contribution_column = performance_columns.contribution
+    engagement_rate_column = performance_columns.engagement_rate
+    performance_score_column = performance_columns.performance_score
+    if min_performance > 0:
+        keep = performance_score_column >= min_performance
+        if not keep.any():
+            return []
+        candidates = [row for row, kept in zip(candidates, keep.tolist()) if kept]
+        contribution_column = contribution_column[keep]
+        engagement_rate_column = engagement_rate_column[keep]
+        performance_score_column = performance_score_column[keep]
+
+    if _needs_exposure_score(sort, fields):
+        exposure_column = compute_exposure_columns(
+            keyword=keyword if row_keywords is None else [row_keywords[row.video_id][0] for row in candidates],
+            titles=[row.title for row in candidates],
+            subscriber_counts=np.array([row.subscriber_count for row in candidates], dtype=np.int64),
+            engagement_rates=engagement_rate_column,
+            total_video_counts=np.array([row.total_video_count for row in candidates], dtype=np.int64),
+            published_at_us=to_epoch_microseconds([row.published_at for row in candidates]),
             now=now,
         )
-        hot_video = is_hot_video(contribution, exposure_score)
-
-        if performance_score < min_performance:
-            continue
-
-        if not _match_core_preset(
-            core_preset,
-            channel_age_days=channel_age_days,
-            subscriber_count=row.subscriber_count,
-            total_video_count=row.total_video_count,
-            subscription_rate=subscription_rate,
-            annual_subscriber_growth=annual_subscriber_growth,
-            country_code=row.country_code,
-        ):
-            continue
+        exposure_scores = exposure_column.tolist()
+        hot_videos = is_hot_video_columns(contribution_column, exposure_column).tolist()
+    else:
+        exposure_scores = [0.0] * len(candidates)
+        hot_videos = [False] * len(candidates)
+    contributions = nan_to_none(contribution_column)
+    contribution_grades = classify_contribution_grades(contribution_column)
+    engagement_rates = nan_to_none(engagement_rate_column)
+    performance_scores = performance_score_column.tolist()
+
+    records: list[SearchVideoRecord] = []
+    for index, row in enumerate(candidates):
+        is_short_form = row.duration_seconds <= 60
+        contribution = contributions[index]
+        performance_score = performance_scores[index]
+        hot_video = hot_videos[index]
+        metrics = _compute_channel_metrics(row, now)
 
         records.append(
             SearchVideoRecord(
@@ -346,49 +840,41 @@ def search_videos(
                 channel_name=row.channel_name,
                 thumbnail_url=row.thumbnail_url,
                 duration_seconds=row.duration_seconds,
-                duration_text=_format_duration_text(row.duration_seconds),
                 published_at=row.published_at,
-                published_date_text=_format_published_date_text(row.published_at),
                 view_count=row.view_count,
-                view_count_text=_format_view_count_text(row.view_count),
                 subscriber_count=row.subscriber_count,
-                subscriber_count_text=_format_subscriber_count_text(
-                    row.subscriber_count,
-                    row.is_subscriber_public,
-                ),
                 like_count=row.like_count,
                 comment_count=row.comment_count,
                 channel_published_at=row.channel_published_at,
-                channel_published_date_text=_format_published_date_text(row.channel_published_at),
                 country_code=row.country_code,
                 total_video_count=row.total_video_count,
-                total_video_count_text=f"{row.total_video_count:,}",
-                subscription_rate=subscription_rate,
-                subscription_rate_text=_format_percent_text(subscription_rate),
-                annual_subscriber_growth=annual_subscriber_growth,
-                annual_subscriber_growth_text=f"연 {annual_subscriber_growth:,}명",
-                uploads_per_week=uploads_per_week,
-                uploads_per_week_text=_format_uploads_per_week_text(uploads_per_week),
-                channel_grade=grade,
+                subscription_rate=metrics.subscription_rate,
+                annual_subscriber_growth=metrics.annual_subscriber_growth,
+                uploads_per_week=metrics.uploads_per_week,
+                channel_grade=_compute_channel_grade(row.subscriber_count),
                 is_short_form=is_short_form,
                 has_script=has_script,
                 is_subscriber_public=row.is_subscriber_public,
-                keyword_matched_terms=_collect_keyword_matches(keyword, row.title),
                 contribution=contribution,
-                contribution_grade=contribution_grade,
-                engagement_rate=engagement_rate,
+                contribution_grade=contribution_grades[index],
+                engagement_rate=engagement_rates[index],
                 performance_score=performance_score,
-                exposure_score=exposure_score,
+                exposure_score=exposure_scores[index],
                 is_hot_video=hot_video,
-                recommendation_reason="",
-                estimated_revenue_total_text=f"CPM {1 + (row.view_count % 3):,}원 기준 약 {int(row.view_count * ((1 + (row.view_count % 3)) / 1000)):,}원",
-                vph_text=f"{performance_score:.1f}",
                 badge_label="🔥 HOT" if hot_video else ("SHORTS" if is_short_form else None),
             )
         )
 
-    for record in records:
-        record.recommendation_reason = _build_recommendation_reason(record)
-
-    sorted_records = _sort_records(records, sort)
-    return sorted_records[:result_limit]
+    # 표시용 문자열과 키워드 매칭은 실제로 응답할 행에만 만듭니다.
+    selected_records = _select_top_records(records, sort, result_limit)
+    needs_keyword_matches = fields is None or "keyword_matched_terms" in fields
+    for record in selected_records:
+        if needs_keyword_matches:
+            record.keyword_matched_terms = (
+                _collect_keyword_matches(keyword, record.title)
+                if row_keywords is None
+                else _collect_multi_keyword_matches(row_keywords[record.video_id], record.title)
+            )
+        if result_format == SearchResultFormat.DISPLAY:
+            _apply_display_texts(record, fields)
+    return selected_records
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Mapping
+
+# 제목 키워드 기반 카테고리. 값은 SearchTopicOption / SearchShortFormType의 value와 같습니다.
+TITLE_CATEGORY_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "shopping": ("공구", "꿀템", "추천템", "리뷰"),
+    "clip": ("짤", "명장면", "하이라이트"),
+    "game": ("게임", "플레이", "공략"),
+    "food": ("먹방", "요리", "asmr", "레시피"),
+    "animal": ("동물", "강아지", "고양이", "귀요미"),
+    "knowledge": ("지식", "상식", "1분", "공부"),
+    "beauty": ("뷰티", "패션", "ootd", "메이크업"),
+    "sports": ("스포츠", "운동", "헬스", "축구"),
+    "entertainment": ("아이돌", "k-pop", "연예", "예능"),
+}
+
+
+class AhoCorasickMatcher:
+    """여러 키워드를 한 번의 순회로 찾는 Aho-Corasick 오토마톤.
+
+    labels(text)는 text에 부분 문자열로 등장하는 키워드들의 라벨 집합을 돌려줍니다.
+    (`any(word in text for word in words)`를 라벨마다 반복한 결과와 같습니다.)
+    """
+
+    def __init__(self, patterns: Mapping[str, Iterable[str]]) -> None:
+        self._transitions: list[dict[str, int]] = [{}]
+        self._outputs: list[frozenset[str]] = [frozenset()]
+
+        pending_outputs: list[set[str]] = [set()]
+        for label, words in patterns.items():
+            for word in words:
+                if not word:
+                    continue
+                state = 0
+                for character in word:
+                    next_state = self._transitions[state].get(character)
+                    if next_state is None:
+                        next_state = len(self._transitions)
+                        self._transitions[state][character] = next_state
+                        self._transitions.append({})
+                        pending_outputs.append(set())
+                    state = next_state
+                pending_outputs[state].add(label)
+
+        self._fail: list[int] = [0] * len(self._transitions)
+        queue: deque[int] = deque(self._transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for character, next_state in self._transitions[state].items():
+                fallback = self._fail[state]
+                while fallback and character not in self._transitions[fallback]:
+                    fallback = self._fail[fallback]
+                candidate = self._transitions[fallback].get(character, 0)
+                self._fail[next_state] = candidate if candidate != next_state else 0
+                pending_outputs[next_state] |= pending_outputs[self._fail[next_state]]
+                queue.append(next_state)
+
+        self._outputs = [frozenset(labels) for labels in pending_outputs]
+
+    def labels(self, text: str) -> frozenset[str]:
+        transitions = self._transitions
+        fail = self._fail
+        outputs = self._outputs
+        found: set[str] = set()
+        state = 0
+        for character in text:
+            while state and character not in transitions[state]:
+                state = fail[state]
+            state = transitions[state].get(character, 0)
+            if outputs[state]:
+                found |= outputs[state]
+        return frozenset(found)
+
+
+_title_matcher = AhoCorasickMatcher(TITLE_CATEGORY_KEYWORDS)
+
+
+def classify_title(title: str) -> frozenset[str]:
+    """제목에 해당하는 카테고리 value 집합을 반환합니다. 비어 있으면 `other`에 해당합니다."""
+    return _title_matcher.labels(title.lower())
+
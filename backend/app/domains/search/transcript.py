@@ -2,11 +2,17 @@ from __future__ import annotations
 
 import os
 import logging
-from dataclasses import dataclass
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from threading import Lock
 from urllib.parse import parse_qs, urlparse
 
+from requests import Session
+
 from youtube_transcript_api import (
     CouldNotRetrieveTranscript,
+    FetchedTranscript,
     NoTranscriptFound,
     RequestBlocked,
     TranscriptsDisabled,
@@ -14,6 +20,13 @@ from youtube_transcript_api import (
 )
 from youtube_transcript_api.proxies import WebshareProxyConfig
 
+from .transcript_cache import (
+    CachedTranscript,
+    build_transcript_cache_from_env,
+    build_transcript_cache_key,
+    build_transcript_language_key,
+)
+
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +35,10 @@ class TranscriptDependencyError(RuntimeError):
     """자막 추출 라이브러리 의존성 문제가 발생했을 때 사용합니다."""
 
 
+class TranscriptUnavailableError(LookupError):
+    """부정 캐시에 남아 있는 '자막 없음/비활성' 결과를 YouTube 호출 없이 다시 알릴 때 사용합니다."""
+
+
 @dataclass
 class TranscriptSegment:
     text: str
@@ -40,6 +57,13 @@ class TranscriptResult:
 
 YTDLP_IMPORT_ERROR = ""
 
+DEFAULT_TRANSCRIPT_API_POOL_SIZE = 4
+# WebshareProxyConfig 기본 재시도 횟수와 같습니다.
+DEFAULT_TRANSCRIPT_PROXY_BLOCKED_RETRIES = 10
+
+# 공개 영상 대본은 거의 바뀌지 않으므로 프록시 호출 대신 메모리/디스크 캐시에서 먼저 찾습니다.
+shared_transcript_cache = build_transcript_cache_from_env()
+
 
 def parse_language_priority(languages: str | list[str] | None) -> list[str]:
     if isinstance(languages, list):
@@ -73,34 +97,158 @@ def extract_video_id(target: str) -> str:
     return ""
 
 
-def _build_transcript_api() -> YouTubeTranscriptApi:
-    username = os.getenv("WEBSHARE_USERNAME", "").strip()
-    password = os.getenv("WEBSHARE_PASSWORD", "").strip()
+@dataclass(frozen=True)
+class TranscriptProxySettings:
+    """자막 프록시 설정. 값이 바뀌면 풀의 인스턴스를 모두 새로 만듭니다."""
+
+    username: str
+    password: str
+    # True면 프록시 터널을 요청 간에 재사용합니다. 차단되면 터널을 끊고 새 출구 IP로 다시 시도합니다.
+    keep_alive: bool
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.username and self.password)
 
+    @property
+    def effective_username(self) -> str:
+        if self.username.endswith(("-rotate", "-us", "-country-us")):
+            return self.username
+        return f"{self.username}-rotate"
+
+
+def read_transcript_proxy_settings() -> TranscriptProxySettings:
+    return TranscriptProxySettings(
+        username=os.getenv("WEBSHARE_USERNAME", "").strip(),
+        password=os.getenv("WEBSHARE_PASSWORD", "").strip(),
+        keep_alive=os.getenv("TRANSCRIPT_PROXY_KEEP_ALIVE", "1").strip().lower() not in {"0", "false", "no", "off"},
+    )
+
+
+def _log_proxy_settings(settings: TranscriptProxySettings) -> None:
+    username = settings.username
     logger.info(
         f"[PROXY DEBUG] WEBSHARE_USERNAME 존재? {bool(username)} | 길이 {len(username)} | 앞 10자: {username[:10] if username else 'None'}"
     )
-    logger.info(f"[PROXY DEBUG] WEBSHARE_PASSWORD 존재? {bool(password)} | 길이 {len(password)}")
+    logger.info(f"[PROXY DEBUG] WEBSHARE_PASSWORD 존재? {bool(settings.password)} | 길이 {len(settings.password)}")
 
-    if username and password:
-        effective_username = username if username.endswith(("-rotate", "-us", "-country-us")) else f"{username}-rotate"
+    if settings.enabled:
+        logger.info(
+            f"✅ Webshare Proxy 활성화 완료 (effective: {settings.effective_username}, 미국 IP 우선, keep-alive: {settings.keep_alive})"
+        )
+    else:
+        logger.error("❌ Webshare 환경변수가 없습니다!")
 
-        logger.info(f"✅ Webshare Proxy 활성화 완료 (effective: {effective_username}, 미국 IP 우선)")
 
-        return YouTubeTranscriptApi(
-            proxy_config=WebshareProxyConfig(
-                proxy_username=effective_username,
-                proxy_password=password,
-                filter_ip_locations=["us", "ca", "gb"],
+def _build_transcript_api(settings: TranscriptProxySettings, http_client: Session) -> YouTubeTranscriptApi:
+    if not settings.enabled:
+        return YouTubeTranscriptApi(http_client=http_client)
+
+    proxy_config = WebshareProxyConfig(
+        proxy_username=settings.effective_username,
+        proxy_password=settings.password,
+        filter_ip_locations=["us", "ca", "gb"],
+        # keep-alive에서는 라이브러리 재시도가 같은 터널(같은 IP)로 나가므로 _PooledTranscriptApi가 대신 재시도합니다.
+        retries_when_blocked=0 if settings.keep_alive else DEFAULT_TRANSCRIPT_PROXY_BLOCKED_RETRIES,
+    )
+    transcript_api = YouTubeTranscriptApi(proxy_config=proxy_config, http_client=http_client)
+    if settings.keep_alive:
+        # WebshareProxyConfig는 요청마다 IP를 바꾸려고 Connection: close를 강제합니다.
+        http_client.headers.pop("Connection", None)
+    return transcript_api
+
+
+@dataclass
+class _PooledTranscriptApi:
+    api: YouTubeTranscriptApi
+    http_client: Session
+    settings: TranscriptProxySettings
+
+    def fetch(self, video_id: str, languages: list[str]) -> FetchedTranscript:
+        attempts = DEFAULT_TRANSCRIPT_PROXY_BLOCKED_RETRIES if self.settings.enabled and self.settings.keep_alive else 1
+        attempt = 1
+        while True:
+            try:
+                return self.api.fetch(video_id, languages=languages)
+            except RequestBlocked:
+                if attempt >= attempts:
+                    raise
+                attempt += 1
+                # 열린 터널은 차단된 출구 IP에 묶여 있으므로 끊고 새 연결(새 IP)로 다시 시도합니다.
+                self.http_client.close()
+
+    def close(self) -> None:
+        self.http_client.close()
+
+
+class TranscriptApiPool:
+    """프로세스 공용 YouTubeTranscriptApi 풀.
+
+    - YouTubeTranscriptApi는 requests.Session을 품고 있어 스레드 안전하지 않으므로 lease()로 하나씩 빌려 씁니다.
+    - 반납된 인스턴스는 max_idle개까지 보관해 다음 요청이 세션과 프록시 연결을 그대로 재사용합니다.
+    - 프록시 설정이 바뀌면 보관 중인 인스턴스를 닫고, 이전 설정으로 빌려 간 인스턴스는 반납 시 버립니다.
+    """
+
+    def __init__(self, *, max_idle: int) -> None:
+        self._max_idle = max_idle
+        self._idle: list[_PooledTranscriptApi] = []
+        self._settings: TranscriptProxySettings | None = None
+        self._lock = Lock()
+
+    @contextmanager
+    def lease(self) -> Iterator[_PooledTranscriptApi]:
+        settings = read_transcript_proxy_settings()
+        stale: list[_PooledTranscriptApi] = []
+        with self._lock:
+            if settings != self._settings:
+                stale, self._idle = self._idle, []
+                self._settings = settings
+                _log_proxy_settings(settings)
+            pooled = self._idle.pop() if self._idle else None
+        for previous in stale:
+            previous.close()
+
+        if pooled is None:
+            http_client = Session()
+            pooled = _PooledTranscriptApi(
+                api=_build_transcript_api(settings, http_client),
+                http_client=http_client,
+                settings=settings,
             )
-        )
+        try:
+            yield pooled
+        finally:
+            self._release(pooled)
+
+    def _release(self, pooled: _PooledTranscriptApi) -> None:
+        with self._lock:
+            if pooled.settings == self._settings and len(self._idle) < self._max_idle:
+                self._idle.append(pooled)
+                return
+        pooled.close()
+
+    def clear(self) -> None:
+        with self._lock:
+            stale, self._idle = self._idle, []
+            self._settings = None
+        for previous in stale:
+            previous.close()
+
+
+def build_transcript_api_pool_from_env() -> TranscriptApiPool:
+    try:
+        max_idle = int(os.getenv("TRANSCRIPT_API_POOL_SIZE", str(DEFAULT_TRANSCRIPT_API_POOL_SIZE)))
+    except ValueError:
+        max_idle = DEFAULT_TRANSCRIPT_API_POOL_SIZE
+    return TranscriptApiPool(max_idle=max(0, max_idle))
+
 
-    logger.error("❌ Webshare 환경변수가 없습니다!")
-    return YouTubeTranscriptApi()
+# 요청마다 세션/프록시 설정을 새로 만들지 않도록 프로세스 단위로 공유합니다.
+shared_transcript_api_pool = build_transcript_api_pool_from_env()
 
 
 def build_transcript_health() -> dict:
-    has_proxy_config = bool(os.getenv("WEBSHARE_USERNAME", "").strip() and os.getenv("WEBSHARE_PASSWORD", "").strip())
+    has_proxy_config = read_transcript_proxy_settings().enabled
     return {
         "ok": True,
         "proxy": "enabled" if has_proxy_config else "disabled",
@@ -108,14 +256,43 @@ def build_transcript_health() -> dict:
     }
 
 
+def _from_cached_transcript(cached: CachedTranscript) -> TranscriptResult | None:
+    if cached.status == "empty":
+        return None
+    if cached.status != "ok" or cached.payload is None:
+        raise TranscriptUnavailableError(cached.status)
+    payload = cached.payload
+    return TranscriptResult(
+        title=payload["title"],
+        transcript_text=payload["transcript_text"],
+        language=payload["language"],
+        source=payload["source"],
+        segments=[TranscriptSegment(**segment) for segment in payload["segments"]],
+    )
+
+
 def extract_transcript_from_video(video_target: str, languages: list[str]) -> TranscriptResult | None:
     video_id = extract_video_id(video_target)
     if video_id == "":
         return None
 
-    transcript_api = _build_transcript_api()
-
-    transcript = transcript_api.fetch(video_id, languages=languages)
+    cache_key = build_transcript_cache_key(video_id, languages)
+    cached = shared_transcript_cache.get(cache_key)
+    if cached is not None and cached.language is not None:
+        # 요청 키는 선택된 언어만 가리킵니다. 언어 항목이 먼저 만료/축출됐으면 다시 가져옵니다.
+        cached = shared_transcript_cache.get(build_transcript_language_key(video_id, cached.language))
+    if cached is not None:
+        return _from_cached_transcript(cached)
+
+    try:
+        with shared_transcript_api_pool.lease() as transcript_api:
+            transcript = transcript_api.fetch(video_id, languages)
+    except NoTranscriptFound:
+        shared_transcript_cache.set(cache_key, CachedTranscript(status="not_found"))
+        raise
+    except TranscriptsDisabled:
+        shared_transcript_cache.set(cache_key, CachedTranscript(status="disabled"))
+        raise
     raw_segments = transcript.to_raw_data()
 
     segments = [
@@ -131,15 +308,22 @@ def extract_transcript_from_video(video_target: str, languages: list[str]) -> Tr
     transcript_text = " ".join(segment.text for segment in segments).strip()
 
     if transcript_text == "":
+        shared_transcript_cache.set(cache_key, CachedTranscript(status="empty"))
         return None
 
-    return TranscriptResult(
+    result = TranscriptResult(
         title="video",
         transcript_text=transcript_text,
         language=transcript.language_code,
         source="youtube_transcript_api",
         segments=segments,
     )
+    shared_transcript_cache.set(
+        build_transcript_language_key(video_id, result.language),
+        CachedTranscript(status="ok", payload=asdict(result)),
+    )
+    shared_transcript_cache.set(cache_key, CachedTranscript(status="ok", language=result.language))
+    return result
 
 
 __all__ = [
@@ -148,7 +332,10 @@ __all__ = [
     "RequestBlocked",
     "TranscriptDependencyError",
     "TranscriptResult",
+    "TranscriptUnavailableError",
     "TranscriptsDisabled",
+    "TranscriptApiPool",
+    "TranscriptProxySettings",
     "YTDLP_IMPORT_ERROR",
     "build_transcript_health",
     "extract_transcript_from_video",
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import time
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from threading import Lock
+from typing import Literal
+
+from .cache import TtlLruCache, read_cache_settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRANSCRIPT_CACHE_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_TRANSCRIPT_CACHE_MAX_ENTRIES = 200
+DEFAULT_TRANSCRIPT_NEGATIVE_CACHE_TTL_SECONDS = 6 * 3600
+
+
+def _default_data_dir() -> str:
+    # 공용 임시 디렉토리는 다른 사용자가 읽거나 바꿔치기할 수 있고 정리 때 지워지므로 사용자 데이터 디렉토리를 씁니다.
+    data_home = os.getenv("XDG_DATA_HOME", "").strip() or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(data_home, "yt_search")
+
+
+DEFAULT_TRANSCRIPT_CACHE_DB_PATH = os.path.join(_default_data_dir(), "transcripts.sqlite3")
+
+# ok: 대본 있음 / not_found, disabled: 자막 없음(부정 캐시) / empty: 자막은 있지만 텍스트가 비어 있음(부정 캐시)
+TranscriptCacheStatus = Literal["ok", "not_found", "disabled", "empty"]
+
+
+@dataclass(frozen=True)
+class CachedTranscript:
+    status: TranscriptCacheStatus
+    # 언어 키 항목에서 status == "ok"일 때만 채워집니다. TranscriptResult를 asdict로 바꾼 값입니다.
+    payload: dict | None = None
+    # 요청 키 항목에서 status == "ok"일 때, 그 우선순위로 실제 선택된 자막 언어입니다.
+    language: str | None = None
+
+
+def build_transcript_cache_key(video_id: str, languages: list[str]) -> str:
+    """영상 id + 언어 우선순위(요청 키). 성공이면 실제로 선택된 언어만 가리키고, 대본은 언어 키에 한 번만 둡니다."""
+    return f"{video_id}|{','.join(language.lower() for language in languages)}"
+
+
+def build_transcript_language_key(video_id: str, language: str) -> str:
+    """영상 id + 실제로 선택된 자막 언어(언어 키). 우선순위가 달라도 같은 자막이면 같은 항목을 씁니다."""
+    return f"{video_id}@{language.lower()}"
+
+
+def _encode_payload(payload: dict) -> bytes:
+    return zlib.compress(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def _decode_payload(blob: bytes) -> dict:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+class SqliteTranscriptStore:
+    """zlib으로 압축한 대본을 SQLite 파일에 보관하는 디스크 계층.
+
+    만료 시각은 벽시계(time.time) 기준이라 프로세스를 다시 띄워도 유지됩니다.
+    같은 파일을 여러 워커가 함께 쓸 수 있도록 WAL 모드를 사용합니다.
+    """
+
+    def __init__(self, path: str, *, clock: Callable[[], float] = time.time) -> None:
+        self._path = path
+        self._clock = clock
+        self._connection: sqlite3.Connection | None = None
+        self._lock = Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, mode=0o700, exist_ok=True)
+            connection = sqlite3.connect(self._path, check_same_thread=False, timeout=5.0)
+            os.chmod(self._path, 0o600)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS transcript_entries ("
+                "cache_key TEXT PRIMARY KEY, status TEXT NOT NULL, payload BLOB, language TEXT, "
+                "expires_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS transcript_entries_expires_at ON transcript_entries (expires_at)"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def get(self, key: str) -> tuple[CachedTranscript, float] | None:
+        """(값, 남은 TTL 초)를 돌려줍니다. 없거나 만료됐으면 None입니다."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT status, payload, language, expires_at FROM transcript_entries WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        status, blob, language, expires_at = row
+        remaining_seconds = expires_at - self._clock()
+        if remaining_seconds <= 0:
+            return None
+        payload = _decode_payload(blob) if blob is not None else None
+        return CachedTranscript(status=status, payload=payload, language=language), remaining_seconds
+
+    def set(self, key: str, value: CachedTranscript, ttl_seconds: float) -> None:
+        now = self._clock()
+        blob = _encode_payload(value.payload) if value.payload is not None else None
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO transcript_entries (cache_key, status, payload, language, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, value.status, blob, value.language, now + ttl_seconds),
+            )
+            connection.execute("DELETE FROM transcript_entries WHERE expires_at <= ?", (now,))
+            connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class TranscriptCache:
+    """메모리 LRU + 디스크(SQLite) 두 계층 대본 캐시.
+
+    - 조회는 메모리 → 디스크 순이며, 디스크에서 찾으면 남은 TTL만큼 메모리에도 올립니다.
+    - 자막 없음 같은 결과는 negative_ttl_seconds 동안만 보관합니다.
+    - 디스크 오류는 경고만 남기고 캐시 없이 진행합니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        memory: TtlLruCache[str, CachedTranscript],
+        store: SqliteTranscriptStore | None,
+        ttl_seconds: float,
+        negative_ttl_seconds: float,
+    ) -> None:
+        self._memory = memory
+        self._store = store
+        self._ttl_seconds = ttl_seconds
+        self._negative_ttl_seconds = negative_ttl_seconds
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl_seconds > 0
+
+    def get(self, key: str) -> CachedTranscript | None:
+        if not self.enabled:
+            return None
+
+        cached = self._memory.get(key)
+        if cached is not None or self._store is None:
+            return cached
+
+        try:
+            stored = self._store.get(key)
+        except (sqlite3.Error, OSError):
+            logger.warning("Transcript disk cache read failed: key=%s", key, exc_info=True)
+            return None
+        if stored is None:
+            return None
+        value, remaining_seconds = stored
+        self._memory.set(key, value, ttl_seconds=remaining_seconds)
+        return value
+
+    def set(self, key: str, value: CachedTranscript) -> None:
+        if not self.enabled:
+            return
+
+        ttl_seconds = self._ttl_seconds if value.status == "ok" else min(self._ttl_seconds, self._negative_ttl_seconds)
+        if ttl_seconds <= 0:
+            return
+        self._memory.set(key, value, ttl_seconds=ttl_seconds)
+        if self._store is None:
+            return
+        try:
+            self._store.set(key, value, ttl_seconds)
+        except (sqlite3.Error, OSError):
+            logger.warning("Transcript disk cache write failed: key=%s", key, exc_info=True)
+
+    def clear_memory(self) -> None:
+        self._memory.clear()
+
+
+def build_transcript_cache_from_env() -> TranscriptCache:
+    ttl_seconds, max_entries = read_cache_settings(
+        "TRANSCRIPT_CACHE",
+        default_ttl_seconds=DEFAULT_TRANSCRIPT_CACHE_TTL_SECONDS,
+        default_max_entries=DEFAULT_TRANSCRIPT_CACHE_MAX_ENTRIES,
+    )
+    try:
+        negative_ttl_seconds = float(
+            os.getenv("TRANSCRIPT_NEGATIVE_CACHE_TTL_SECONDS", str(DEFAULT_TRANSCRIPT_NEGATIVE_CACHE_TTL_SECONDS))
+        )
+    except ValueError:
+        negative_ttl_seconds = DEFAULT_TRANSCRIPT_NEGATIVE_CACHE_TTL_SECONDS
+    # 기본은 사용자 데이터 디렉토리(XDG_DATA_HOME 또는 ~/.local/share)의 yt_search/transcripts.sqlite3입니다.
+    # 빈 값이면 디스크 계층 없이 메모리 캐시만 씁니다.
+    db_path = os.getenv("TRANSCRIPT_CACHE_DB_PATH", DEFAULT_TRANSCRIPT_CACHE_DB_PATH).strip()
+    return TranscriptCache(
+        memory=TtlLruCache(ttl_seconds=ttl_seconds, max_entries=max_entries),
+        store=SqliteTranscriptStore(db_path) if db_path else None,
+        ttl_seconds=ttl_seconds,
+        negative_ttl_seconds=negative_ttl_seconds,
+    )
+
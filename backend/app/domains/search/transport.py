@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections.abc import Coroutine
+from contextvars import ContextVar
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, TypeVar
+from weakref import WeakKeyDictionary
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_POOL_SIZE = 20
+DEFAULT_KEEPALIVE_SECONDS = 30.0
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 3.0
+DEFAULT_READ_TIMEOUT_SECONDS = 10.0
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+@dataclass(frozen=True)
+class TransportSettings:
+    """YouTube API 커넥션 풀 설정.
+
+    - pool_size: 동시에 열어 둘 수 있는 최대 연결 수 (keep-alive 연결도 같은 수만큼 유지)
+    - keepalive_seconds: 유휴 연결을 재사용 가능 상태로 두는 시간
+    - http2: `h2` 패키지가 설치된 경우에만 HTTP/2 사용
+    """
+
+    pool_size: int
+    keepalive_seconds: float
+    connect_timeout_seconds: float
+    read_timeout_seconds: float
+    http2: bool
+
+    @classmethod
+    def from_env(cls) -> "TransportSettings":
+        return cls(
+            pool_size=max(1, _env_int("YOUTUBE_HTTP_POOL_SIZE", DEFAULT_POOL_SIZE)),
+            keepalive_seconds=_env_float("YOUTUBE_HTTP_KEEPALIVE_SECONDS", DEFAULT_KEEPALIVE_SECONDS),
+            connect_timeout_seconds=_env_float(
+                "YOUTUBE_HTTP_CONNECT_TIMEOUT_SECONDS",
+                DEFAULT_CONNECT_TIMEOUT_SECONDS,
+            ),
+            read_timeout_seconds=_env_float("YOUTUBE_API_TIMEOUT_SECONDS", DEFAULT_READ_TIMEOUT_SECONDS),
+            http2=_env_flag("YOUTUBE_HTTP2_ENABLED"),
+        )
+
+    def build_timeout(self, read_timeout_seconds: float | None = None) -> httpx.Timeout:
+        return httpx.Timeout(
+            read_timeout_seconds if read_timeout_seconds is not None else self.read_timeout_seconds,
+            connect=self.connect_timeout_seconds,
+        )
+
+
+def _resolve_http2(requested: bool) -> bool:
+    if not requested:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.warning("YOUTUBE_HTTP2_ENABLED is set but the h2 package is missing; falling back to HTTP/1.1")
+        return False
+    return True
+
+
+def _build_limits(settings: TransportSettings) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.pool_size,
+        max_keepalive_connections=settings.pool_size,
+        keepalive_expiry=settings.keepalive_seconds,
+    )
+
+
+def build_http_client(settings: TransportSettings, transport: httpx.BaseTransport | None = None) -> httpx.Client:
+    return httpx.Client(
+        http2=_resolve_http2(settings.http2),
+        limits=_build_limits(settings),
+        timeout=settings.build_timeout(),
+        transport=transport,
+    )
+
+
+def build_async_http_client(
+    settings: TransportSettings,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=_resolve_http2(settings.http2),
+        limits=_build_limits(settings),
+        timeout=settings.build_timeout(),
+        transport=transport,
+    )
+
+
+_shared_lock = Lock()
+_shared_settings: TransportSettings | None = None
+_shared_client: httpx.Client | None = None
+# AsyncClient의 연결은 만들어진 이벤트 루프에 묶이므로 루프마다 하나씩 둡니다.
+_shared_async_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = WeakKeyDictionary()
+_blocking_transport: ContextVar[bool] = ContextVar("youtube_blocking_transport", default=False)
+
+
+def get_transport_settings() -> TransportSettings:
+    global _shared_settings
+    with _shared_lock:
+        if _shared_settings is None:
+            _shared_settings = TransportSettings.from_env()
+        return _shared_settings
+
+
+def get_shared_http_client() -> httpx.Client:
+    """프로세스 전체에서 공유하는 keep-alive 커넥션 풀을 반환합니다."""
+    global _shared_client
+    settings = get_transport_settings()
+    with _shared_lock:
+        if _shared_client is None or _shared_client.is_closed:
+            _shared_client = build_http_client(settings)
+        return _shared_client
+
+
+def get_shared_async_http_client() -> httpx.AsyncClient:
+    """현재 이벤트 루프에서 공유하는 비동기 keep-alive 커넥션 풀을 반환합니다."""
+    loop = asyncio.get_running_loop()
+    settings = get_transport_settings()
+    with _shared_lock:
+        async_client = _shared_async_clients.get(loop)
+        if async_client is None or async_client.is_closed:
+            async_client = build_async_http_client(settings)
+            _shared_async_clients[loop] = async_client
+        return async_client
+
+
+def is_blocking_transport() -> bool:
+    return _blocking_transport.get()
+
+
+def run_with_blocking_transport(coroutine: Coroutine[Any, Any, T]) -> T:
+    """동기 코드에서 async 검색 경로를 실행합니다.
+
+    새 이벤트 루프에서 실행되므로 내부 YouTube 호출은 공용 동기 풀을 사용합니다.
+    """
+    token = _blocking_transport.set(True)
+    try:
+        return asyncio.run(coroutine)
+    finally:
+        _blocking_transport.reset(token)
+
+
+async def aclose_shared_http_clients() -> None:
+    with _shared_lock:
+        async_clients = list(_shared_async_clients.values())
+        _shared_async_clients.clear()
+    for async_client in async_clients:
+        await async_client.aclose()
+    close_shared_http_client()
+
+
+def close_shared_http_client() -> None:
+    global _shared_client, _shared_settings
+    with _shared_lock:
+        if _shared_client is not None:
+            _shared_client.close()
+        _shared_client = None
+        _shared_settings = None
@@ -1,12 +1,23 @@
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from .core.compression import CompressionMiddleware
+
 from .domains.analysis.router import router as analysis_router
 from .domains.search.router import router as search_router
+from .domains.search.transport import aclose_shared_http_clients
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    yield
+    await aclose_shared_http_clients()
+
 
-app = FastAPI(title="yt_search backend", version="0.1.0")
+app = FastAPI(title="yt_search backend", version="0.1.0", lifespan=lifespan)
 
 allowed_origins = [
     origin.strip()
@@ -22,6 +33,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축(br/gzip)은 CORS 헤더까지 붙은 최종 응답에 적용되도록 가장 바깥에 둡니다.
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1000")),
+    gzip_level=int(os.getenv("RESPONSE_GZIP_LEVEL", "6")),
+    brotli_quality=int(os.getenv("RESPONSE_BROTLI_QUALITY", "4")),
+)
+
 app.include_router(analysis_router)
 app.include_router(search_router)
 
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import unittest
+import zlib
+from unittest.mock import patch
+
+from fastapi import FastAPI, Header
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+from fastapi.testclient import TestClient
+
+from backend.app.core import compression
+from backend.app.core.compression import CompressionMiddleware, encoded_etag, select_content_encoding, strip_encoded_etag
+from backend.app.core.response import conditional_success_response, compute_etag, etag_matches
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=200)
+
+    @app.get("/large")
+    def large():
+        return conditional_success_response({"items": ["가족 대화법"] * 100}, "req_test", None)
+
+    @app.get("/small")
+    def small():
+        return JSONResponse({"items": []})
+
+    @app.get("/conditional/{size}")
+    def conditional(size: str, if_none_match: str | None = Header(default=None, alias="If-None-Match")):
+        items = ["가족 대화법"] * (100 if size == "large" else 1)
+        return conditional_success_response({"items": items}, "req_test", if_none_match)
+
+    @app.get("/binary")
+    def binary():
+        return Response(content=b"\x00" * 500, media_type="image/png")
+
+    @app.get("/text")
+    def text():
+        return PlainTextResponse("가" * 500)
+
+    return app
+
+
+class ContentEncodingSelectionTest(unittest.TestCase):
+    def test_prefers_brotli_only_when_available(self) -> None:
+        with patch.object(compression, "brotli", object()):
+            self.assertEqual(select_content_encoding("gzip, deflate, br"), "br")
+            self.assertEqual(select_content_encoding("gzip;q=1.0, br;q=0.5"), "gzip")
+            self.assertEqual(select_content_encoding("*"), "br")
+        with patch.object(compression, "brotli", None):
+            self.assertEqual(select_content_encoding("gzip, deflate, br"), "gzip")
+            self.assertIsNone(select_content_encoding("br"))
+        self.assertIsNone(select_content_encoding("gzip;q=0, identity"))
+        self.assertIsNone(select_content_encoding(""))
+
+    def test_encoded_etag_round_trips(self) -> None:
+        etag = compute_etag({"items": [1]})
+        self.assertEqual(strip_encoded_etag(encoded_etag(etag, "gzip")), etag)
+        self.assertTrue(etag_matches(f'W/{encoded_etag(etag, "br")}, "other"', etag))
+        self.assertFalse(etag_matches('"other"', etag))
+
+
+class CompressionMiddlewareTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = TestClient(build_app())
+
+    def test_large_json_is_gzipped_with_vary(self) -> None:
+        response = self.client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(response.headers["vary"], "Accept-Encoding")
+        self.assertEqual(response.json()["data"]["items"][0], "가족 대화법")
+
+    def test_small_binary_and_unrequested_responses_are_left_alone(self) -> None:
+        small = self.client.get("/small", headers={"Accept-Encoding": "gzip"})
+        binary = self.client.get("/binary", headers={"Accept-Encoding": "gzip"})
+        identity = self.client.get("/large", headers={"Accept-Encoding": "identity"})
+
+        self.assertNotIn("content-encoding", small.headers)
+        self.assertEqual(small.headers["vary"], "Accept-Encoding")
+        self.assertNotIn("content-encoding", binary.headers)
+        self.assertNotIn("content-encoding", identity.headers)
+        self.assertEqual(self.client.get("/text").headers["content-encoding"], "gzip")
+
+    def test_304_etag_matches_the_200_it_revalidates(self) -> None:
+        for size in ("small", "large"):
+            with self.subTest(size=size):
+                full = self.client.get(f"/conditional/{size}", headers={"Accept-Encoding": "gzip"})
+                revalidated = self.client.get(
+                    f"/conditional/{size}",
+                    headers={"Accept-Encoding": "gzip", "If-None-Match": full.headers["etag"]},
+                )
+
+                self.assertEqual(full.status_code, 200)
+                self.assertEqual(full.headers["content-encoding"], "gzip")
+                self.assertEqual(revalidated.status_code, 304)
+                self.assertEqual(revalidated.headers["etag"], full.headers["etag"])
+
+    def test_streamed_chunks_are_flushed_individually(self) -> None:
+        async def streaming_app(scope, receive, send) -> None:
+            await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/x-ndjson")]})
+            for index in range(3):
+                await send({"type": "http.response.body", "body": f'{{"line":{index}}}\n'.encode(), "more_body": True})
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+        sent: list[dict] = []
+
+        async def capture(message: dict) -> None:
+            sent.append(message)
+
+        scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+        asyncio.run(CompressionMiddleware(streaming_app)(scope, None, capture))
+
+        self.assertIn((b"content-encoding", b"gzip"), sent[0]["headers"])
+        # 줄마다 sync flush하므로 각 조각만으로도 해당 줄을 바로 풀 수 있습니다.
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        decoded = [decompressor.decompress(message["body"]) for message in sent[1:]]
+        self.assertEqual(decoded, [b'{"line":0}\n', b'{"line":1}\n', b'{"line":2}\n', b""])
+        self.assertTrue(decompressor.eof)
+
+    def test_gzip_body_is_standard_gzip(self) -> None:
+        with self.client.stream("GET", "/large", headers={"Accept-Encoding": "gzip"}) as response:
+            raw = b"".join(response.iter_raw())
+        self.assertIn("가족 대화법".encode(), gzip.decompress(raw))
+
+
+if __name__ == "__main__":
+    unittest.main()
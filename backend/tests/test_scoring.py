@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+import random
 import unittest
 
+import numpy as np
+
 from backend.app.domains.search.scoring import (
     classify_contribution_grade,
+    classify_contribution_grades,
     compute_contribution,
     compute_engagement_rate,
+    compute_exposure_columns,
     compute_exposure_score,
+    compute_performance_columns,
     compute_performance_score,
     is_hot_video,
+    is_hot_video_columns,
+    nan_to_none,
+    to_epoch_microseconds,
 )
 
 
@@ -49,6 +58,65 @@ class ScoringTest(unittest.TestCase):
         self.assertTrue(is_hot_video(220.0, 70.0))
         self.assertFalse(is_hot_video(None, 70.0))
 
+    def test_batch_columns_match_scalar_functions(self) -> None:
+        rng = random.Random(7)
+        now = datetime(2026, 6, 1, 12, 0, tzinfo=timezone.utc)
+        titles = ["가족 갈등 대화법", "대화 잘하는 법", "브이로그", "", "가족 여행 대화 모음"]
+        rows = [
+            {
+                "view_count": rng.choice([0, 1, 999, rng.randint(0, 50_000_000)]),
+                "subscriber_count": rng.choice([0, 1, rng.randint(0, 2_000_000)]),
+                "is_public": rng.random() > 0.2,
+                "like_count": rng.choice([0, rng.randint(0, 100_000)]),
+                "comment_count": rng.choice([0, rng.randint(0, 10_000)]),
+                "total_video_count": rng.randint(0, 1000),
+                "title": rng.choice(titles),
+                "published_at": now - timedelta(seconds=rng.randint(-86_400, 900 * 86_400)),
+            }
+            for _ in range(500)
+        ]
+
+        performance = compute_performance_columns(
+            view_counts=np.array([row["view_count"] for row in rows]),
+            subscriber_counts=np.array([row["subscriber_count"] for row in rows]),
+            is_subscriber_public=np.array([row["is_public"] for row in rows]),
+            like_counts=np.array([row["like_count"] for row in rows]),
+            comment_counts=np.array([row["comment_count"] for row in rows]),
+        )
+        exposure = compute_exposure_columns(
+            keyword="가족 대화",
+            titles=[row["title"] for row in rows],
+            subscriber_counts=np.array([row["subscriber_count"] for row in rows]),
+            engagement_rates=performance.engagement_rate,
+            total_video_counts=np.array([row["total_video_count"] for row in rows]),
+            published_at_us=to_epoch_microseconds([row["published_at"] for row in rows]),
+            now=now,
+        )
+        grades = classify_contribution_grades(performance.contribution)
+        hot_flags = is_hot_video_columns(performance.contribution, exposure).tolist()
+
+        for index, row in enumerate(rows):
+            contribution = compute_contribution(row["view_count"], row["subscriber_count"], row["is_public"])
+            engagement_rate = compute_engagement_rate(row["view_count"], row["like_count"], row["comment_count"])
+            exposure_score = compute_exposure_score(
+                keyword="가족 대화",
+                title=row["title"],
+                subscriber_count=row["subscriber_count"],
+                engagement_rate=engagement_rate,
+                total_video_count=row["total_video_count"],
+                published_at=row["published_at"],
+                now=now,
+            )
+            self.assertEqual(nan_to_none(performance.contribution)[index], contribution)
+            self.assertEqual(nan_to_none(performance.engagement_rate)[index], engagement_rate)
+            self.assertEqual(
+                performance.performance_score[index],
+                compute_performance_score(contribution, engagement_rate, row["view_count"]),
+            )
+            self.assertEqual(exposure[index], exposure_score)
+            self.assertEqual(grades[index], classify_contribution_grade(contribution))
+            self.assertEqual(hot_flags[index], is_hot_video(contribution, exposure_score))
+
 
 if __name__ == "__main__":
     unittest.main()
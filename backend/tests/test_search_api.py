@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import unittest
 from datetime import datetime, timezone
 from unittest.mock import patch
@@ -12,16 +13,49 @@ from backend.app.domains.search.client import (
     SearchUpstreamError,
     SearchUpstreamUnavailableError,
 )
-from backend.app.domains.search.schemas import SearchVideoRecord
+from backend.app.domains.search.pagination import _encode_cursor
+from backend.app.domains.search.schemas import SearchRawResultItem, SearchResultFormat, SearchResultItem, SearchVideoRecord
+from backend.app.domains.search.service import SearchStreamEvent
 from backend.app.main import app
 
 
+def build_record(video_id: str, *, title: str) -> SearchVideoRecord:
+    return SearchVideoRecord(
+        video_id=video_id,
+        title=title,
+        channel_name="마음연구소",
+        thumbnail_url="https://i.ytimg.com/sample.jpg",
+        duration_seconds=58,
+        published_at=datetime(2026, 3, 1, tzinfo=timezone.utc),
+        view_count=1000,
+        subscriber_count=173000,
+        like_count=12,
+        comment_count=3,
+        channel_published_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        country_code="KR",
+        total_video_count=11,
+        subscription_rate=1.3,
+        annual_subscriber_growth=84000,
+        uploads_per_week=1.2,
+        channel_grade="C1",
+        is_short_form=True,
+        has_script=False,
+        is_subscriber_public=True,
+        contribution=None,
+        contribution_grade="Normal",
+        engagement_rate=None,
+        performance_score=50.0,
+        exposure_score=50.0,
+        is_hot_video=False,
+    )
+
+
 class SearchApiContractTest(unittest.TestCase):
     def setUp(self) -> None:
         self.client = TestClient(app)
 
     def test_get_search_videos_success_contract(self) -> None:
-        with patch("backend.app.domains.search.router.search_videos") as mocked_search:
+        with patch("backend.app.domains.search.router.search_videos_async") as mocked_search:
             mocked_search.return_value = [
                 SearchVideoRecord(
                     video_id="video_family_talk_001",
@@ -117,6 +151,219 @@ class SearchApiContractTest(unittest.TestCase):
         self.assertIn("contributionGrade", first_item)
         self.assertIn("commentCount", first_item)
         self.assertIn("likeCount", first_item)
+        # 단일 패스 직렬화 결과가 문서용 SearchResultItem 스키마와 계속 일치해야 합니다.
+        validated = SearchResultItem.model_validate(first_item)
+        self.assertEqual(validated.model_dump(by_alias=True), first_item)
+
+    def test_get_search_videos_raw_format_returns_numbers_only(self) -> None:
+        record = SearchVideoRecord(
+            video_id="video_family_talk_001",
+            title="가족과 대화가 자꾸 꼬일 때 감정 다루는 법",
+            channel_name="마음연구소",
+            thumbnail_url="https://i.ytimg.com/sample.jpg",
+            duration_seconds=58,
+            published_at=datetime(2026, 3, 1, tzinfo=timezone.utc),
+            view_count=420000,
+            subscriber_count=173000,
+            like_count=1200,
+            comment_count=230,
+            channel_published_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            country_code="KR",
+            total_video_count=11,
+            subscription_rate=1.3,
+            annual_subscriber_growth=84000,
+            uploads_per_week=1.2,
+            channel_grade="C1",
+            is_short_form=True,
+            has_script=False,
+            is_subscriber_public=True,
+            keyword_matched_terms=["가족"],
+            contribution=242.7,
+            contribution_grade="Good",
+            engagement_rate=0.34,
+            performance_score=74.2,
+            exposure_score=62.1,
+            is_hot_video=False,
+            badge_label="SHORTS",
+        )
+        with patch("backend.app.domains.search.router.search_videos_async") as mocked_search:
+            mocked_search.return_value = [record]
+            response = self.client.get("/api/search/videos", params={"q": "가족", "format": "raw"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mocked_search.call_args.kwargs["result_format"], SearchResultFormat.RAW)
+        first_item = response.json()["data"]["items"][0]
+        self.assertNotIn("viewCountText", first_item)
+        self.assertNotIn("recommendationReason", first_item)
+        self.assertEqual(first_item["publishedAt"], "2026-03-01T00:00:00Z")
+        self.assertEqual(first_item["uploadsPerWeek"], 1.2)
+        SearchRawResultItem.model_validate(first_item)
+
+    def test_get_search_videos_sparse_fields(self) -> None:
+        with patch("backend.app.domains.search.router.search_videos_async") as mocked_search:
+            mocked_search.return_value = []
+            response = self.client.get("/api/search/videos", params={"q": "가족", "fields": "title,viewCountText"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            mocked_search.call_args.kwargs["fields"],
+            frozenset({"video_id", "title", "view_count_text"}),
+        )
+
+    def test_get_search_videos_rejects_unknown_fields(self) -> None:
+        with patch("backend.app.domains.search.router.search_videos_async") as mocked_search:
+            response = self.client.get("/api/search/videos", params={"q": "가족", "fields": "title,unknownField"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error"]["code"], "SEARCH_INVALID_FIELDS")
+        mocked_search.assert_not_called()
+
+    def test_get_search_videos_pages_through_stored_result_set(self) -> None:
+        records = [build_record(f"video_{index:03d}", title=f"가족 영상 {index}") for index in range(5)]
+        with patch("backend.app.domains.search.router.search_videos_async") as mocked_search:
+            mocked_search.return_value = records
+            first = self.client.get(
+                "/api/search/videos",
+                params={"q": "가족", "format": "raw", "fields": "title", "pageSize": 2},
+            ).json()["data"]
+            second = self.client.get("/api/search/videos", params={"cursor": first["nextCursor"]}).json()["data"]
+            last = self.client.get(
+                "/api/search/videos",
+                params={"cursor": second["nextCursor"], "pageSize": 10},
+            ).json()["data"]
+
+        # 다음 페이지는 보관된 결과 집합을 잘라서만 만들므로 검색은 한 번만 실행됩니다.
+        self.assertEqual(mocked_search.call_count, 1)
+        self.assertEqual(first["totalCount"], 5)
+        self.assertEqual(first["items"], [{"videoId": "video_000", "title": "가족 영상 0"}, {"videoId": "video_001", "title": "가족 영상 1"}])
+        self.assertEqual([item["videoId"] for item in second["items"]], ["video_002", "video_003"])
+        self.assertEqual([item["videoId"] for item in last["items"]], ["video_004"])
+        self.assertIsNone(last["nextCursor"])
+
+    def test_get_search_videos_first_page_etag_is_stable_for_same_results(self) -> None:
+        records = [build_record(f"video_{index:03d}", title=f"가족 영상 {index}") for index in range(5)]
+        params = {"q": "가족", "pageSize": 2}
+        with patch("backend.app.domains.search.router.search_videos_async") as mocked_search:
+            mocked_search.return_value = records
+            first = self.client.get("/api/search/videos", params=params)
+            unchanged = self.client.get(
+                "/api/search/videos",
+                params=params,
+                headers={"If-None-Match": first.headers["etag"]},
+            )
+            next_page = self.client.get("/api/search/videos", params={"cursor": first.json()["data"]["nextCursor"]})
+
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertEqual(next_page.status_code, 200)
+        self.assertEqual([item["videoId"] for item in next_page.json()["data"]["items"]], ["video_002", "video_003"])
+
+    def test_get_search_videos_rejects_invalid_or_expired_cursor(self) -> None:
+        invalid = self.client.get("/api/search/videos", params={"cursor": "!!not-a-cursor"})
+        self.assertEqual(invalid.status_code, 400)
+        self.assertEqual(invalid.json()["error"]["code"], "SEARCH_INVALID_CURSOR")
+
+        expired = self.client.get("/api/search/videos", params={"cursor": _encode_cursor("missing", 24)})
+        self.assertEqual(expired.status_code, 410)
+        self.assertEqual(expired.json()["error"]["code"], "SEARCH_CURSOR_EXPIRED")
+
+    def test_get_search_videos_streams_ndjson_when_requested(self) -> None:
+        async def fake_stream(**_kwargs):
+            yield SearchStreamEvent(kind="rows", records=[build_record("video001", title="가족 1")])
+            yield SearchStreamEvent(kind="rows", records=[build_record("video002", title="가족 2")])
+            yield SearchStreamEvent(kind="done", records=[build_record("video002", title="가족 2")])
+
+        with patch("backend.app.domains.search.router.stream_search_videos_async", new=fake_stream):
+            response = self.client.get(
+                "/api/search/videos",
+                params={"q": "가족", "fields": "title"},
+                headers={"Accept": "application/x-ndjson"},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("application/x-ndjson"))
+        events = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual([event["type"] for event in events], ["rows", "rows", "done"])
+        self.assertEqual(events[0]["items"], [{"videoId": "video001", "title": "가족 1"}])
+        self.assertEqual(events[2]["order"], ["video002"])
+        self.assertIn("requestId", events[2]["meta"])
+
+    def test_get_search_videos_stream_reports_errors(self) -> None:
+        async def failing_before_first_page(**_kwargs):
+            raise SearchQuotaExceededError()
+            yield
+
+        async def failing_mid_stream(**_kwargs):
+            yield SearchStreamEvent(kind="rows", records=[build_record("video001", title="가족 1")])
+            raise SearchUpstreamUnavailableError()
+
+        headers = {"Accept": "application/x-ndjson"}
+        with patch("backend.app.domains.search.router.stream_search_videos_async", new=failing_before_first_page):
+            early = self.client.get("/api/search/videos", params={"q": "가족"}, headers=headers)
+        with patch("backend.app.domains.search.router.stream_search_videos_async", new=failing_mid_stream):
+            late = self.client.get("/api/search/videos", params={"q": "가족"}, headers=headers)
+
+        # 첫 이벤트 전 오류는 일반 에러 응답, 이후 오류는 마지막 error 이벤트로 전달됩니다.
+        self.assertEqual(early.status_code, 503)
+        self.assertEqual(early.json()["error"]["code"], "SEARCH_QUOTA_EXCEEDED")
+        self.assertEqual(late.status_code, 200)
+        events = [json.loads(line) for line in late.text.splitlines()]
+        self.assertEqual([event["type"] for event in events], ["rows", "error"])
+        self.assertEqual(events[1]["error"]["code"], "SEARCH_UPSTREAM_UNAVAILABLE")
+
+    def test_get_search_videos_etag_ignores_meta_and_tracks_data(self) -> None:
+        with patch("backend.app.domains.search.router.search_videos_async") as mocked_search:
+            mocked_search.return_value = [build_record("video001", title="가족 1")]
+            first = self.client.get("/api/search/videos", params={"q": "가족"})
+            unchanged = self.client.get(
+                "/api/search/videos",
+                params={"q": "가족"},
+                headers={"If-None-Match": first.headers["etag"]},
+            )
+            mocked_search.return_value = [build_record("video002", title="가족 2")]
+            changed = self.client.get(
+                "/api/search/videos",
+                params={"q": "가족"},
+                headers={"If-None-Match": first.headers["etag"]},
+            )
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers["etag"], first.headers["etag"])
+        self.assertEqual(changed.json()["data"]["items"][0]["videoId"], "video002")
+
+    def test_openapi_keeps_response_models_for_fast_responses(self) -> None:
+        schema = self.client.get("/openapi.json").json()
+        search_responses = schema["paths"]["/api/search/videos"]["get"]["responses"]
+        self.assertEqual(
+            search_responses["200"]["content"]["application/json"]["schema"]["$ref"],
+            "#/components/schemas/SearchSuccessResponse",
+        )
+        self.assertIn("application/x-ndjson", search_responses["200"]["content"])
+        transcript_responses = schema["paths"]["/api/search/transcript"]["get"]["responses"]
+        self.assertEqual(
+            transcript_responses["200"]["content"]["application/json"]["schema"]["$ref"],
+            "#/components/schemas/TranscriptSuccessResponse",
+        )
+
+    def test_post_search_videos_batch_contract(self) -> None:
+        with patch("backend.app.domains.search.router.search_videos_batch_async") as mocked_search:
+            mocked_search.return_value = []
+            response = self.client.post(
+                "/api/search/videos/batch",
+                json={"keywords": ["가족", "대화"], "sort": "views", "resultLimit": 100},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["data"]["items"], [])
+        self.assertEqual(mocked_search.call_args.kwargs["keywords"], ["가족", "대화"])
+        self.assertEqual(mocked_search.call_args.kwargs["result_limit"], 100)
+
+    def test_post_search_videos_batch_requires_query(self) -> None:
+        response = self.client.post("/api/search/videos/batch", json={"keywords": [" "], "channels": []})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error"]["code"], "SEARCH_QUERY_REQUIRED")
 
     def test_get_search_videos_returns_contract_error_when_query_missing(self) -> None:
         response = self.client.get(
@@ -130,7 +377,7 @@ class SearchApiContractTest(unittest.TestCase):
         self.assertEqual(body["error"]["code"], "SEARCH_QUERY_REQUIRED")
 
     def test_get_search_videos_is_not_404_for_existing_endpoint(self) -> None:
-        with patch("backend.app.domains.search.router.search_videos") as mocked_search:
+        with patch("backend.app.domains.search.router.search_videos_async") as mocked_search:
             mocked_search.return_value = []
             response = self.client.get(
                 "/api/search/videos",
@@ -144,7 +391,7 @@ class SearchApiContractTest(unittest.TestCase):
         self.assertEqual(body["data"]["items"], [])
 
     def test_get_search_videos_returns_quota_exceeded_contract(self) -> None:
-        with patch("backend.app.domains.search.router.search_videos") as mocked_search:
+        with patch("backend.app.domains.search.router.search_videos_async") as mocked_search:
             mocked_search.side_effect = SearchQuotaExceededError()
 
             response = self.client.get(
@@ -159,7 +406,7 @@ class SearchApiContractTest(unittest.TestCase):
         self.assertEqual(body["error"]["message"], "검색 한도에 도달했습니다. 잠시 후 다시 시도해 주세요.")
 
     def test_get_search_videos_returns_rate_limited_contract(self) -> None:
-        with patch("backend.app.domains.search.router.search_videos") as mocked_search:
+        with patch("backend.app.domains.search.router.search_videos_async") as mocked_search:
             mocked_search.side_effect = SearchRateLimitedError()
 
             response = self.client.get(
@@ -174,7 +421,7 @@ class SearchApiContractTest(unittest.TestCase):
         self.assertEqual(body["error"]["message"], "검색 요청이 많아 잠시 지연되고 있습니다. 잠시 후 다시 시도해 주세요.")
 
     def test_get_search_videos_returns_upstream_unavailable_contract(self) -> None:
-        with patch("backend.app.domains.search.router.search_videos") as mocked_search:
+        with patch("backend.app.domains.search.router.search_videos_async") as mocked_search:
             mocked_search.side_effect = SearchUpstreamUnavailableError()
 
             response = self.client.get(
@@ -189,7 +436,7 @@ class SearchApiContractTest(unittest.TestCase):
         self.assertEqual(body["error"]["message"], "검색 서비스 연결이 원활하지 않습니다. 잠시 후 다시 시도해 주세요.")
 
     def test_get_search_videos_returns_upstream_error_contract(self) -> None:
-        with patch("backend.app.domains.search.router.search_videos") as mocked_search:
+        with patch("backend.app.domains.search.router.search_videos_async") as mocked_search:
             mocked_search.side_effect = SearchUpstreamError(message="bad gateway")
 
             response = self.client.get(
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import unittest
+
+from backend.app.domains.search.cache import TtlLruCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TtlLruCacheTest(unittest.TestCase):
+    def test_entries_expire_after_ttl(self) -> None:
+        clock = FakeClock()
+        cache: TtlLruCache[str, int] = TtlLruCache(ttl_seconds=10, max_entries=10, clock=clock)
+        cache.set("channel001", 1)
+
+        clock.now = 9.9
+        self.assertEqual(cache.get("channel001"), 1)
+        clock.now = 10.0
+        self.assertIsNone(cache.get("channel001"))
+        self.assertEqual(len(cache), 0)
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache: TtlLruCache[str, int] = TtlLruCache(ttl_seconds=60, max_entries=2, clock=FakeClock())
+        cache.set("channel001", 1)
+        cache.set("channel002", 2)
+        cache.get("channel001")
+        cache.set("channel003", 3)
+
+        self.assertEqual(cache.get_many(["channel001", "channel002", "channel003"]), {"channel001": 1, "channel003": 3})
+
+    def test_disabled_cache_never_stores(self) -> None:
+        cache: TtlLruCache[str, int] = TtlLruCache(ttl_seconds=0, max_entries=10)
+        cache.set("channel001", 1)
+
+        self.assertIsNone(cache.get("channel001"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,17 +1,47 @@
 from __future__ import annotations
 
+import asyncio
+import threading
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, patch
+
+import httpx
 
 from backend.app.domains.search.client import (
+    YOUTUBE_CHANNELS_URL,
+    YOUTUBE_SEARCH_URL,
+    YOUTUBE_VIDEOS_URL,
     SearchQuotaExceededError,
     SearchUpstreamUnavailableError,
     YouTubeSearchClient,
+    shared_channel_cache,
+    shared_circuit_breakers,
+    shared_video_static_cache,
+    shared_video_statistics_cache,
+)
+from backend.app.domains.search.cache import TtlLruCache
+from backend.app.domains.search.quota import shared_key_scheduler
+from backend.app.domains.search.resilience import CircuitBreaker, CircuitState, RetryPolicy
+from backend.app.domains.search.schemas import SearchDurationBucket, SearchPeriodOption, SearchSortOption
+from backend.app.domains.search.transport import (
+    TransportSettings,
+    build_http_client,
+    close_shared_http_client,
+    get_shared_http_client,
+    get_transport_settings,
+    run_with_blocking_transport,
 )
-from backend.app.domains.search.schemas import SearchPeriodOption, SearchSortOption
 
 
 class SearchClientTest(unittest.TestCase):
+    def setUp(self) -> None:
+        shared_channel_cache.clear()
+        shared_video_static_cache.clear()
+        shared_video_statistics_cache.clear()
+        shared_key_scheduler.reset()
+        for breaker in shared_circuit_breakers.values():
+            breaker.reset()
+
     def test_fetch_videos_uses_channel_as_query_when_keyword_is_empty(self) -> None:
         with patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}, clear=False):
             client = YouTubeSearchClient()
@@ -49,15 +79,74 @@ class SearchClientTest(unittest.TestCase):
         self.assertEqual(first_call_params["q"], "연구소")
         self.assertEqual(len(rows), 1)
 
-    def test_map_http_error_invalid_api_key_maps_to_unavailable(self) -> None:
-        client = YouTubeSearchClient()
-        http_error = Mock()
-        http_error.code = 400
-        http_error.read.return_value = (
-            b'{"error":{"code":400,"message":"API key not valid. Please pass a valid API key."}}'
+    def test_supported_filters_are_pushed_down_with_field_projections(self) -> None:
+        with patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}, clear=False):
+            client = YouTubeSearchClient()
+            search_response = {"items": [{"id": {"videoId": "abc123"}, "snippet": {"channelId": "channel001"}}]}
+            videos_response = {
+                "items": [
+                    {
+                        "id": "abc123",
+                        "snippet": {
+                            "title": "가족 대화법",
+                            "channelId": "channel001",
+                            "channelTitle": "연구소",
+                            "publishedAt": "2026-01-01T00:00:00Z",
+                        },
+                        "statistics": {"viewCount": "100"},
+                        "contentDetails": {"duration": "PT5M"},
+                    }
+                ]
+            }
+            channels_response = {"items": [{"id": "channel001", "snippet": {"country": "KR"}, "statistics": {}}]}
+
+            with patch.object(
+                client,
+                "_call_youtube_api",
+                side_effect=[search_response, videos_response, channels_response],
+            ) as mocked_call:
+                client.fetch_videos(
+                    keyword="가족",
+                    channel="",
+                    sort=SearchSortOption.RELEVANCE,
+                    period=SearchPeriodOption.LAST_7_DAYS,
+                    result_limit=50,
+                    duration_bucket=SearchDurationBucket.BETWEEN_4M_AND_20M,
+                    country="kr",
+                )
+
+        params_by_url = {call.args[0]: call.args[1] for call in mocked_call.call_args_list}
+        search_params = params_by_url[YOUTUBE_SEARCH_URL]
+        self.assertEqual(search_params["videoDuration"], "medium")
+        self.assertEqual(search_params["regionCode"], "KR")
+        self.assertEqual(search_params["relevanceLanguage"], "ko")
+        self.assertTrue(all("fields" in params for params in params_by_url.values()))
+
+        query_key = client.build_query_key(
+            keyword="가족",
+            channel="",
+            sort=SearchSortOption.RELEVANCE,
+            period=SearchPeriodOption.LAST_7_DAYS,
+            result_limit=50,
         )
+        pushed_down_key = client.build_query_key(
+            keyword="가족",
+            channel="",
+            sort=SearchSortOption.RELEVANCE,
+            period=SearchPeriodOption.LAST_7_DAYS,
+            result_limit=50,
+            duration_bucket=SearchDurationBucket.BETWEEN_4M_AND_20M,
+            country="kr",
+        )
+        self.assertNotEqual(query_key, pushed_down_key)
+
+    def test_map_http_status_invalid_api_key_maps_to_unavailable(self) -> None:
+        client = YouTubeSearchClient()
 
-        mapped = client._map_http_error(http_error)
+        mapped = client._map_http_status(
+            400,
+            b'{"error":{"code":400,"message":"API key not valid. Please pass a valid API key."}}',
+        )
 
         self.assertIsInstance(mapped, SearchUpstreamUnavailableError)
 
@@ -107,6 +196,555 @@ class SearchClientTest(unittest.TestCase):
         self.assertEqual(second_call_params["key"], "second-key")
         self.assertEqual(len(rows), 1)
 
+    def test_fetch_videos_follows_page_tokens_until_result_limit(self) -> None:
+        with patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}, clear=False):
+            client = YouTubeSearchClient()
+            all_video_ids = [f"video{index:03d}" for index in range(120)]
+            search_calls: list[dict[str, str]] = []
+            video_lookup_sizes: list[int] = []
+
+            def fake_call(url: str, params: dict[str, str]) -> dict:
+                if url == YOUTUBE_SEARCH_URL:
+                    search_calls.append(params)
+                    page_index = int(params.get("pageToken", "0"))
+                    page_ids = all_video_ids[page_index * 50 : (page_index + 1) * 50]
+                    response: dict = {"items": [{"id": {"videoId": video_id}} for video_id in page_ids]}
+                    if (page_index + 1) * 50 < len(all_video_ids):
+                        response["nextPageToken"] = str(page_index + 1)
+                    return response
+                if url == YOUTUBE_VIDEOS_URL:
+                    requested_ids = params["id"].split(",")
+                    video_lookup_sizes.append(len(requested_ids))
+                    return {
+                        "items": [
+                            {
+                                "id": video_id,
+                                "snippet": {
+                                    "title": "가족 대화법",
+                                    "channelId": "channel001",
+                                    "channelTitle": "연구소",
+                                    "publishedAt": "2026-01-01T00:00:00Z",
+                                },
+                                "statistics": {"viewCount": "100"},
+                                "contentDetails": {"duration": "PT58S"},
+                            }
+                            for video_id in requested_ids
+                        ]
+                    }
+                return {"items": [{"id": "channel001", "snippet": {}, "statistics": {"subscriberCount": "10"}}]}
+
+            with patch.object(client, "_call_youtube_api", side_effect=fake_call):
+                rows = client.fetch_videos(
+                    keyword="가족",
+                    channel="",
+                    sort=SearchSortOption.RELEVANCE,
+                    period=SearchPeriodOption.LAST_7_DAYS,
+                    result_limit=120,
+                )
+
+        self.assertEqual(len(search_calls), 3)
+        self.assertNotIn("pageToken", search_calls[0])
+        self.assertEqual(search_calls[1]["pageToken"], "1")
+        self.assertEqual(sorted(video_lookup_sizes), [20, 50, 50])
+        self.assertEqual([row.video_id for row in rows], all_video_ids)
+        self.assertEqual(rows[0].subscriber_count, 10)
+
+    def test_call_youtube_api_uses_pooled_transport_and_maps_status(self) -> None:
+        requested_urls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested_urls.append(str(request.url))
+            if request.url.params.get("key") == "broken-key":
+                return httpx.Response(503, content=b"")
+            return httpx.Response(200, json={"items": []})
+
+        pooled_client = build_http_client(TransportSettings.from_env(), transport=httpx.MockTransport(handler))
+        client = YouTubeSearchClient()
+
+        with patch("backend.app.domains.search.client.get_shared_http_client", return_value=pooled_client):
+            parsed = client._call_youtube_api(YOUTUBE_SEARCH_URL, {"q": "가족", "key": "test-key"})
+            with self.assertRaises(SearchUpstreamUnavailableError):
+                client._call_youtube_api(YOUTUBE_SEARCH_URL, {"q": "가족", "key": "broken-key"})
+
+        self.assertEqual(parsed, {"items": []})
+        self.assertEqual(len(requested_urls), 2)
+        self.assertIn("key=test-key", requested_urls[0])
+
+    def test_shared_http_client_is_reused_and_reads_pool_settings_from_env(self) -> None:
+        close_shared_http_client()
+        with patch.dict("os.environ", {"YOUTUBE_HTTP_POOL_SIZE": "7"}, clear=False):
+            first = get_shared_http_client()
+            second = get_shared_http_client()
+            settings = get_transport_settings()
+
+        self.assertIs(first, second)
+        self.assertEqual(settings.pool_size, 7)
+        close_shared_http_client()
+
+    def test_fetch_videos_async_uses_async_transport(self) -> None:
+        with patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}, clear=False):
+            client = YouTubeSearchClient()
+            search_response = {"items": [{"id": {"videoId": "abc123"}}]}
+            videos_response = {
+                "items": [
+                    {
+                        "id": "abc123",
+                        "snippet": {
+                            "title": "가족 대화법",
+                            "channelTitle": "연구소",
+                            "publishedAt": "2026-01-01T00:00:00Z",
+                        },
+                        "statistics": {"viewCount": "100"},
+                        "contentDetails": {"duration": "PT58S"},
+                    }
+                ]
+            }
+
+            with patch.object(
+                client,
+                "_call_youtube_api_async",
+                new=AsyncMock(side_effect=[search_response, videos_response]),
+            ) as mocked_async_call, patch.object(client, "_call_youtube_api") as mocked_blocking_call:
+                rows = asyncio.run(
+                    client.fetch_videos_async(
+                        keyword="가족",
+                        channel="",
+                        sort=SearchSortOption.RELEVANCE,
+                        period=SearchPeriodOption.LAST_7_DAYS,
+                        result_limit=50,
+                    )
+                )
+
+        self.assertEqual(mocked_async_call.await_count, 2)
+        mocked_blocking_call.assert_not_called()
+        self.assertEqual([row.video_id for row in rows], ["abc123"])
+
+    def test_fetch_videos_requests_only_uncached_channel_ids(self) -> None:
+        def video_item(video_id: str, channel_id: str) -> dict:
+            return {
+                "id": video_id,
+                "snippet": {
+                    "title": "가족 대화법",
+                    "channelId": channel_id,
+                    "channelTitle": "연구소",
+                    "publishedAt": "2026-01-01T00:00:00Z",
+                },
+                "statistics": {"viewCount": "100"},
+                "contentDetails": {"duration": "PT58S"},
+            }
+
+        requested_channel_ids: list[str] = []
+
+        def fake_call(url: str, params: dict[str, str]) -> dict:
+            if url == YOUTUBE_SEARCH_URL:
+                return {"items": [{"id": {"videoId": "video001"}}, {"id": {"videoId": "video002"}}]}
+            if url == YOUTUBE_VIDEOS_URL:
+                channel_by_video = {"video001": "channel001", "video002": "channel002"}
+                return {"items": [video_item(video_id, channel_by_video[video_id]) for video_id in params["id"].split(",")]}
+            requested_channel_ids.append(params["id"])
+            return {
+                "items": [
+                    {"id": channel_id, "snippet": {"country": "KR"}, "statistics": {"subscriberCount": "10"}}
+                    for channel_id in params["id"].split(",")
+                ]
+            }
+
+        shared_channel_cache.set("channel001", {"id": "channel001", "snippet": {"country": "US"}, "statistics": {}})
+
+        with patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}, clear=False):
+            client = YouTubeSearchClient()
+            with patch.object(client, "_call_youtube_api", side_effect=fake_call):
+                first_rows = client.fetch_videos(
+                    keyword="가족",
+                    channel="",
+                    sort=SearchSortOption.RELEVANCE,
+                    period=SearchPeriodOption.LAST_7_DAYS,
+                    result_limit=50,
+                )
+                client.fetch_videos(
+                    keyword="가족",
+                    channel="",
+                    sort=SearchSortOption.RELEVANCE,
+                    period=SearchPeriodOption.LAST_7_DAYS,
+                    result_limit=50,
+                )
+
+        self.assertEqual(requested_channel_ids, ["channel002"])
+        self.assertEqual([row.country_code for row in first_rows], ["US", "KR"])
+
+    def test_fetch_videos_batch_shares_one_detail_lookup_for_union_of_ids(self) -> None:
+        def video_item(video_id: str) -> dict:
+            return {
+                "id": video_id,
+                "snippet": {
+                    "title": "가족 대화법",
+                    "channelId": f"channel_{video_id}",
+                    "channelTitle": "연구소",
+                    "publishedAt": "2026-01-01T00:00:00Z",
+                },
+                "statistics": {"viewCount": "100"},
+                "contentDetails": {"duration": "PT58S"},
+            }
+
+        hits_by_query = {"가족": ["video001", "video002"], "대화": ["video002", "video003"]}
+        detail_requests: list[tuple[str, str]] = []
+
+        def fake_call(url: str, params: dict[str, str]) -> dict:
+            if url == YOUTUBE_SEARCH_URL:
+                return {
+                    "items": [
+                        {"id": {"videoId": video_id}, "snippet": {"channelId": f"channel_{video_id}"}}
+                        for video_id in hits_by_query[params["q"]]
+                    ]
+                }
+            detail_requests.append((url, params["id"]))
+            if url == YOUTUBE_VIDEOS_URL:
+                return {"items": [video_item(video_id) for video_id in params["id"].split(",")]}
+            return {"items": [{"id": channel_id, "snippet": {}, "statistics": {}} for channel_id in params["id"].split(",")]}
+
+        with patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}, clear=False):
+            client = YouTubeSearchClient()
+            with patch.object(client, "_call_youtube_api", side_effect=fake_call):
+                rows_per_query = run_with_blocking_transport(
+                    client.fetch_videos_batch_async(
+                        queries=[("가족", ""), ("대화", "")],
+                        sort=SearchSortOption.RELEVANCE,
+                        period=SearchPeriodOption.LAST_7_DAYS,
+                        result_limit=50,
+                    )
+                )
+
+        self.assertEqual(
+            [[row.video_id for row in rows] for rows in rows_per_query],
+            [["video001", "video002"], ["video002", "video003"]],
+        )
+        self.assertEqual(
+            sorted(detail_requests),
+            [
+                (YOUTUBE_CHANNELS_URL, "channel_video001,channel_video002,channel_video003"),
+                (YOUTUBE_VIDEOS_URL, "video001,video002,video003"),
+            ],
+        )
+
+    def test_blocking_transport_sends_gathered_calls_concurrently(self) -> None:
+        # 두 검색이 동시에 나가야 barrier를 통과합니다. 순차 실행이면 timeout으로 깨집니다.
+        search_barrier = threading.Barrier(2, timeout=2)
+
+        def fake_call(url: str, params: dict[str, str]) -> dict:
+            if url == YOUTUBE_SEARCH_URL:
+                search_barrier.wait()
+            return {"items": []}
+
+        with patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}, clear=False):
+            client = YouTubeSearchClient()
+            with patch.object(client, "_call_youtube_api", side_effect=fake_call):
+                rows_per_query = run_with_blocking_transport(
+                    client.fetch_videos_batch_async(
+                        queries=[("가족", ""), ("대화", "")],
+                        sort=SearchSortOption.RELEVANCE,
+                        period=SearchPeriodOption.LAST_7_DAYS,
+                        result_limit=50,
+                    )
+                )
+
+        self.assertEqual(rows_per_query, [[], []])
+
+    def test_fetch_videos_refreshes_only_expired_video_statistics(self) -> None:
+        clock = {"now": 0.0}
+        statistics_cache: TtlLruCache[str, dict] = TtlLruCache(
+            ttl_seconds=60,
+            max_entries=100,
+            clock=lambda: clock["now"],
+        )
+        video_parts: list[str] = []
+
+        def fake_call(url: str, params: dict[str, str]) -> dict:
+            if url == YOUTUBE_SEARCH_URL:
+                return {"items": [{"id": {"videoId": "video001"}}]}
+            if url == YOUTUBE_VIDEOS_URL:
+                video_parts.append(params["part"])
+                item: dict = {"id": "video001", "statistics": {"viewCount": str(100 * len(video_parts))}}
+                if params["part"] != "statistics":
+                    item["snippet"] = {
+                        "title": "가족 대화법",
+                        "channelTitle": "연구소",
+                        "publishedAt": "2026-01-01T00:00:00Z",
+                    }
+                    item["contentDetails"] = {"duration": "PT58S"}
+                return {"items": [item]}
+            return {"items": []}
+
+        search_kwargs = {
+            "keyword": "가족",
+            "channel": "",
+            "sort": SearchSortOption.RELEVANCE,
+            "period": SearchPeriodOption.LAST_7_DAYS,
+            "result_limit": 50,
+        }
+
+        with patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}, clear=False):
+            client = YouTubeSearchClient(video_statistics_cache=statistics_cache)
+            with patch.object(client, "_call_youtube_api", side_effect=fake_call):
+                first_rows = client.fetch_videos(**search_kwargs)
+                cached_rows = client.fetch_videos(**search_kwargs)
+                clock["now"] = 61.0
+                refreshed_rows = client.fetch_videos(**search_kwargs)
+
+        self.assertEqual(video_parts, ["snippet,statistics,contentDetails", "statistics"])
+        self.assertEqual(first_rows[0].view_count, 100)
+        self.assertEqual(cached_rows[0].view_count, 100)
+        self.assertEqual(refreshed_rows[0].view_count, 200)
+        self.assertEqual(refreshed_rows[0].title, "가족 대화법")
+
+    def test_fetch_videos_skips_exhausted_key_without_round_trip(self) -> None:
+        search_response = {"items": [{"id": {"videoId": "abc123"}}]}
+        videos_response = {
+            "items": [
+                {
+                    "id": "abc123",
+                    "snippet": {
+                        "title": "가족 대화법",
+                        "channelTitle": "연구소",
+                        "publishedAt": "2026-01-01T00:00:00Z",
+                    },
+                    "statistics": {"viewCount": "100"},
+                    "contentDetails": {"duration": "PT58S"},
+                }
+            ]
+        }
+        shared_key_scheduler.mark_exhausted("first-key")
+
+        with patch.dict("os.environ", {"YOUTUBE_API_KEY": ""}, clear=False):
+            client = YouTubeSearchClient()
+            with patch.object(
+                client,
+                "_call_youtube_api",
+                side_effect=[search_response, videos_response],
+            ) as mocked_call:
+                client.fetch_videos(
+                    keyword="가족",
+                    channel="",
+                    sort=SearchSortOption.RELEVANCE,
+                    period=SearchPeriodOption.LAST_7_DAYS,
+                    result_limit=50,
+                    api_keys=["first-key", "second-key"],
+                )
+
+        used_keys = [call.args[1]["key"] for call in mocked_call.call_args_list]
+        self.assertEqual(used_keys, ["second-key", "second-key"])
+        self.assertEqual(shared_key_scheduler.used_units("second-key"), 101)
+
+    def test_server_key_is_used_only_after_user_keys(self) -> None:
+        shared_key_scheduler.record_usage("user-key", 500)
+
+        with patch.dict("os.environ", {"YOUTUBE_API_KEY": "server-key"}, clear=False):
+            client = YouTubeSearchClient()
+            with patch.object(client, "_call_youtube_api", return_value={"items": []}) as mocked_call:
+                client.fetch_videos(
+                    keyword="가족",
+                    channel="",
+                    sort=SearchSortOption.RELEVANCE,
+                    period=SearchPeriodOption.LAST_7_DAYS,
+                    result_limit=50,
+                    api_keys=["user-key"],
+                )
+
+        self.assertEqual([call.args[1]["key"] for call in mocked_call.call_args_list], ["user-key"])
+        self.assertEqual(shared_key_scheduler.used_units("server-key"), 0)
+
+    def test_quota_is_charged_per_request_actually_sent(self) -> None:
+        breakers = {YOUTUBE_SEARCH_URL: CircuitBreaker(failure_threshold=5, cooldown_seconds=60)}
+
+        with patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}, clear=False):
+            client = YouTubeSearchClient(
+                circuit_breakers=breakers,
+                retry_policy=RetryPolicy(max_attempts=2, base_delay_seconds=0.0),
+            )
+            with patch.object(
+                client,
+                "_call_youtube_api",
+                side_effect=[SearchUpstreamUnavailableError(retryable=True), {"items": []}],
+            ):
+                client.fetch_videos(
+                    keyword="가족",
+                    channel="",
+                    sort=SearchSortOption.RELEVANCE,
+                    period=SearchPeriodOption.LAST_7_DAYS,
+                    result_limit=50,
+                )
+            self.assertEqual(shared_key_scheduler.used_units("test-key"), 200)
+
+            # circuit open으로 거절된 호출은 보내지 않았으므로 할당량에 넣지 않습니다.
+            breaker = breakers[YOUTUBE_SEARCH_URL]
+            while (permit := breaker.allow_request()) is not None:
+                breaker.record_failure(permit)
+            with patch.object(client, "_call_youtube_api") as mocked_call:
+                with self.assertRaises(SearchUpstreamUnavailableError):
+                    client.fetch_videos(
+                        keyword="대화",
+                        channel="",
+                        sort=SearchSortOption.RELEVANCE,
+                        period=SearchPeriodOption.LAST_7_DAYS,
+                        result_limit=50,
+                    )
+            mocked_call.assert_not_called()
+            self.assertEqual(shared_key_scheduler.used_units("test-key"), 200)
+
+    def test_fetch_videos_raises_quota_exceeded_when_every_key_is_exhausted(self) -> None:
+        shared_key_scheduler.mark_exhausted("first-key")
+
+        with patch.dict("os.environ", {"YOUTUBE_API_KEY": ""}, clear=False):
+            client = YouTubeSearchClient()
+            with patch.object(client, "_call_youtube_api") as mocked_call:
+                with self.assertRaises(SearchQuotaExceededError):
+                    client.fetch_videos(
+                        keyword="가족",
+                        channel="",
+                        sort=SearchSortOption.RELEVANCE,
+                        period=SearchPeriodOption.LAST_7_DAYS,
+                        result_limit=50,
+                        api_keys=["first-key"],
+                    )
+
+        mocked_call.assert_not_called()
+
+    def test_fetch_videos_retries_retryable_upstream_errors(self) -> None:
+        search_response = {"items": []}
+
+        with patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}, clear=False):
+            client = YouTubeSearchClient(retry_policy=RetryPolicy(max_attempts=2, base_delay_seconds=0.0))
+            with patch.object(
+                client,
+                "_call_youtube_api",
+                side_effect=[SearchUpstreamUnavailableError(retryable=True), search_response],
+            ) as mocked_call:
+                rows = client.fetch_videos(
+                    keyword="가족",
+                    channel="",
+                    sort=SearchSortOption.RELEVANCE,
+                    period=SearchPeriodOption.LAST_7_DAYS,
+                    result_limit=50,
+                )
+
+        self.assertEqual(mocked_call.call_count, 2)
+        self.assertEqual(rows, [])
+
+    def test_invalid_key_probe_does_not_close_half_open_circuit(self) -> None:
+        clock = {"now": 0.0}
+        breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=10, clock=lambda: clock["now"])
+        breaker.record_failure(breaker.allow_request())
+        clock["now"] = 10.0
+
+        with patch.dict("os.environ", {"YOUTUBE_API_KEY": "broken-key"}, clear=False):
+            client = YouTubeSearchClient(
+                circuit_breakers={YOUTUBE_SEARCH_URL: breaker},
+                retry_policy=RetryPolicy(max_attempts=0),
+            )
+            with patch.object(
+                client,
+                "_call_youtube_api",
+                side_effect=SearchUpstreamUnavailableError(message="youtube api key is invalid"),
+            ):
+                with self.assertRaises(SearchUpstreamUnavailableError):
+                    client.fetch_videos(
+                        keyword="가족",
+                        channel="",
+                        sort=SearchSortOption.RELEVANCE,
+                        period=SearchPeriodOption.LAST_7_DAYS,
+                        result_limit=50,
+                    )
+
+        self.assertEqual(breaker.state, CircuitState.HALF_OPEN)
+        self.assertIsNotNone(breaker.allow_request())
+
+    def test_fetch_videos_fails_fast_while_circuit_is_open(self) -> None:
+        breakers = {
+            YOUTUBE_SEARCH_URL: CircuitBreaker(failure_threshold=1, cooldown_seconds=60),
+        }
+
+        with patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}, clear=False):
+            client = YouTubeSearchClient(
+                circuit_breakers=breakers,
+                retry_policy=RetryPolicy(max_attempts=0),
+            )
+            with patch.object(
+                client,
+                "_call_youtube_api",
+                side_effect=SearchUpstreamUnavailableError(retryable=True),
+            ) as mocked_call:
+                for _ in range(3):
+                    with self.assertRaises(SearchUpstreamUnavailableError):
+                        client.fetch_videos(
+                            keyword="가족",
+                            channel="",
+                            sort=SearchSortOption.RELEVANCE,
+                            period=SearchPeriodOption.LAST_7_DAYS,
+                            result_limit=50,
+                        )
+
+        self.assertEqual(mocked_call.call_count, 1)
+
+    def test_fetch_videos_async_overlaps_detail_lookups_with_next_search_page(self) -> None:
+        events: list[tuple[str, str]] = []
+
+        def endpoint_name(url: str, params: dict[str, str]) -> str:
+            if url == YOUTUBE_SEARCH_URL:
+                return f"search:{params.get('pageToken', '0')}"
+            if url == YOUTUBE_VIDEOS_URL:
+                return f"videos:{params['id']}"
+            return f"channels:{params['id']}"
+
+        async def fake_async_call(url: str, params: dict[str, str]) -> dict:
+            name = endpoint_name(url, params)
+            events.append(("start", name))
+            await asyncio.sleep(0.01)
+            events.append(("end", name))
+            if url == YOUTUBE_SEARCH_URL:
+                page_index = int(params.get("pageToken", "0"))
+                response: dict = {
+                    "items": [{"id": {"videoId": f"video{page_index}"}, "snippet": {"channelId": f"channel{page_index}"}}]
+                }
+                if page_index == 0:
+                    response["nextPageToken"] = "1"
+                return response
+            if url == YOUTUBE_VIDEOS_URL:
+                video_id = params["id"]
+                return {
+                    "items": [
+                        {
+                            "id": video_id,
+                            "snippet": {
+                                "title": "가족 대화법",
+                                "channelId": video_id.replace("video", "channel"),
+                                "channelTitle": "연구소",
+                                "publishedAt": "2026-01-01T00:00:00Z",
+                            },
+                            "statistics": {"viewCount": "100"},
+                            "contentDetails": {"duration": "PT58S"},
+                        }
+                    ]
+                }
+            return {"items": [{"id": params["id"], "snippet": {"country": "KR"}, "statistics": {}}]}
+
+        with patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key", "YOUTUBE_SEARCH_MAX_RESULTS": "1"}, clear=False):
+            client = YouTubeSearchClient()
+            with patch.object(client, "_call_youtube_api_async", side_effect=fake_async_call):
+                rows = asyncio.run(
+                    client.fetch_videos_async(
+                        keyword="가족",
+                        channel="",
+                        sort=SearchSortOption.RELEVANCE,
+                        period=SearchPeriodOption.LAST_7_DAYS,
+                        result_limit=2,
+                    )
+                )
+
+        first_detail_starts = {events.index(("start", "videos:video0")), events.index(("start", "channels:channel0"))}
+        self.assertLess(max(first_detail_starts), events.index(("end", "videos:video0")))
+        self.assertLess(max(first_detail_starts), events.index(("end", "search:1")))
+        self.assertEqual([row.video_id for row in rows], ["video0", "video1"])
+        self.assertEqual([row.country_code for row in rows], ["KR", "KR"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import unittest
+from datetime import datetime, timezone
+
+from backend.app.domains.search.quota import ApiKeyScheduler
+
+
+class ApiKeySchedulerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # 2026-01-15 07:30 UTC == 2026-01-14 23:30 PST (태평양 자정 30분 전)
+        self.now = datetime(2026, 1, 15, 7, 30, tzinfo=timezone.utc)
+        self.scheduler = ApiKeyScheduler(daily_quota_units=300, clock=lambda: self.now)
+
+    def test_least_used_healthy_key_is_scheduled_first(self) -> None:
+        self.scheduler.record_usage("first-key", 100)
+
+        self.assertEqual(self.scheduler.order_keys(["first-key", "second-key"], cost=100), ["second-key", "first-key"])
+
+    def test_key_over_estimated_daily_quota_moves_to_the_back(self) -> None:
+        self.scheduler.record_usage("first-key", 250)
+        self.scheduler.record_usage("second-key", 260)
+
+        self.assertEqual(self.scheduler.order_keys(["first-key", "second-key"], cost=1), ["first-key", "second-key"])
+        self.assertEqual(self.scheduler.order_keys(["first-key", "second-key", "third-key"], cost=100)[0], "third-key")
+
+    def test_exhausted_key_returns_after_pacific_midnight(self) -> None:
+        self.scheduler.record_usage("first-key", 120)
+        self.scheduler.mark_exhausted("first-key")
+        self.assertEqual(self.scheduler.order_keys(["first-key", "second-key"], cost=1), ["second-key"])
+
+        self.now = datetime(2026, 1, 15, 8, 0, tzinfo=timezone.utc)
+
+        self.assertEqual(self.scheduler.order_keys(["first-key", "second-key"], cost=1), ["first-key", "second-key"])
+        self.assertEqual(self.scheduler.used_units("first-key"), 0)
+
+    def test_usage_from_past_quota_days_is_evicted(self) -> None:
+        self.scheduler.record_usage("yesterday-key", 100)
+        self.assertEqual(self.scheduler.tracked_key_count(), 1)
+
+        self.now = datetime(2026, 1, 15, 8, 0, tzinfo=timezone.utc)
+        self.scheduler.record_usage("today-key", 1)
+
+        self.assertEqual(self.scheduler.tracked_key_count(), 1)
+        self.assertEqual(self.scheduler.order_keys(["yesterday-key", "today-key"], cost=1), ["yesterday-key", "today-key"])
+
+
+if __name__ == "__main__":
+    unittest.main()
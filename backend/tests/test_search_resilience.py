@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import unittest
+
+from backend.app.domains.search.resilience import CircuitBreaker, CircuitState, RetryPolicy
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=10, max_cooldown_seconds=30, clock=self.clock)
+
+    def _open_breaker(self) -> None:
+        for _ in range(2):
+            self.breaker.record_failure(self.breaker.allow_request())
+
+    def test_opens_after_consecutive_failures_and_rejects_until_cooldown(self) -> None:
+        self.breaker.record_failure(self.breaker.allow_request())
+        self.assertIsNotNone(self.breaker.allow_request())
+        self.breaker.record_failure(self.breaker.allow_request())
+
+        self.assertEqual(self.breaker.state, CircuitState.OPEN)
+        self.assertIsNone(self.breaker.allow_request())
+
+        self.clock.now = 10.0
+        probe = self.breaker.allow_request()
+        self.assertIsNotNone(probe)
+        self.assertTrue(probe.is_probe)
+        self.assertEqual(self.breaker.state, CircuitState.HALF_OPEN)
+        self.assertIsNone(self.breaker.allow_request())
+
+    def test_half_open_probe_success_closes_circuit(self) -> None:
+        self._open_breaker()
+        self.clock.now = 10.0
+        probe = self.breaker.allow_request()
+
+        self.breaker.record_success(probe)
+
+        self.assertEqual(self.breaker.state, CircuitState.CLOSED)
+        self.assertIsNotNone(self.breaker.allow_request())
+
+    def test_half_open_probe_failure_doubles_cooldown(self) -> None:
+        self._open_breaker()
+        self.clock.now = 10.0
+        probe = self.breaker.allow_request()
+
+        self.breaker.record_failure(probe)
+
+        self.clock.now = 29.9
+        self.assertIsNone(self.breaker.allow_request())
+        self.clock.now = 30.0
+        self.assertIsNotNone(self.breaker.allow_request())
+
+    def test_released_probe_keeps_half_open_state(self) -> None:
+        self._open_breaker()
+        self.clock.now = 10.0
+        probe = self.breaker.allow_request()
+
+        self.breaker.release_probe(probe)
+
+        self.assertEqual(self.breaker.state, CircuitState.HALF_OPEN)
+        self.assertIsNotNone(self.breaker.allow_request())
+        self.assertIsNone(self.breaker.allow_request())
+
+    def test_straggler_failure_during_half_open_is_ignored(self) -> None:
+        # closed일 때 허락받은 호출이 half-open 시험 호출 도중에 실패로 돌아오는 경우
+        straggler = self.breaker.allow_request()
+        self._open_breaker()
+        self.clock.now = 10.0
+        probe = self.breaker.allow_request()
+
+        self.breaker.record_failure(straggler)
+        self.breaker.release_probe(straggler)
+
+        self.assertEqual(self.breaker.state, CircuitState.HALF_OPEN)
+        self.assertIsNone(self.breaker.allow_request())
+
+        self.breaker.record_success(probe)
+
+        self.assertEqual(self.breaker.state, CircuitState.CLOSED)
+
+        # 닫힌 뒤에 도착한 이전 세대의 실패도 연속 실패로 세지 않습니다.
+        self.breaker.record_failure(straggler)
+        self.breaker.record_failure(self.breaker.allow_request())
+        self.assertEqual(self.breaker.state, CircuitState.CLOSED)
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def test_delay_is_jittered_within_capped_exponential_ceiling(self) -> None:
+        policy = RetryPolicy(max_attempts=3, base_delay_seconds=0.5, max_delay_seconds=1.0)
+
+        for retry_index in range(4):
+            delay = policy.compute_delay(retry_index)
+            self.assertGreaterEqual(delay, 0.0)
+            self.assertLessEqual(delay, min(1.0, 0.5 * (2**retry_index)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+from backend.app.domains.search.client import (
+    SearchQuotaExceededError,
+    SearchUpstreamUnavailableError,
+    YouTubeSearchClient,
+    YoutubeVideoRaw,
+)
+from backend.app.domains.search.schemas import (
+    SearchCorePreset,
+    SearchDurationBucket,
+    SearchPeriodOption,
+    SearchResultFormat,
+    SearchScriptType,
+    SearchShortFormType,
+    SearchSortOption,
+    SearchTopicOption,
+)
+from backend.app.domains.search import service
+from backend.app.domains.search.service import (
+    _build_search_records,
+    _select_top_records,
+    search_videos,
+    search_videos_async,
+    search_videos_batch_async,
+    shared_query_cache,
+    shared_search_flights,
+    stream_search_videos_async,
+)
+
+
+def build_row(video_id: str, *, title: str = "가족 대화법", view_count: int = 1000, subscriber_count: int = 100) -> YoutubeVideoRaw:
+    return YoutubeVideoRaw(
+        video_id=video_id,
+        title=title,
+        channel_id=f"channel_{video_id}",
+        channel_name="연구소",
+        thumbnail_url="",
+        published_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        duration_seconds=58,
+        view_count=view_count,
+        like_count=10,
+        comment_count=1,
+        subscriber_count=subscriber_count,
+        is_subscriber_public=True,
+        country_code="KR",
+        channel_published_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        total_video_count=10,
+        channel_view_count=100000,
+    )
+
+
+def build_search_params(**overrides) -> dict:
+    params = {
+        "keyword": "가족",
+        "channel": "",
+        "sort": SearchSortOption.SUBSCRIBER_ASC,
+        "period": SearchPeriodOption.LAST_7_DAYS,
+        "topic": SearchTopicOption.ALL,
+        "result_limit": 50,
+        "min_views": 0,
+        "country": "",
+        "max_subscribers": 0,
+        "subscriber_public_only": False,
+        "duration_bucket": SearchDurationBucket.ALL,
+        "short_form_type": SearchShortFormType.ALL,
+        "script_type": SearchScriptType.ALL,
+        "min_performance": 0,
+        "core_preset": SearchCorePreset.NONE,
+    }
+    params.update(overrides)
+    return params
+
+
+class SearchServiceTest(unittest.TestCase):
+    def setUp(self) -> None:
+        shared_query_cache.clear()
+
+    def test_filter_and_sort_changes_reuse_cached_upstream_rows(self) -> None:
+        rows = [build_row("video001", view_count=500), build_row("video002", view_count=5000)]
+
+        with patch.object(YouTubeSearchClient, "fetch_videos_async", new=AsyncMock(return_value=rows)) as mocked_fetch:
+            all_records = search_videos(**build_search_params())
+            filtered_records = search_videos(**build_search_params(min_views=1000, sort=SearchSortOption.PERFORMANCE_ONLY))
+
+        self.assertEqual(mocked_fetch.await_count, 1)
+        self.assertEqual(len(all_records), 2)
+        self.assertEqual([record.video_id for record in filtered_records], ["video002"])
+
+    def test_upstream_relevant_changes_fetch_again(self) -> None:
+        rows = [build_row("video001")]
+
+        with patch.object(YouTubeSearchClient, "fetch_videos_async", new=AsyncMock(return_value=rows)) as mocked_fetch:
+            search_videos(**build_search_params())
+            search_videos(**build_search_params(period=SearchPeriodOption.LAST_30_DAYS))
+            search_videos(**build_search_params(sort=SearchSortOption.VIEWS))
+
+        self.assertEqual(mocked_fetch.await_count, 3)
+
+    def test_concurrent_identical_searches_share_one_upstream_fetch(self) -> None:
+        rows = [build_row("video001")]
+
+        async def slow_fetch(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return rows
+
+        async def run_concurrently() -> list:
+            return await asyncio.gather(*(search_videos_async(**build_search_params()) for _ in range(5)))
+
+        with patch.object(YouTubeSearchClient, "fetch_videos_async", new=AsyncMock(side_effect=slow_fetch)) as mocked_fetch:
+            results = asyncio.run(run_concurrently())
+
+        self.assertEqual(mocked_fetch.await_count, 1)
+        self.assertTrue(all([record.video_id for record in result] == ["video001"] for result in results))
+        self.assertEqual(shared_search_flights.inflight_count(), 0)
+
+    def test_concurrent_identical_searches_share_upstream_error(self) -> None:
+        async def failing_fetch(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            raise SearchUpstreamUnavailableError()
+
+        async def run_concurrently() -> list:
+            return await asyncio.gather(
+                *(search_videos_async(**build_search_params()) for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        with patch.object(YouTubeSearchClient, "fetch_videos_async", new=AsyncMock(side_effect=failing_fetch)) as mocked_fetch:
+            results = asyncio.run(run_concurrently())
+
+        self.assertEqual(mocked_fetch.await_count, 1)
+        self.assertTrue(all(isinstance(result, SearchUpstreamUnavailableError) for result in results))
+        self.assertEqual(shared_search_flights.inflight_count(), 0)
+
+    def test_concurrent_searches_with_different_key_sets_do_not_share_failures(self) -> None:
+        rows = [build_row("video001")]
+
+        async def fetch_with_keys(*args, api_keys, **kwargs):
+            await asyncio.sleep(0.01)
+            if api_keys == ["exhausted-key"]:
+                raise SearchQuotaExceededError()
+            return rows
+
+        async def run_concurrently() -> list:
+            return await asyncio.gather(
+                search_videos_async(**build_search_params(user_api_keys=["exhausted-key"])),
+                search_videos_async(**build_search_params(user_api_keys=["valid-key"])),
+                return_exceptions=True,
+            )
+
+        with patch.object(YouTubeSearchClient, "fetch_videos_async", new=AsyncMock(side_effect=fetch_with_keys)) as mocked_fetch:
+            exhausted_result, valid_result = asyncio.run(run_concurrently())
+
+        self.assertEqual(mocked_fetch.await_count, 2)
+        self.assertIsInstance(exhausted_result, SearchQuotaExceededError)
+        self.assertEqual([record.video_id for record in valid_result], ["video001"])
+        self.assertEqual(shared_search_flights.inflight_count(), 0)
+
+    def test_stale_rows_are_served_when_upstream_is_unavailable(self) -> None:
+        rows = [build_row("video001")]
+        query_key = YouTubeSearchClient().build_query_key(
+            keyword="가족",
+            channel="",
+            sort=SearchSortOption.SUBSCRIBER_ASC,
+            period=SearchPeriodOption.LAST_7_DAYS,
+            result_limit=50,
+        )
+        shared_query_cache.set(query_key, tuple(rows), ttl_seconds=-1)
+
+        with patch.object(
+            YouTubeSearchClient,
+            "fetch_videos_async",
+            new=AsyncMock(side_effect=SearchUpstreamUnavailableError(message="youtube circuit open")),
+        ) as mocked_fetch:
+            records = search_videos(**build_search_params())
+
+        self.assertEqual(mocked_fetch.await_count, 1)
+        self.assertEqual([record.video_id for record in records], ["video001"])
+
+    def test_exposure_is_scored_only_for_rows_passing_earlier_filters(self) -> None:
+        rows = [
+            build_row("video001", view_count=10, subscriber_count=1_000_000),
+            build_row("video002", view_count=500_000, subscriber_count=100),
+            build_row("video003", view_count=900_000, subscriber_count=100),
+        ]
+        params = build_search_params(min_views=100, min_performance=50)
+        params.pop("channel")
+        params.pop("period")
+
+        with patch.object(service, "compute_exposure_columns", wraps=service.compute_exposure_columns) as mocked_exposure:
+            records = _build_search_records(rows, **params)
+
+        self.assertEqual(mocked_exposure.call_count, 1)
+        self.assertEqual(mocked_exposure.call_args.kwargs["titles"], ["가족 대화법", "가족 대화법"])
+        self.assertEqual({record.video_id for record in records}, {"video002", "video003"})
+
+    def test_scripted_filter_short_circuits_before_scoring(self) -> None:
+        params = build_search_params(script_type=SearchScriptType.SCRIPTED)
+        params.pop("channel")
+        params.pop("period")
+
+        with patch.object(service, "compute_performance_columns") as mocked_performance:
+            records = _build_search_records([build_row("video001")], **params)
+
+        self.assertEqual(records, [])
+        mocked_performance.assert_not_called()
+
+    def test_top_k_selection_matches_full_sort_with_ties(self) -> None:
+        rng = random.Random(3)
+        rows = [
+            build_row(
+                f"video{index:03d}",
+                view_count=rng.choice([100, 1000, 50_000]),
+                subscriber_count=rng.choice([100, 5000]),
+            )
+            for index in range(60)
+        ]
+        params = build_search_params(sort=SearchSortOption.RELEVANCE, result_limit=1000)
+        params.pop("channel")
+        params.pop("period")
+        records = _build_search_records(rows, **params)
+
+        def reference_sort(sort: SearchSortOption) -> list:
+            if sort == SearchSortOption.SUBSCRIBER_ASC:
+                return sorted(records, key=lambda r: (r.subscriber_count, -r.view_count, -r.published_at.timestamp()))
+            if sort == SearchSortOption.VIEWS:
+                return sorted(records, key=lambda r: (r.view_count, r.published_at), reverse=True)
+            if sort == SearchSortOption.LATEST:
+                return sorted(records, key=lambda r: r.published_at, reverse=True)
+            if sort == SearchSortOption.PERFORMANCE_ONLY:
+                return sorted(records, key=lambda r: (r.performance_score, r.published_at), reverse=True)
+            if sort == SearchSortOption.OPPORTUNITY_ONLY:
+                return sorted(records, key=lambda r: (r.exposure_score, r.published_at), reverse=True)
+            if sort == SearchSortOption.RECOMMENDED:
+                def normalize(values: list[float]) -> list[float]:
+                    low, high = min(values), max(values)
+                    if low == high:
+                        return [100.0] * len(values)
+                    return [((value - low) / (high - low)) * 100.0 for value in values]
+
+                performance = normalize([r.performance_score for r in records])
+                exposure = normalize([r.exposure_score for r in records])
+                hot = {id(r): (0.45 * p) + (0.55 * e) for r, p, e in zip(records, performance, exposure)}
+                return sorted(records, key=lambda r: (hot[id(r)], r.published_at), reverse=True)
+            return records
+
+        for sort in SearchSortOption:
+            for limit in (1, 7, 60, 250):
+                expected = [record.video_id for record in reference_sort(sort)[:limit]]
+                actual = [record.video_id for record in _select_top_records(records, sort, limit)]
+                self.assertEqual(actual, expected, (sort, limit))
+
+    def test_display_texts_are_built_only_for_returned_rows(self) -> None:
+        rows = [build_row(f"video{index:03d}", view_count=1000 * (index + 1)) for index in range(5)]
+        params = build_search_params(sort=SearchSortOption.VIEWS, result_limit=2)
+        params.pop("channel")
+        params.pop("period")
+
+        with patch.object(service, "_apply_display_texts", wraps=service._apply_display_texts) as mocked_format:
+            records = _build_search_records(rows, **params)
+
+        self.assertEqual([record.video_id for record in records], ["video004", "video003"])
+        self.assertEqual(mocked_format.call_count, 2)
+        self.assertEqual(records[0].view_count_text, "5,000")
+        self.assertEqual(records[0].keyword_matched_terms, ["가족"])
+
+    def test_raw_format_skips_display_texts(self) -> None:
+        params = build_search_params(result_format=SearchResultFormat.RAW)
+        params.pop("channel")
+        params.pop("period")
+
+        records = _build_search_records([build_row("video001")], **params)
+
+        self.assertEqual(records[0].view_count_text, "")
+        self.assertEqual(records[0].recommendation_reason, "")
+        self.assertEqual(records[0].keyword_matched_terms, ["가족"])
+
+    def test_sparse_fields_skip_unrequested_scores_and_texts(self) -> None:
+        params = build_search_params(sort=SearchSortOption.VIEWS, fields=frozenset({"video_id", "view_count_text"}))
+        params.pop("channel")
+        params.pop("period")
+
+        with patch.object(service, "compute_exposure_columns") as mocked_exposure:
+            records = _build_search_records([build_row("video001")], **params)
+
+        mocked_exposure.assert_not_called()
+        self.assertEqual(records[0].view_count_text, "1,000")
+        self.assertEqual(records[0].recommendation_reason, "")
+        self.assertEqual(records[0].keyword_matched_terms, [])
+
+    def test_batch_search_merges_and_dedupes_results_across_keywords(self) -> None:
+        rows_by_keyword = {
+            "가족": [build_row("video001", title="가족 여행"), build_row("video002", title="가족 대화법")],
+            "대화": [build_row("video002", title="가족 대화법"), build_row("video003", title="대화 기술")],
+        }
+
+        async def fake_batch_fetch(*, queries, **kwargs):
+            return [rows_by_keyword[keyword] for keyword, _ in queries]
+
+        params = build_search_params(sort=SearchSortOption.VIEWS)
+        params.pop("keyword")
+        params.pop("channel")
+        with patch.object(
+            YouTubeSearchClient,
+            "fetch_videos_batch_async",
+            new=AsyncMock(side_effect=fake_batch_fetch),
+        ) as mocked_batch_fetch:
+            records = asyncio.run(search_videos_batch_async(keywords=["가족", "대화", "가족"], channels=[], **params))
+
+        self.assertEqual(mocked_batch_fetch.await_count, 1)
+        self.assertEqual(mocked_batch_fetch.call_args.kwargs["queries"], [("가족", ""), ("대화", "")])
+        by_id = {record.video_id: record for record in records}
+        self.assertEqual(sorted(by_id), ["video001", "video002", "video003"])
+        self.assertEqual(by_id["video002"].matched_queries, ["가족", "대화"])
+        self.assertEqual(by_id["video002"].keyword_matched_terms, ["가족", "대화"])
+        self.assertEqual(by_id["video003"].keyword_matched_terms, ["대화"])
+
+        # 검색별 원본 행은 단건 검색과 같은 캐시에 저장됩니다.
+        with patch.object(YouTubeSearchClient, "fetch_videos_async", new=AsyncMock()) as mocked_fetch:
+            single_records = search_videos(**build_search_params(keyword="대화", sort=SearchSortOption.VIEWS))
+        mocked_fetch.assert_not_awaited()
+        self.assertEqual(sorted(record.video_id for record in single_records), ["video002", "video003"])
+
+    def test_stream_search_emits_rows_per_page_then_sorted_order(self) -> None:
+        pages = [
+            [build_row("video001", subscriber_count=300), build_row("video002", subscriber_count=100)],
+            [build_row("video003", subscriber_count=200, view_count=10)],
+        ]
+
+        async def fake_pages(_client, **_kwargs):
+            for page in pages:
+                yield page
+
+        async def collect(**overrides):
+            return [event async for event in stream_search_videos_async(**build_search_params(**overrides))]
+
+        with patch.object(YouTubeSearchClient, "iter_video_pages_async", new=fake_pages):
+            events = asyncio.run(collect(min_views=100, result_limit=1))
+
+        self.assertEqual(
+            [(event.kind, [record.video_id for record in event.records]) for event in events],
+            [("rows", ["video002", "video001"]), ("done", ["video002"])],
+        )
+
+        # 끝까지 받은 원본 행은 query cache에 남아 같은 검색은 rows 이벤트 한 번으로 끝납니다.
+        with patch.object(YouTubeSearchClient, "iter_video_pages_async") as mocked_pages:
+            cached_events = asyncio.run(collect(result_limit=1))
+        mocked_pages.assert_not_called()
+        self.assertEqual(
+            [(event.kind, [record.video_id for record in event.records]) for event in cached_events],
+            [("rows", ["video002", "video003", "video001"]), ("done", ["video002"])],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
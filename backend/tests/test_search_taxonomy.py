@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import random
+import unittest
+
+from backend.app.domains.search.taxonomy import (
+    TITLE_CATEGORY_KEYWORDS,
+    AhoCorasickMatcher,
+    classify_title,
+)
+
+
+class TitleTaxonomyTest(unittest.TestCase):
+    def test_classify_title_matches_substring_scan(self) -> None:
+        rng = random.Random(13)
+        vocabulary = [word for words in TITLE_CATEGORY_KEYWORDS.values() for word in words]
+        vocabulary += ["가족", "대화", "K-POP", "ASMR", "브이로그", "게", "1", "분", " "]
+        for _ in range(500):
+            title = "".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 6)))
+            lowered = title.lower()
+            expected = frozenset(
+                label for label, words in TITLE_CATEGORY_KEYWORDS.items() if any(word in lowered for word in words)
+            )
+            self.assertEqual(classify_title(title), expected, title)
+
+    def test_matcher_finds_overlapping_patterns(self) -> None:
+        matcher = AhoCorasickMatcher({"a": ("he", "hers"), "b": ("she",), "c": ("his",)})
+        self.assertEqual(matcher.labels("ushers"), frozenset({"a", "b"}))
+        self.assertEqual(matcher.labels("ahishe"), frozenset({"a", "b", "c"}))
+        self.assertEqual(matcher.labels("xyz"), frozenset())
+
+
+if __name__ == "__main__":
+    unittest.main()
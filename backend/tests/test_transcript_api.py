@@ -6,7 +6,7 @@ from unittest.mock import patch
 from fastapi.testclient import TestClient
 
 from backend.app.main import app
-from backend.app.domains.search.transcript import TranscriptResult, TranscriptSegment
+from backend.app.domains.search.transcript import TranscriptResult, TranscriptSegment, TranscriptUnavailableError
 
 
 class TranscriptApiContractTest(unittest.TestCase):
@@ -31,6 +31,30 @@ class TranscriptApiContractTest(unittest.TestCase):
         self.assertEqual(body["data"]["videoId"], "abc123xyz")
         self.assertIn("transcriptText", body["data"])
 
+    def test_get_video_transcript_returns_not_modified_for_matching_etag(self) -> None:
+        with patch("backend.app.domains.search.router.extract_transcript_from_video") as mocked_extract:
+            mocked_extract.return_value = TranscriptResult(
+                title="테스트 영상",
+                transcript_text="첫 줄 " * 400,
+                language="ko",
+                source="subtitle",
+                segments=[TranscriptSegment(text="첫 줄", start=float(index), duration=1.0) for index in range(200)],
+            )
+            first = self.client.get("/api/search/transcript", params={"videoId": "abc123xyz"})
+            second = self.client.get(
+                "/api/search/transcript",
+                params={"videoId": "abc123xyz"},
+                headers={"If-None-Match": first.headers["etag"]},
+            )
+
+        # 큰 본문은 압축되고, ETag는 압축본 기준(-gzip)으로 내려가도 조건부 요청에 그대로 쓸 수 있습니다.
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.headers["content-encoding"], "gzip")
+        self.assertTrue(first.headers["etag"].endswith('-gzip"'))
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.content, b"")
+        self.assertEqual(second.headers["etag"], first.headers["etag"])
+
     def test_get_video_transcript_returns_error_when_target_missing(self) -> None:
         response = self.client.get("/api/search/transcript")
 
@@ -126,6 +150,14 @@ class TranscriptApiContractTest(unittest.TestCase):
         self.assertFalse(body["success"])
         self.assertEqual(body["error"]["code"], "TRANSCRIPT_NOT_FOUND")
 
+    def test_get_video_transcript_maps_cached_miss_to_not_found(self) -> None:
+        with patch("backend.app.domains.search.router.extract_transcript_from_video") as mocked_extract:
+            mocked_extract.side_effect = TranscriptUnavailableError("not_found")
+            response = self.client.get("/api/search/transcript", params={"videoId": "abc123xyz"})
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()["error"]["code"], "TRANSCRIPT_NOT_FOUND")
+
     def test_transcript_health_contract(self) -> None:
         response = self.client.get("/api/search/transcript/health")
 
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from backend.app.domains.search import transcript
+from backend.app.domains.search.transcript import RequestBlocked, TranscriptApiPool
+
+PROXY_ENV = {"WEBSHARE_USERNAME": "user", "WEBSHARE_PASSWORD": "secret", "TRANSCRIPT_PROXY_KEEP_ALIVE": "1"}
+
+
+class TranscriptApiPoolTest(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = patch.object(transcript, "Session", side_effect=lambda: MagicMock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_sequential_leases_reuse_one_instance(self) -> None:
+        pool = TranscriptApiPool(max_idle=2)
+        with patch.dict(os.environ, PROXY_ENV), patch.object(
+            transcript, "_build_transcript_api", side_effect=lambda settings, http_client: MagicMock()
+        ) as mocked_build:
+            with pool.lease() as first:
+                pass
+            with pool.lease() as second:
+                pass
+
+        self.assertIs(second, first)
+        self.assertEqual(mocked_build.call_count, 1)
+        first.http_client.close.assert_not_called()
+
+    def test_concurrent_leases_get_separate_instances(self) -> None:
+        pool = TranscriptApiPool(max_idle=1)
+        with patch.dict(os.environ, PROXY_ENV), patch.object(
+            transcript, "_build_transcript_api", side_effect=lambda settings, http_client: MagicMock()
+        ):
+            with pool.lease() as first, pool.lease() as second:
+                self.assertIsNot(second, first)
+
+        # max_idle을 넘는 인스턴스는 반납 시 닫습니다.
+        first.http_client.close.assert_called_once()
+        second.http_client.close.assert_not_called()
+
+    def test_proxy_change_rebuilds_and_closes_stale_instances(self) -> None:
+        pool = TranscriptApiPool(max_idle=2)
+        with patch.object(transcript, "_build_transcript_api", side_effect=lambda settings, http_client: MagicMock()):
+            with patch.dict(os.environ, PROXY_ENV):
+                with pool.lease() as first:
+                    pass
+            with patch.dict(os.environ, {**PROXY_ENV, "WEBSHARE_PASSWORD": "rotated"}):
+                with pool.lease() as second:
+                    pass
+
+        self.assertIsNot(second, first)
+        self.assertEqual(second.settings.password, "rotated")
+        first.http_client.close.assert_called_once()
+
+    def test_blocked_request_retries_on_fresh_proxy_connection(self) -> None:
+        transcript_api = MagicMock()
+        transcript_api.fetch.side_effect = [RequestBlocked("abc123xyz00"), "fetched"]
+        pool = TranscriptApiPool(max_idle=1)
+        with patch.dict(os.environ, PROXY_ENV), patch.object(
+            transcript, "_build_transcript_api", return_value=transcript_api
+        ):
+            with pool.lease() as pooled:
+                self.assertEqual(pooled.fetch("abc123xyz00", ["ko"]), "fetched")
+
+        self.assertEqual(transcript_api.fetch.call_count, 2)
+        pooled.http_client.close.assert_called_once()
+
+    def test_blocked_request_is_not_retried_without_keep_alive(self) -> None:
+        transcript_api = MagicMock()
+        transcript_api.fetch.side_effect = RequestBlocked("abc123xyz00")
+        pool = TranscriptApiPool(max_idle=1)
+        with patch.dict(os.environ, {**PROXY_ENV, "TRANSCRIPT_PROXY_KEEP_ALIVE": "0"}), patch.object(
+            transcript, "_build_transcript_api", return_value=transcript_api
+        ):
+            with pool.lease() as pooled:
+                with self.assertRaises(RequestBlocked):
+                    pooled.fetch("abc123xyz00", ["ko"])
+
+        self.assertEqual(transcript_api.fetch.call_count, 1)
+
+
+class BuildTranscriptApiTest(unittest.TestCase):
+    def test_keep_alive_drops_connection_close_and_library_retries(self) -> None:
+        settings = transcript.TranscriptProxySettings(username="user", password="secret", keep_alive=True)
+        http_client = transcript.Session()
+        transcript._build_transcript_api(settings, http_client)
+
+        self.assertNotIn("Connection", http_client.headers)
+        self.assertIn("user", http_client.proxies["https"])
+        self.assertEqual(http_client.get_adapter("https://www.youtube.com").max_retries.total, 0)
+
+    def test_without_keep_alive_keeps_library_defaults(self) -> None:
+        settings = transcript.TranscriptProxySettings(username="user", password="secret", keep_alive=False)
+        http_client = transcript.Session()
+        transcript._build_transcript_api(settings, http_client)
+
+        self.assertEqual(http_client.headers["Connection"], "close")
+        self.assertEqual(
+            http_client.get_adapter("https://www.youtube.com").max_retries.total,
+            transcript.DEFAULT_TRANSCRIPT_PROXY_BLOCKED_RETRIES,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
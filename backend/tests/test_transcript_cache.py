@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import os
+import stat
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from backend.app.domains.search import transcript, transcript_cache
+from backend.app.domains.search.cache import TtlLruCache
+from backend.app.domains.search.transcript import (
+    TranscriptsDisabled,
+    TranscriptUnavailableError,
+    extract_transcript_from_video,
+)
+from backend.app.domains.search.transcript_cache import (
+    DEFAULT_TRANSCRIPT_CACHE_DB_PATH,
+    CachedTranscript,
+    SqliteTranscriptStore,
+    TranscriptCache,
+    build_transcript_cache_key,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def build_cache(path: str | None, clock: FakeClock | None = None) -> TranscriptCache:
+    clock = clock or FakeClock()
+    return TranscriptCache(
+        memory=TtlLruCache(ttl_seconds=100, max_entries=10, clock=clock),
+        store=SqliteTranscriptStore(path, clock=clock) if path else None,
+        ttl_seconds=100,
+        negative_ttl_seconds=10,
+    )
+
+
+def build_fetched_transcript(text: str = "첫 줄") -> MagicMock:
+    fetched = MagicMock()
+    fetched.to_raw_data.return_value = [{"text": text, "start": 0.0, "duration": 1.5}]
+    fetched.language_code = "ko"
+    return fetched
+
+
+class TranscriptCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "transcripts.sqlite3")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_disk_tier_survives_a_fresh_memory_tier(self) -> None:
+        payload = {"title": "video", "transcript_text": "안녕", "language": "ko", "source": "x", "segments": []}
+        build_cache(self.path).set("abc|ko", CachedTranscript(status="ok", payload=payload))
+
+        restarted = build_cache(self.path)
+        self.assertEqual(restarted.get("abc|ko"), CachedTranscript(status="ok", payload=payload))
+
+    def test_negative_entries_expire_before_positive_entries(self) -> None:
+        clock = FakeClock()
+        cache = build_cache(self.path, clock)
+        cache.set("found|ko", CachedTranscript(status="ok", payload={"segments": []}))
+        cache.set("missing|ko", CachedTranscript(status="not_found"))
+
+        clock.now += 11
+        self.assertIsNone(cache.get("missing|ko"))
+        self.assertIsNotNone(cache.get("found|ko"))
+        cache.clear_memory()
+        self.assertIsNone(cache.get("missing|ko"))
+        self.assertIsNotNone(cache.get("found|ko"))
+
+    def test_store_file_is_private_to_the_owner(self) -> None:
+        path = os.path.join(self.directory.name, "nested", "transcripts.sqlite3")
+        build_cache(path).set("abc|ko", CachedTranscript(status="not_found"))
+
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o600)
+        self.assertEqual(stat.S_IMODE(os.stat(os.path.dirname(path)).st_mode), 0o700)
+
+    def test_default_store_path_uses_the_user_data_directory(self) -> None:
+        with patch.dict(os.environ, {"XDG_DATA_HOME": self.directory.name}):
+            self.assertEqual(
+                transcript_cache._default_data_dir(),
+                os.path.join(self.directory.name, "yt_search"),
+            )
+        self.assertFalse(DEFAULT_TRANSCRIPT_CACHE_DB_PATH.startswith(tempfile.gettempdir()))
+
+    def test_cache_key_includes_language_priority(self) -> None:
+        self.assertNotEqual(build_transcript_cache_key("abc", ["ko", "en"]), build_transcript_cache_key("abc", ["en", "ko"]))
+        self.assertEqual(build_transcript_cache_key("abc", ["KO"]), build_transcript_cache_key("abc", ["ko"]))
+
+
+class ExtractTranscriptCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        for name, value in (
+            ("shared_transcript_cache", build_cache(None)),
+            ("shared_transcript_api_pool", transcript.TranscriptApiPool(max_idle=1)),
+        ):
+            patcher = patch.object(transcript, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_repeated_extract_reuses_cached_transcript(self) -> None:
+        transcript_api = MagicMock()
+        transcript_api.fetch.return_value = build_fetched_transcript()
+        with patch.object(transcript, "_build_transcript_api", return_value=transcript_api) as mocked_build:
+            first = extract_transcript_from_video("abc123xyz00", ["ko", "en"])
+            second = extract_transcript_from_video("https://youtu.be/abc123xyz00", ["ko", "en"])
+
+        self.assertEqual(transcript_api.fetch.call_count, 1)
+        self.assertEqual(mocked_build.call_count, 1)
+        self.assertEqual(second, first)
+        self.assertEqual(second.segments[0].duration, 1.5)
+
+    def test_priority_lists_that_pick_the_same_language_share_one_payload(self) -> None:
+        transcript_api = MagicMock()
+        transcript_api.fetch.return_value = build_fetched_transcript()
+        with patch.object(transcript, "_build_transcript_api", return_value=transcript_api):
+            first = extract_transcript_from_video("abc123xyz00", ["ko", "en"])
+            second = extract_transcript_from_video("abc123xyz00", ["ko"])
+            again = extract_transcript_from_video("abc123xyz00", ["ko", "en"])
+
+        cache = transcript.shared_transcript_cache
+        self.assertEqual(cache.get("abc123xyz00|ko,en"), CachedTranscript(status="ok", language="ko"))
+        self.assertEqual(cache.get("abc123xyz00|ko"), CachedTranscript(status="ok", language="ko"))
+        self.assertEqual(cache.get("abc123xyz00@ko").payload["transcript_text"], "첫 줄")
+        self.assertEqual(transcript_api.fetch.call_count, 2)
+        self.assertEqual(first, second)
+        self.assertEqual(again, first)
+
+    def test_missing_transcript_is_negatively_cached(self) -> None:
+        transcript_api = MagicMock()
+        transcript_api.fetch.side_effect = TranscriptsDisabled("abc123xyz00")
+        with patch.object(transcript, "_build_transcript_api", return_value=transcript_api):
+            with self.assertRaises(TranscriptsDisabled):
+                extract_transcript_from_video("abc123xyz00", ["ko"])
+            with self.assertRaises(TranscriptUnavailableError):
+                extract_transcript_from_video("abc123xyz00", ["ko"])
+
+        self.assertEqual(transcript_api.fetch.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()